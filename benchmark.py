@@ -0,0 +1,133 @@
+"""
+Mediciones de rendimiento que no dependen de una instancia en particular.
+    arranque: tiempo de arranque de cada subcomando de principal.py y del
+              import de cada módulo, en un proceso nuevo (mediana de varias
+              corridas)
+    maestro:  generación de columnas con cada implementación del LP maestro
+              (maestro_lp): tiempo en el LP por iteración y costo de agregar
+              columnas
+    generadores: tiempo de generar G(n, p) y grafos plantados de 1k a 20k
+              vértices (generadores.py) y de escribirlos en .col.b
+"""
+import argparse
+import contextlib
+import io
+import statistics
+import subprocess
+import sys
+import time
+
+MODULOS = ["dimacs", "grafos", "coloreo_heuristico", "modelos", "coloreo", "clique_max",
+           "conjunto_independiente_max", "coloreoCG", "verificacion", "busqueda_tabu", "portafolio", "principal"]
+
+def medirProceso(comando, repeticiones):
+    """Mediana (s) del tiempo de pared de ejecutar comando en un proceso nuevo."""
+    tiempos = []
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        subprocess.run(comando, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        tiempos.append(time.perf_counter() - inicio)
+    return statistics.median(tiempos)
+
+def benchmarkArranque(instancia, repeticiones):
+    base = medirProceso([sys.executable, "-c", "pass"], repeticiones)
+    print(f"{'python -c pass':40s} {base * 1000:8.1f} ms")
+
+    for modulo in MODULOS:
+        t = medirProceso([sys.executable, "-c", f"import {modulo}"], repeticiones)
+        scip = subprocess.run([sys.executable, "-c", f"import {modulo}, sys; sys.exit('pyscipopt' in sys.modules)"],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL).returncode == 1
+        print(f"{'import ' + modulo:40s} {t * 1000:8.1f} ms{'  (carga pyscipopt)' if scip else ''}")
+
+    for subcomando in (["estadisticas", instancia], ["heuristicas", instancia, "--tiempo", "0.1"]):
+        t = medirProceso([sys.executable, "principal.py"] + subcomando, repeticiones)
+        print(f"{'principal.py ' + subcomando[0]:40s} {t * 1000:8.1f} ms")
+
+# Iteraciones de generación de columnas por corrida del benchmark del maestro
+ITERACIONES_MAESTRO = 100
+
+def benchmarkMaestro(instancia, repeticiones):
+    from dimacs import leerGrafo
+    from coloreoCG import GraphColoringCG
+    from maestro_lp import MAESTROS, crearMaestro
+
+    n, aristas = leerGrafo(instancia)
+    adj = {v: set() for v in range(1, n + 1)}
+    for u, v in aristas:
+        if u != v:
+            adj[u + 1].add(v + 1)
+            adj[v + 1].add(u + 1)
+
+    for nombre in MAESTROS:
+        try:
+            crearMaestro(nombre)
+        except ImportError as e:
+            print(f"{nombre:10s} no disponible ({e})")
+            continue
+
+        # Agregar columnas singleton y 1000 columnas sin resolver
+        maestro = crearMaestro(nombre)
+        for v in adj:
+            maestro.agregarFila(v, ("s", v))
+        inicio = time.perf_counter()
+        for i in range(1000):
+            maestro.agregarColumna(i, (i % n + 1,))
+        agregar = (time.perf_counter() - inicio) / 1000
+
+        # Pricing solo heurístico para que el tiempo del pricing sea el mismo
+        tiempos, maestros, valores = [], [], []
+        for _ in range(repeticiones):
+            inicio = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                cg = GraphColoringCG({v: set(vecinos) for v, vecinos in adj.items()}, maestro=nombre,
+                                     pricing_exacto=False)
+                valores.append(cg.solve(max_iter=ITERACIONES_MAESTRO))
+            tiempos.append(time.perf_counter() - inicio)
+            maestros.append(cg.tiempo_maestro)
+        print(f"{nombre:10s} LP {valores[0]:.4f}  total {statistics.median(tiempos):7.2f} s  "
+              f"maestro {statistics.median(maestros):7.2f} s "
+              f"({statistics.median(maestros) / ITERACIONES_MAESTRO * 1000:.1f} ms/iter)  "
+              f"agregar columna {agregar * 1e6:.1f} us")
+
+# (n, p) de los grafos del benchmark de generadores
+TAMANIOS_GENERADORES = [(1000, 0.5), (5000, 0.1), (20000, 0.01)]
+
+def benchmarkGeneradores(instancia, repeticiones):
+    import os
+    import tempfile
+    from generadores import grafoAleatorio, grafoPlano, escribirGrafo
+
+    for n, p in TAMANIOS_GENERADORES:
+        for nombre, generar in (("aleatorio", lambda s: grafoAleatorio(n, p, s)),
+                                ("plano k=20", lambda s: grafoPlano(n, 20, p, s)[:2])):
+            tiempos = []
+            for semilla in range(repeticiones):
+                inicio = time.perf_counter()
+                n_grafo, aristas = generar(semilla)
+                tiempos.append(time.perf_counter() - inicio)
+            with tempfile.TemporaryDirectory() as directorio:
+                inicio = time.perf_counter()
+                escribirGrafo(os.path.join(directorio, "g.col.b"), n_grafo, aristas)
+                escritura = time.perf_counter() - inicio
+            print(f"{nombre:12s} n={n:6d} p={p:<5} m={len(aristas):9d}  "
+                  f"generar {statistics.median(tiempos):6.2f} s  escribir .col.b {escritura:6.2f} s")
+
+BENCHMARKS = {
+    "arranque": benchmarkArranque,
+    "maestro": benchmarkMaestro,
+    "generadores": benchmarkGeneradores,
+}
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmarks de rendimiento")
+    parser.add_argument("benchmarks", nargs="*", default=sorted(BENCHMARKS), help="Benchmarks a correr")
+    parser.add_argument("--instancia", default="DSJC125.1.col.b", help="Instancia usada por los subcomandos")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    args = parser.parse_args()
+
+    for nombre in args.benchmarks:
+        print(f"== {nombre} ==")
+        BENCHMARKS[nombre](args.instancia, args.repeticiones)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,283 @@
+"""
+Búsqueda tabú para k-coloreo (cota superior rápida para los motores exactos).
+    tabucol     coloreo completo con k colores que minimiza las aristas
+                monocromáticas; un movimiento cambia el color de un vértice
+                en conflicto
+    partialcol  coloreo parcial propio con k colores que minimiza los
+                vértices sin color; un movimiento colorea un vértice y
+                descolorea a sus vecinos de ese color
+Las dos mantienen la tabla gamma[v][c] = vecinos de v con color c, así que
+evaluar un movimiento cuesta O(1) y aplicarlo O(grado). La tenencia tabú es
+aleatoria en [0, 10) más 0.6 por la cantidad de vértices en conflicto (o sin
+color). coloreoTabu parte de DSATUR/RLF y baja k de a uno mientras encuentre
+un coloreo dentro del tiempo límite.
+"""
+import argparse
+import random
+import time
+
+from coloreo_heuristico import coloreoDSATUR, coloreoRLF, cantidadColores
+
+METODOS = ("tabucol", "partialcol")
+
+# Tenencia tabú: aleatoria en [0, TENENCIA_BASE) + TENENCIA_FACTOR * conflictos
+TENENCIA_BASE = 10
+TENENCIA_FACTOR = 0.6
+
+# Cada cuántas iteraciones se revisa el tiempo límite
+CONTROL_TIEMPO = 256
+
+def tablaGamma(n, vecinos, colores, k):
+    """gamma[v][c] = cantidad de vecinos de v con color c (se ignoran los sin color)."""
+    gamma = [[0] * k for _ in range(n)]
+    for v in range(n):
+        c = colores[v]
+        if c >= 0:
+            for u in vecinos[v]:
+                gamma[u][c] += 1
+    return gamma
+
+def tabuCol(n, adj, k, tiempo_limite=None, semilla=0, inicial=None, max_iter=None):
+    """
+    Busca un k-coloreo propio minimizando las aristas monocromáticas.
+    :param adj: Lista de sets de vecinos (vértices 0..n-1)
+    :param inicial: Coloreo de partida; los colores fuera de 0..k-1 se sortean
+    Devuelve la lista de colores o None si no lo encontró a tiempo.
+    """
+    rng = random.Random(semilla)
+    vecinos = [tuple(adj[v]) for v in range(n)]
+    colores = [c if inicial is not None and 0 <= c < k else rng.randrange(k)
+               for c in (inicial if inicial is not None else [-1] * n)]
+    gamma = tablaGamma(n, vecinos, colores, k)
+    tabu = [[0] * k for _ in range(n)]
+    conflictivos = {v for v in range(n) if gamma[v][colores[v]]}
+    f = sum(gamma[v][colores[v]] for v in conflictivos) // 2
+    mejor_f = f
+    if k < 2:
+        # Con un solo color no hay movimientos: o ya es propio o no existe
+        return colores if f == 0 else None
+    fin = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+    colores_k = range(k)
+
+    it = 0
+    while f > 0:
+        it += 1
+        if max_iter is not None and it > max_iter:
+            return None
+        if fin is not None and it % CONTROL_TIEMPO == 0 and time.perf_counter() > fin:
+            return None
+
+        # Mejor movimiento no tabú (o tabú que mejora el mejor f: aspiración)
+        mejor_d = n
+        movimientos = []
+        for v in conflictivos:
+            gv = gamma[v]
+            actual = colores[v]
+            base = gv[actual]
+            tv = tabu[v]
+            for c in colores_k:
+                d = gv[c] - base
+                if d > mejor_d or c == actual:
+                    continue
+                if tv[c] > it and f + d >= mejor_f:
+                    continue
+                if d < mejor_d:
+                    mejor_d = d
+                    movimientos = [(v, c)]
+                else:
+                    movimientos.append((v, c))
+        if movimientos:
+            v, c = rng.choice(movimientos)
+        else:
+            # Todos los movimientos son tabú: uno al azar
+            v = rng.choice(tuple(conflictivos))
+            c = rng.choice([c for c in colores_k if c != colores[v]])
+
+        anterior = colores[v]
+        f += gamma[v][c] - gamma[v][anterior]
+        colores[v] = c
+        tabu[v][anterior] = it + rng.randrange(TENENCIA_BASE) + int(TENENCIA_FACTOR * len(conflictivos))
+        for u in vecinos[v]:
+            gu = gamma[u]
+            gu[anterior] -= 1
+            gu[c] += 1
+            cu = colores[u]
+            if cu == anterior and not gu[anterior]:
+                conflictivos.discard(u)
+            elif cu == c:
+                conflictivos.add(u)
+        if gamma[v][c]:
+            conflictivos.add(v)
+        else:
+            conflictivos.discard(v)
+        if f < mejor_f:
+            mejor_f = f
+    return colores
+
+def partialCol(n, adj, k, tiempo_limite=None, semilla=0, inicial=None, max_iter=None):
+    """
+    Busca un k-coloreo propio manteniendo un coloreo parcial sin conflictos y
+    minimizando los vértices sin color.
+    :param inicial: Coloreo de partida; los vértices con color fuera de
+        0..k-1 o en conflicto con un vecino anterior quedan sin color
+    Devuelve la lista de colores o None si no lo encontró a tiempo.
+    """
+    rng = random.Random(semilla)
+    vecinos = [tuple(adj[v]) for v in range(n)]
+    colores = [-1] * n
+    for v in range(n):
+        c = inicial[v] if inicial is not None else -1
+        if 0 <= c < k and all(colores[u] != c for u in vecinos[v]):
+            colores[v] = c
+    gamma = tablaGamma(n, vecinos, colores, k)
+    sin_color = set()
+    for v in range(n):
+        if colores[v] < 0:
+            # Primer color libre, si lo hay
+            libre = next((c for c in range(k) if not gamma[v][c]), None)
+            if libre is None:
+                sin_color.add(v)
+            else:
+                colores[v] = libre
+                for u in vecinos[v]:
+                    gamma[u][libre] += 1
+    tabu = [[0] * k for _ in range(n)]
+    mejor_f = len(sin_color)
+    fin = time.perf_counter() + tiempo_limite if tiempo_limite is not None else None
+    colores_k = range(k)
+
+    it = 0
+    while sin_color:
+        it += 1
+        if max_iter is not None and it > max_iter:
+            return None
+        if fin is not None and it % CONTROL_TIEMPO == 0 and time.perf_counter() > fin:
+            return None
+
+        # Colorear v con c descolorea gamma[v][c] vecinos: delta = gamma[v][c] - 1
+        f = len(sin_color)
+        mejor_d = n
+        movimientos = []
+        for v in sin_color:
+            gv = gamma[v]
+            tv = tabu[v]
+            for c in colores_k:
+                d = gv[c]
+                if d > mejor_d:
+                    continue
+                if tv[c] > it and f + d - 1 >= mejor_f:
+                    continue
+                if d < mejor_d:
+                    mejor_d = d
+                    movimientos = [(v, c)]
+                else:
+                    movimientos.append((v, c))
+        if movimientos:
+            v, c = rng.choice(movimientos)
+        else:
+            v = rng.choice(tuple(sin_color))
+            c = rng.randrange(k)
+
+        tenencia = it + int(TENENCIA_FACTOR * f)
+        for u in vecinos[v]:
+            if colores[u] == c:
+                colores[u] = -1
+                sin_color.add(u)
+                tabu[u][c] = tenencia + rng.randrange(TENENCIA_BASE)
+                for w in vecinos[u]:
+                    gamma[w][c] -= 1
+        colores[v] = c
+        sin_color.discard(v)
+        for u in vecinos[v]:
+            gamma[u][c] += 1
+        if len(sin_color) < mejor_f:
+            mejor_f = len(sin_color)
+    return colores
+
+BUSQUEDAS = {
+    "tabucol": tabuCol,
+    "partialcol": partialCol,
+}
+
+def quitarClase(adj, colores, metodo):
+    """
+    Coloreo de partida con un color menos: se vacía la clase más chica. Para
+    tabucol sus vértices van al color con menos vecinos; para partialcol
+    quedan sin color.
+    """
+    tamanos = {}
+    for c in colores:
+        tamanos[c] = tamanos.get(c, 0) + 1
+    quitada = min(tamanos, key=tamanos.get)
+    renumerar = {c: i for i, c in enumerate(sorted(c for c in tamanos if c != quitada))}
+    nuevo = [renumerar.get(c, -1) for c in colores]
+    k = len(renumerar)
+    if metodo == "tabucol" and k > 0:
+        for v, c in enumerate(nuevo):
+            if c < 0:
+                cuenta = [0] * k
+                for u in adj[v]:
+                    if nuevo[u] >= 0:
+                        cuenta[nuevo[u]] += 1
+                nuevo[v] = min(range(k), key=cuenta.__getitem__)
+    return nuevo
+
+def coloreoTabu(n, adj, tiempo_limite=10.0, semilla=0, metodo="tabucol", colores=None,
+                cota_inferior=0, alMejorar=None):
+    """
+    Baja k de a uno con la búsqueda tabú hasta agotar el tiempo o alcanzar
+    cota_inferior.
+    :param colores: Coloreo válido de partida (por defecto el mejor entre DSATUR y RLF)
+    :param alMejorar: Función (k, colores, segundos) que se llama con cada coloreo nuevo
+    Devuelve (colores 0..k-1, k).
+    """
+    inicio = time.perf_counter()
+    rng = random.Random(semilla)
+    busqueda = BUSQUEDAS[metodo]
+    if colores is None:
+        colores = min((coloreoDSATUR(n, adj), coloreoRLF(n, adj)), key=cantidadColores)
+    k = cantidadColores(colores)
+    # Un grafo con aristas necesita al menos 2 colores
+    piso = max(cota_inferior, 2 if any(adj[v] for v in range(n)) else 1)
+    while k - 1 >= piso:
+        restante = tiempo_limite - (time.perf_counter() - inicio) if tiempo_limite is not None else None
+        if restante is not None and restante <= 0:
+            break
+        nuevo = busqueda(n, adj, k - 1, tiempo_limite=restante, semilla=rng.randrange(2**31),
+                         inicial=quitarClase(adj, colores, metodo))
+        if nuevo is None:
+            break
+        colores, k = nuevo, k - 1
+        if alMejorar is not None:
+            alMejorar(k, colores, time.perf_counter() - inicio)
+    return colores, k
+
+def main():
+    from dimacs import leerGrafo
+    from grafos import listaAdyacencia
+    from verificacion import verificarColoreo, reporteVerificacion, escribirSalida
+
+    parser = argparse.ArgumentParser(description="Coloreo por búsqueda tabú (TabuCol / PartialCol)")
+    parser.add_argument("input", help="Grafo en formato DIMACS")
+    parser.add_argument("--metodo", choices=METODOS, default="tabucol")
+    parser.add_argument("--tiempo", type=float, default=10.0, help="Tiempo límite en segundos")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--out", "-o", default=None, help="Fichero adicional para guardar la salida (opcional)")
+    args = parser.parse_args()
+
+    n, aristas = leerGrafo(args.input)
+    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+    adj = listaAdyacencia(n, aristas)
+
+    def alMejorar(k, colores, segundos):
+        print(f"c incumbente k={k} t={segundos:.3f}")
+
+    colores, k = coloreoTabu(n, adj, tiempo_limite=args.tiempo, semilla=args.semilla,
+                             metodo=args.metodo, alMejorar=alMejorar)
+    print(reporteVerificacion(verificarColoreo(n, aristas, colores), k))
+    print(f"s feasible {k}")
+    if args.out:
+        escribirSalida(args.out, "feasible", colores)
+
+if __name__ == "__main__":
+    main()
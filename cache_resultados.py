@@ -0,0 +1,125 @@
+"""
+Cache de resultados entre corridas. La clave es (hash del grafo, motor,
+parámetros): el hash se calcula sobre la matriz de bits canónica del .col.b,
+así que no depende del formato, del orden de las aristas ni de repetidos.
+Cada grafo tiene un archivo JSON en el directorio de la cache con un registro
+por configuración: mejor k, coloreo verificado, status, cota LP y columnas
+finales de la generación de columnas.
+"""
+import fcntl
+import hashlib
+import json
+import os
+import time
+
+from dimacs import empaquetarMatriz
+from coloreo_heuristico import coloreoValido, cantidadColores
+
+# Directorio por defecto de la cache
+DIRECTORIO = ".cache_coloreo"
+
+def hashGrafo(n, aristas):
+    """sha256 de n y de la matriz triangular de adyacencia."""
+    h = hashlib.sha256(f"{n}\n".encode())
+    h.update(empaquetarMatriz(n, aristas))
+    return h.hexdigest()
+
+def claveConfiguracion(motor, parametros=None):
+    """Texto canónico de (motor, parámetros) para usar como clave."""
+    return motor + ":" + json.dumps(parametros or {}, sort_keys=True)
+
+def mejorRegistro(a, b):
+    """Entre dos registros de la misma configuración, el de menor k (o probado óptimo)."""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    if b.get("status") == "optimal" and a.get("status") != "optimal":
+        return b
+    if a.get("status") == "optimal" and b.get("status") != "optimal":
+        return a
+    ka, kb = a.get("k"), b.get("k")
+    if kb is not None and (ka is None or kb < ka):
+        return b
+    if kb == ka and (b.get("cota_lp") or 0) > (a.get("cota_lp") or 0):
+        return b
+    return a
+
+class CacheResultados:
+    """Resultados guardados en disco, un archivo JSON por grafo."""
+
+    def __init__(self, directorio=DIRECTORIO):
+        self.directorio = directorio
+        os.makedirs(directorio, exist_ok=True)
+
+    def _path(self, hash_grafo):
+        return os.path.join(self.directorio, hash_grafo + ".json")
+
+    def _leer(self, hash_grafo):
+        try:
+            with open(self._path(hash_grafo), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def buscar(self, n, aristas, motor, parametros=None, hash_grafo=None):
+        """Registro de (grafo, motor, parámetros) o None. El coloreo se vuelve a verificar."""
+        hash_grafo = hash_grafo or hashGrafo(n, aristas)
+        registro = self._leer(hash_grafo).get(claveConfiguracion(motor, parametros))
+        if registro is not None and registro.get("coloreo") is not None \
+                and not coloreoValido(n, aristas, registro["coloreo"]):
+            return None
+        return registro
+
+    def mejorConocido(self, n, aristas, hash_grafo=None):
+        """Mejor coloreo del grafo entre todas las configuraciones (para warm-start)."""
+        hash_grafo = hash_grafo or hashGrafo(n, aristas)
+        mejor = None
+        for registro in self._leer(hash_grafo).values():
+            if registro.get("coloreo") is None or not coloreoValido(n, aristas, registro["coloreo"]):
+                continue
+            mejor = mejorRegistro(mejor, registro)
+        return mejor
+
+    def registros(self, n, aristas, hash_grafo=None):
+        """Todos los registros del grafo, {clave: registro}."""
+        return self._leer(hash_grafo or hashGrafo(n, aristas))
+
+    def guardar(self, n, aristas, motor, parametros=None, status=None, colores=None,
+                cota_lp=None, columnas=None, tiempo=None, hash_grafo=None):
+        """
+        Guarda el resultado si mejora al registro de la misma configuración.
+        Un coloreo que no verifica se descarta (se guardan igual la cota y las
+        columnas). Devuelve el registro que quedó en la cache.
+        """
+        hash_grafo = hash_grafo or hashGrafo(n, aristas)
+        if colores is not None and not coloreoValido(n, aristas, colores):
+            colores = None
+        nuevo = {
+            "motor": motor,
+            "parametros": parametros or {},
+            "status": status if colores is not None or status in ("infeasible", "lp") else "unknown",
+            "k": cantidadColores(colores) if colores is not None else None,
+            "coloreo": list(colores) if colores is not None else None,
+            "cota_lp": cota_lp,
+            "columnas": [sorted(c) for c in columnas] if columnas is not None else None,
+            "tiempo": tiempo,
+            "fecha": time.strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        clave = claveConfiguracion(motor, parametros)
+        path = self._path(hash_grafo)
+        # Lectura-modificación-escritura bajo un lock, por si hay varias corridas en paralelo
+        with open(path + ".lock", "w") as candado:
+            fcntl.flock(candado, fcntl.LOCK_EX)
+            datos = self._leer(hash_grafo)
+            anterior = datos.get(clave)
+            registro = mejorRegistro(anterior, nuevo)
+            if registro is nuevo and anterior is not None and nuevo["columnas"] is None:
+                # Se conservan las columnas del registro anterior
+                nuevo["columnas"] = anterior.get("columnas")
+            datos[clave] = registro
+            temporal = path + ".tmp"
+            with open(temporal, "w") as f:
+                json.dump(datos, f)
+            os.replace(temporal, path)
+        return registro
@@ -0,0 +1,101 @@
+"""
+Clique máxima por branch and bound combinatorio (estilo MCQ/MCS de Tomita)
+sobre bitsets enteros. La cota de cada nodo del árbol se obtiene con un
+coloreo greedy de los candidatos: si |C| + colores(P) <= |mejor| se poda.
+"""
+import time
+
+from grafos import listaAdyacencia
+
+class TiempoAgotado(Exception):
+    pass
+
+def cliqueGreedy(orden, N):
+    """Clique inicial: agrega vértices en el orden dado mientras sean adyacentes a todos."""
+    clique = []
+    P = -1
+    for v in orden:
+        if P >> v & 1:
+            clique.append(v)
+            P &= N[v]
+    return clique
+
+def coloreoCandidatos(P, N):
+    """
+    Coloreo greedy secuencial de los candidatos P (bitset).
+    Devuelve los vértices en orden de color y la cota (color) de cada uno.
+    """
+    orden = []
+    cotas = []
+    color = 0
+    U = P
+    while U:
+        color += 1
+        Q = U
+        while Q:
+            bit = Q & -Q
+            v = bit.bit_length() - 1
+            Q &= ~N[v] & ~bit
+            U &= ~bit
+            orden.append(v)
+            cotas.append(color)
+    return orden, cotas
+
+def cliqueMaximaBits(n, aristas, tiempo_limite=None, alMejorar=None):
+    """
+    Busca una clique máxima del grafo.
+    alMejorar(clique, segundos) se invoca con cada mejora (salida anytime),
+    con los vértices numerados de 0 a n-1.
+    Devuelve (clique, optimo): optimo es False si se alcanzó el tiempo límite.
+    """
+    inicio = time.perf_counter()
+    adj = listaAdyacencia(n, aristas)
+
+    # Renumeramos por grado decreciente: los vértices de mayor grado
+    # quedan en los bits bajos y se colorean primero.
+    orden = sorted(range(n), key=lambda v: len(adj[v]), reverse=True)
+    posicion = {v: i for i, v in enumerate(orden)}
+    N = [0] * n
+    for i, v in enumerate(orden):
+        fila = 0
+        for u in adj[v]:
+            fila |= 1 << posicion[u]
+        N[i] = fila
+
+    mejor = cliqueGreedy(range(n), N)
+    if alMejorar and mejor:
+        alMejorar([orden[v] for v in mejor], time.perf_counter() - inicio)
+
+    nodos = 0
+
+    def expandir(C, P):
+        nonlocal mejor, nodos
+        nodos += 1
+        if tiempo_limite is not None and nodos % 1000 == 0:
+            if time.perf_counter() - inicio > tiempo_limite:
+                raise TiempoAgotado()
+
+        candidatos, cotas = coloreoCandidatos(P, N)
+        for i in range(len(candidatos) - 1, -1, -1):
+            if len(C) + cotas[i] <= len(mejor):
+                return
+            v = candidatos[i]
+            C.append(v)
+            nuevoP = P & N[v]
+            if nuevoP:
+                expandir(C, nuevoP)
+            elif len(C) > len(mejor):
+                mejor = list(C)
+                if alMejorar:
+                    alMejorar([orden[u] for u in mejor], time.perf_counter() - inicio)
+            C.pop()
+            P &= ~(1 << v)
+
+    optimo = True
+    try:
+        if n > 0:
+            expandir([], (1 << n) - 1)
+    except TiempoAgotado:
+        optimo = False
+
+    return sorted(orden[v] for v in mejor), optimo
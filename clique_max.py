@@ -1,50 +1,30 @@
 import argparse
-from pyscipopt import Model
+import time
+from modelos import agregarRestricciones, reporteConstruccion
+from grafos import listaAdyacencia
+from dimacs import leerGrafo
+from clique_bnb import cliqueMaximaBits
 
 def parserDimacs(path):
-    n = None
-    aristas = []
-    max_index = -1
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line[0] == 'c':
-                continue
-            parts = line.split()
-            if parts[0] == 'p' and len(parts) >= 4:
-                try:
-                    n = int(parts[2])
-                except:
-                    n = None
-            elif parts[0] == 'e' and len(parts) >= 3:
-                try:
-                    u = int(parts[1]) - 1
-                    v = int(parts[2]) - 1
-                    aristas.append((u,v))
-                    max_index = max(max_index, u, v)
-                except ValueError:
-                    continue
-    if n is None:
-        if max_index >= 0:
-            n = max_index + 1
-        else:
-            n = 0
-    return n, aristas
+    """Lee un grafo DIMACS (.col o .col.b) en una sola pasada y devuelve (n, aristas)."""
+    return leerGrafo(path)
 
 def getComplemento(n,aristas):
-    aux = [[False]*n for _ in range(n)]
-    for u,v in aristas:
-        aux[u][v] = True
-        aux[v][u] = True
+    adj = listaAdyacencia(n, aristas)
     complemento = []
     for i in range(n):
         for j in range (i+1, n):
-            if not aux[i][j]:
+            if j not in adj[i]:
                 complemento.append((i,j))
     return complemento
 
-def getCliqueMax(n, aristas):
+def getCliqueMax(n, aristas, reporte=False, tiempo_limite=None):
+    from pyscipopt import Model, quicksum
+
+    inicio = time.perf_counter()
     model = Model("CliqueMax")
+    if tiempo_limite is not None:
+        model.setParam("limits/time", tiempo_limite)
 
     # Variable binaria Xi indica si el nodo i pertenece a la clique.
     x = [model.addVar(vtype="B", name=f"x_{i}") for i in range(n)]
@@ -53,11 +33,13 @@ def getCliqueMax(n, aristas):
     compl = getComplemento(n,aristas)
 
     # Si dos nodos son vecinos no pueden pertenecer a un conjunto independiente.
-    for u,v in compl:
-        model.addCons(x[u] + x[v] <= 1)
+    agregarRestricciones(model, (x[u] + x[v] <= 1 for u,v in compl))
 
     # Se busca maximizar el tamaño del conjunto independiente.
-    model.setObjective(sum(x), "maximize")
+    model.setObjective(quicksum(x), "maximize")
+
+    if reporte:
+        reporteConstruccion(model, inicio)
 
     model.optimize()
 
@@ -76,12 +58,23 @@ def getCliqueMax(n, aristas):
 def main():
     parser = argparse.ArgumentParser(description="Conjunto Independiente Máximo")
     parser.add_argument("input", help="Grafo en formato DIMACS")
+    parser.add_argument("--reporte", action="store_true", help="Reportar tiempo de construcción, filas, no ceros y memoria del modelo")
+    parser.add_argument("--motor", choices=["scip", "bnb"], default="scip", help="scip: modelo entero sobre el complemento, bnb: branch and bound con bitsets")
+    parser.add_argument("--tiempo", type=float, default=None, help="Tiempo límite en segundos")
     args = parser.parse_args()
 
     n, aristas = parserDimacs(args.input)
     print(f"Vertices: {n}, Aristas: {len(aristas)}")
 
-    result = getCliqueMax(n, aristas)
+    if args.motor == "bnb":
+        def alMejorar(clique, segundos):
+            print(f"c Mejor clique: {len(clique)} ({segundos:.2f}s)")
+        clique, optimo = cliqueMaximaBits(n, aristas, tiempo_limite=args.tiempo, alMejorar=alMejorar)
+        if not optimo:
+            print("c Tiempo límite alcanzado, la clique puede no ser máxima")
+        result = [v+1 for v in clique]
+    else:
+        result = getCliqueMax(n, aristas, reporte=args.reporte, tiempo_limite=args.tiempo)
 
     print(f"Tamaño de la clique máxima: {len(result)}")
     print("Nodos: ")
@@ -1,38 +1,24 @@
 import argparse
-from pyscipopt import Model
+import functools
+import time
+from modelos import agregarRestricciones, reporteConstruccion, resolver
+from grafos import listaAdyacencia, aristasInducidas, cubrimientoCliquesAristas
+from dimacs import leerGrafo
+from reducciones_coloreo import colorearConReduccion
+from coloreo_heuristico import cantidadColores
+from descomposicion import colorearPorComponentes, colorearPorBloques
+from cache_resultados import CacheResultados, hashGrafo, DIRECTORIO as DIRECTORIO_CACHE
+from verificacion import verificarColoreo, reporteVerificacion, reducirColores
 
 def parserDimacs(path):
-    n = None
-    aristas = []
-    max_index = -1
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line[0] == 'c':
-                continue
-            parts = line.split()
-            if parts[0] == 'p' and len(parts) >= 4:
-                try:
-                    n = int(parts[2])
-                except:
-                    n = None
-            elif parts[0] == 'e' and len(parts) >= 3:
-                try:
-                    u = int(parts[1]) - 1
-                    v = int(parts[2]) - 1
-                    aristas.append((u,v))
-                    max_index = max(max_index, u, v)
-                except ValueError:
-                    continue
-    if n is None:
-        if max_index >= 0:
-            n = max_index + 1
-        else:
-            n = 0
-    return n, aristas
+    """Lee un grafo DIMACS (.col o .col.b) en una sola pasada y devuelve (n, aristas)."""
+    return leerGrafo(path)
 
 # Coloreo Tradicional
-def getColoreoTradicional(n, aristas, max_colors=10):
+def construirTradicional(n, aristas, max_colors=10, cota=None):
+    """Arma el modelo tradicional. Devuelve (model, (x, y))."""
+    from pyscipopt import Model, quicksum
+
     model = Model("ColoreoTradicional")
     model.setParam("display/verblevel", 0)
     x={}
@@ -44,31 +30,29 @@ def getColoreoTradicional(n, aristas, max_colors=10):
         y[c] = model.addVar(vtype="B", name=f"y_{c}")
 
     # Cada nodo debe tener asignado un único color
-    for v in range(n):
-        model.addCons(sum(x[v,c] for c in range(max_colors)) == 1)
+    agregarRestricciones(model, (quicksum(x[v,c] for c in range(max_colors)) == 1 for v in range(n)))
 
     # Dos nodos adyascentes no pueden tener el mismo color 
-    for(u,v) in aristas:
-        for c in range(max_colors):
-            model.addCons(x[u,c] + x[v,c] <= 1)
+    agregarRestricciones(model, (x[u,c] + x[v,c] <= 1 for (u,v) in aristas for c in range(max_colors)))
     
     # Relacion entre las variables x e y
-    for v in range(n):
-        for c in range(max_colors):
-            model.addCons(x[v,c] <= y[c])
+    agregarRestricciones(model, (x[v,c] <= y[c] for v in range(n) for c in range(max_colors)))
 
     # Buscamos minimizar la cantidad de colores utilizados
-    model.setObjective(sum(y[c] for c in range(max_colors)), "minimize")
+    model.setObjective(quicksum(y[c] for c in range(max_colors)), "minimize")
 
-    model.optimize()
+    # Corte con la mejor cota conocida
+    if cota is not None:
+        model.addCons(quicksum(y[c] for c in range(max_colors)) <= cota, name="cota_k")
 
-    sol = model.getBestSol()
-    k = [c for c in range(max_colors) if sol and model.getSolVal(sol,y[c]) > 0.5]
-
-    status = str(model.getStatus()).lower() if model.getStatus() is not None else ""
+    return model, (x, y)
 
-    if not sol:
-        return None, status
+def solucionTradicional(model, n, variables):
+    """Extrae (color_asignado, colores usados) de la mejor solución."""
+    x, y = variables
+    max_colors = len(y)
+    sol = model.getBestSol()
+    k = [c for c in range(max_colors) if model.getSolVal(sol,y[c]) > 0.5]
 
     # Construir solución
     color_asignado = {}
@@ -77,32 +61,37 @@ def getColoreoTradicional(n, aristas, max_colors=10):
             if sol[x[v, c]] > 0.5:
                 color_asignado[v] = c
                 break
+    return color_asignado, k
+
+def getColoreoTradicional(n, aristas, max_colors=10, reporte=False, limites=None, alMejorar=None, cota=None, detener=None):
+    inicio = time.perf_counter()
+    model, variables = construirTradicional(n, aristas, max_colors, cota)
+
+    if reporte:
+        reporteConstruccion(model, inicio)
 
-    is_optimal = 'optimal' in status
-    is_infeasible = 'infeasible' in status
+    status = resolver(model, alMejorar=alMejorar, detener=detener, **(limites or {}))
+
+    if status in ("infeasible", "unknown"):
+        return None, [], 0, status
+
+    color_asignado, k = solucionTradicional(model, n, variables)
 
     print("Coloreo Tradicional")
 
-    return color_asignado, k, len(k), ("optimal" if is_optimal else ("feasible" if not is_infeasible else "infeasible"))
+    return color_asignado, k, len(k), status
     
 
-def getColoreoConjEstables(n, aristas, max_colors=None):
-    """
-    Modelo de coloreo de grafos basado en conjuntos estables.
-    Cada color es un conjunto independiente.
-    """
+def construirConjEstables(n, aristas, max_colors=None, cota=None):
+    """Arma el modelo por conjuntos estables. Devuelve (model, (x, y))."""
+    from pyscipopt import Model, quicksum
+
     model = Model("ColoreoConjuntosEstables")
 
     # Si no se especifica, usar un número máximo de colores igual a n
     if max_colors is None:
         max_colors = n
 
-    # Matriz de adyacencia
-    adj = [[False]*n for _ in range(n)]
-    for u, v in aristas:
-        adj[u][v] = True
-        adj[v][u] = True
-
     # Variables binarias:
     # x[v][c] = 1 si el vértice v tiene el color c
     x = {}
@@ -114,30 +103,28 @@ def getColoreoConjEstables(n, aristas, max_colors=None):
     y = {c: model.addVar(vtype="B", name=f"y_{c}") for c in range(max_colors)}
 
     # Cada vértice debe tener exactamente un color
-    for v in range(n):
-        model.addCons(sum(x[v, c] for c in range(max_colors)) == 1)
+    agregarRestricciones(model, (quicksum(x[v, c] for c in range(max_colors)) == 1 for v in range(n)))
 
     # Si dos vértices son vecinos, no pueden tener el mismo color
-    for (u, v) in aristas:
-        for c in range(max_colors):
-            model.addCons(x[u, c] + x[v, c] <= 1)
+    agregarRestricciones(model, (x[u, c] + x[v, c] <= 1 for (u, v) in aristas for c in range(max_colors)))
 
     # Un vértice solo puede tener color c si ese color se usa
-    for v in range(n):
-        for c in range(max_colors):
-            model.addCons(x[v, c] <= y[c])
+    agregarRestricciones(model, (x[v, c] <= y[c] for v in range(n) for c in range(max_colors)))
 
     # Minimizar cantidad de colores usados
-    model.setObjective(sum(y[c] for c in range(max_colors)), "minimize")
-
-    model.optimize()
+    model.setObjective(quicksum(y[c] for c in range(max_colors)), "minimize")
 
-    sol = model.getBestSol()
+    # Corte con la mejor cota conocida
+    if cota is not None:
+        model.addCons(quicksum(y[c] for c in range(max_colors)) <= cota, name="cota_k")
 
-    status = str(model.getStatus()).lower() if model.getStatus() is not None else ""
+    return model, (x, y)
 
-    if not sol:
-        return None, status
+def solucionConjEstables(model, n, variables):
+    """Extrae (color_asignado, colores usados) de la mejor solución."""
+    x, y = variables
+    max_colors = len(y)
+    sol = model.getBestSol()
 
     # Construir solución
     color_asignado = {}
@@ -148,26 +135,48 @@ def getColoreoConjEstables(n, aristas, max_colors=None):
                 break
 
     usados = [c for c in range(max_colors) if sol[y[c]] > 0.5]
+    return color_asignado, usados
+
+def getColoreoConjEstables(n, aristas, max_colors=None, reporte=False, limites=None, alMejorar=None, cota=None, detener=None):
+    """
+    Modelo de coloreo de grafos basado en conjuntos estables.
+    Cada color es un conjunto independiente.
+    limites: diccionario con tiempo, gap y/o nodos para resolver().
+    alMejorar(k, segundos, gap) se invoca con cada coloreo mejorado.
+    cota: si se indica, se agrega el corte sum y <= cota (por ejemplo k-1
+    con k el mejor coloreo conocido).
+    detener() permite interrumpir la resolución desde afuera.
+    """
+    inicio = time.perf_counter()
+    model, variables = construirConjEstables(n, aristas, max_colors, cota)
+
+    if reporte:
+        reporteConstruccion(model, inicio)
 
-    is_optimal = 'optimal' in status
-    is_infeasible = 'infeasible' in status
+    status = resolver(model, alMejorar=alMejorar, detener=detener, **(limites or {}))
+
+    if status in ("infeasible", "unknown"):
+        return None, [], 0, status
+
+    color_asignado, usados = solucionConjEstables(model, n, variables)
 
     print("Coloreo por Conjuntos Estables")
 
-    return color_asignado, usados, len(usados), ("optimal" if is_optimal else ("feasible" if not is_infeasible else "infeasible"))
+    return color_asignado, usados, len(usados), status
+
 
+def construirRepresentantes(n, aristas, agregadas=True, cota=None):
+    """Arma el modelo por representantes. Devuelve (model, (x, Ntil))."""
+    from pyscipopt import Model, quicksum
 
-def getColoreoRepresentantes(n, aristas):
     model = Model("Coloreo_Representantes")
 
-    # Matriz de adyacencia
-    adj = [[False]*n for _ in range(n)]
-    for u, v in aristas:
-        adj[u][v] = True
-        adj[v][u] = True
+    # Vecinos de cada vértice
+    adj = listaAdyacencia(n, aristas)
 
     # Ñ[v] = no vecinos de v ∪ {v}
-    Ntil = {v: [u for u in range(n) if not adj[v][u] or u == v] for v in range(n)}
+    todos = set(range(n))
+    Ntil = {v: todos - adj[v] for v in range(n)}
 
     # Variables: x[u,v] = 1 si u representa a v
     x = {}
@@ -176,33 +185,38 @@ def getColoreoRepresentantes(n, aristas):
             x[u, v] = model.addVar(vtype="B", name=f"x_{u}_{v}")
 
     # Cada vértice tiene exactamente un representante
-    for v in range(n):
-        model.addCons(sum(x[u, v] for u in Ntil[v]) == 1)
+    agregarRestricciones(model, (quicksum(x[u, v] for u in Ntil[v]) == 1 for v in range(n)))
 
     # Un vértice u solo puede representar si es representante
-    for u in range(n):
-        for v in Ntil[u]:
-            model.addCons(x[u, v] <= x[u, u])
+    agregarRestricciones(model, (x[u, v] <= x[u, u] for u in range(n) for v in Ntil[u] if v != u))
 
-    # Los vértices representados por u deben formar un conjunto estable
+    # Los vértices representados por u deben formar un conjunto estable.
+    # Solo se recorren las aristas internas al antivecindario de u.
+    estables = []
     for u in range(n):
-        for (i, j) in aristas:
-            if i in Ntil[u] and j in Ntil[u]:
-                model.addCons(x[u, i] + x[u, j] <= 1)
+        antivecinos = Ntil[u] - {u}
+        if agregadas:
+            for K in cubrimientoCliquesAristas(antivecinos, adj):
+                estables.append(quicksum(x[u, i] for i in K) <= x[u, u])
+        else:
+            for (i, j) in aristasInducidas(antivecinos, adj):
+                estables.append(x[u, i] + x[u, j] <= 1)
+    agregarRestricciones(model, estables)
 
     # Minimizar cantidad de representantes (colores)
-    model.setObjective(sum(x[u, u] for u in range(n)), "minimize")
+    model.setObjective(quicksum(x[u, u] for u in range(n)), "minimize")
 
-    # Resolver
-    model.optimize()
+    # Corte con la mejor cota conocida
+    if cota is not None:
+        model.addCons(quicksum(x[u, u] for u in range(n)) <= cota, name="cota_k")
 
-    sol = model.getBestSol()
+    return model, (x, Ntil)
 
-    status = str(model.getStatus()).lower() if model.getStatus() is not None else ""
+def solucionRepresentantes(model, n, variables):
+    """Extrae (colores, clases_color, k) de la mejor solución."""
+    x, Ntil = variables
+    sol = model.getBestSol()
 
-    if not sol:
-        return None, status
-    
     # Construir solución
 
     colores = {}
@@ -216,26 +230,64 @@ def getColoreoRepresentantes(n, aristas):
                 break
 
     k = sum(sol[x[u, u]] > 0.5 for u in range(n))
+    return colores, clases_color, k
 
-    is_optimal = 'optimal' in status
-    is_infeasible = 'infeasible' in status
+def getColoreoRepresentantes(n, aristas, agregadas=True, reporte=False, limites=None, alMejorar=None, cota=None, detener=None):
+    """
+    Modelo de coloreo por representantes.
+    Si agregadas es True, las restricciones de conjunto estable se agregan
+    por cliques del antivecindario (sum x[u,i] <= x[u,u] para i en K) en
+    lugar de una restricción por arista.
+    """
+    inicio = time.perf_counter()
+    model, variables = construirRepresentantes(n, aristas, agregadas, cota)
 
-    print("Coloreo por Representantes")
+    if reporte:
+        reporteConstruccion(model, inicio)
 
-    return colores, clases_color, k, ("optimal" if is_optimal else ("feasible" if not is_infeasible else "infeasible"))
+    # Resolver
+    status = resolver(model, alMejorar=alMejorar, detener=detener, **(limites or {}))
 
-def main():
-    parser = argparse.ArgumentParser(description="Coloreo")
-    parser.add_argument("input", help="Grafo en formato DIMACS")
-    parser.add_argument("--out", "-o", default=None, help="Fichero adicional para guardar la salida (opcional)")
-    args = parser.parse_args()
+    if status in ("infeasible", "unknown"):
+        return None, {}, 0, status
 
-    n, aristas = parserDimacs(args.input)
-    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+    colores, clases_color, k = solucionRepresentantes(model, n, variables)
 
-    #colores, clases_color, k, status = getColoreoTradicional(n, aristas)
-    #colores, clases_color, k, status = getColoreoRepresentantes(n, aristas)
-    colores, clases_color, k, status = getColoreoConjEstables(n, aristas)
+    print("Coloreo por Representantes")
+
+    return colores, clases_color, k, status
+
+def resolverColoreoLista(n, aristas, limites=None, alMejorar=None, reporte=False, max_colors=None):
+    """
+    Conjuntos estables devolviendo (lista de colores, status). Es la forma que
+    esperan la reducción y la descomposición, y se puede enviar a otro proceso.
+    max_colors: cota superior conocida (por ejemplo de la cache); un subgrafo
+    nunca necesita más colores que el grafo completo.
+    """
+    if max_colors is not None:
+        max_colors = min(max_colors, n)
+    colores, _, _, status = getColoreoConjEstables(n, aristas, max_colors=max_colors, reporte=reporte,
+                                                   limites=limites, alMejorar=alMejorar)
+    if colores is None:
+        return None, status
+    return [colores[v] for v in range(n)], status
+
+def escribirResultado(n, lista, status, out=None, aristas=None):
+    """
+    Imprime la línea s y, si se pide, guarda el coloreo en out. Con aristas
+    el coloreo se verifica antes: uno inválido se informa como unknown.
+    """
+    if lista is not None and aristas is not None:
+        verificacion = verificarColoreo(n, aristas, lista)
+        print(reporteVerificacion(verificacion))
+        if not verificacion["valido"]:
+            lista, status = None, "unknown"
+    if lista is None:
+        colores, clases_color, k = None, [], 0
+    else:
+        colores = dict(enumerate(lista))
+        clases_color = sorted(set(lista))
+        k = cantidadColores(lista)
 
     if (status == "optimal"):
         print(f"s optimal {k}")
@@ -243,9 +295,12 @@ def main():
     elif (status == "feasible"):
         print(f"s feasible {k}")
         salida= f"s feasible {k}\n"
-    else:
+    elif (status == "infeasible"):
         print(f"s unsatisfiable")
         salida= f"s unsatisfiable\n"
+    else:
+        print(f"s unknown")
+        salida= f"s unknown\n"
     """
     print("Color de cada vértice:")
     for v in range(n):
@@ -254,12 +309,124 @@ def main():
     print(f"\nColores usados: {clases_color}")
     print(f"Número mínimo de colores: {k}")
     """
-    if args.out:
-        with open(args.out, "w") as f:
+    if out:
+        with open(out, "w") as f:
             f.write(salida)
-            for v in range(n):
+            for v in range(n if colores else 0):
                 f.write(f"v {v} {colores[v]}\n")
 
+def main():
+    parser = argparse.ArgumentParser(description="Coloreo")
+    parser.add_argument("input", help="Grafo en formato DIMACS")
+    parser.add_argument("--out", "-o", default=None, help="Fichero adicional para guardar la salida (opcional)")
+    parser.add_argument("--reporte", action="store_true", help="Reportar tiempo de construcción, filas, no ceros y memoria del modelo")
+    parser.add_argument("--tiempo", type=float, default=None, help="Tiempo límite en segundos")
+    parser.add_argument("--gap", type=float, default=None, help="Gap relativo límite (por ejemplo 0.05)")
+    parser.add_argument("--nodos", type=int, default=None, help="Límite de nodos del branch and bound")
+    parser.add_argument("--stream", default=None, help="Archivo donde se escribe cada coloreo mejorado (k, tiempo, gap)")
+    parser.add_argument("--reducir", action="store_true", help="Eliminar vértices de grado bajo y dominados y resolver solo el núcleo")
+    parser.add_argument("--descomponer", choices=["componentes", "bloques"], default=None,
+                        help="Resolver por componentes conexas o por bloques (componentes biconexas)")
+    parser.add_argument("--procesos", "-j", type=int, default=None, help="Procesos para resolver las partes en paralelo")
+    parser.add_argument("--cache", nargs="?", const=DIRECTORIO_CACHE, default=None,
+                        help="Directorio de la cache de resultados (por defecto .cache_coloreo)")
+    parser.add_argument("--tabu", type=float, default=None,
+                        help="Segundos de búsqueda tabú antes del modelo: su k acota la cantidad de colores")
+    parser.add_argument("--post", type=float, default=None,
+                        help="Segundos de post-optimización del coloreo (Kempe y greedy iterado) si no es óptimo")
+    args = parser.parse_args()
+
+    n, aristas = parserDimacs(args.input)
+    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+
+    cache = CacheResultados(args.cache) if args.cache else None
+    parametros = {"reducir": args.reducir, "descomponer": args.descomponer,
+                  "tiempo": args.tiempo, "gap": args.gap, "nodos": args.nodos}
+    max_colors = None
+    if cache is not None:
+        hash_grafo = hashGrafo(n, aristas)
+        registro = cache.buscar(n, aristas, "conjestables", parametros, hash_grafo=hash_grafo)
+        mejor = cache.mejorConocido(n, aristas, hash_grafo=hash_grafo)
+        if registro is None and mejor is not None and mejor["status"] == "optimal":
+            registro = mejor
+        if registro is not None and registro["coloreo"] is not None:
+            # Misma configuración ya resuelta, u óptimo probado por otra
+            print(f"c Resultado en cache ({registro['motor']}, {registro['fecha']})")
+            escribirResultado(n, registro["coloreo"], registro["status"], args.out, aristas)
+            return
+        if mejor is not None:
+            # Warm-start: el mejor k conocido acota la cantidad de colores del modelo
+            max_colors = mejor["k"]
+            print(f"c Cota superior de la cache: {max_colors} colores")
+
+    lista_tabu = None
+    if args.tabu is not None:
+        from busqueda_tabu import coloreoTabu
+
+        lista_tabu, k_tabu = coloreoTabu(n, listaAdyacencia(n, aristas), tiempo_limite=args.tabu)
+        print(f"c Búsqueda tabú: {k_tabu} colores")
+        max_colors = k_tabu if max_colors is None else min(max_colors, k_tabu)
+
+    #colores, clases_color, k, status = getColoreoTradicional(n, aristas)
+    #colores, clases_color, k, status = getColoreoRepresentantes(n, aristas)
+    limites = {"tiempo": args.tiempo, "gap": args.gap, "nodos": args.nodos}
+    stream = open(args.stream, "w") if args.stream else None
+
+    def alMejorar(objetivo, segundos, gap):
+        linea = f"c incumbente k={round(objetivo)} t={segundos:.3f} gap={gap:.4f}"
+        print(linea)
+        if stream:
+            stream.write(linea + "\n")
+            stream.flush()
+
+    # Con varios procesos el callback no se puede enviar a los trabajadores
+    paralelo = args.procesos is not None and args.procesos > 1
+    resolverBase = functools.partial(resolverColoreoLista, limites=limites, reporte=args.reporte,
+                                     alMejorar=None if paralelo else alMejorar, max_colors=max_colors)
+
+    def resolverGrafo(n_grafo, aristas_grafo):
+        if args.descomponer == "componentes":
+            return colorearPorComponentes(n_grafo, listaAdyacencia(n_grafo, aristas_grafo), resolverBase, args.procesos)
+        if args.descomponer == "bloques":
+            return colorearPorBloques(n_grafo, listaAdyacencia(n_grafo, aristas_grafo), resolverBase, args.procesos)
+        return resolverBase(n_grafo, aristas_grafo)
+
+    inicio = time.perf_counter()
+    try:
+        if args.reducir:
+            nucleo = {"k": 0, "status": "optimal"}
+
+            def resolverNucleo(n_nucleo, aristas_nucleo):
+                colores_n, nucleo["status"] = resolverGrafo(n_nucleo, aristas_nucleo)
+                nucleo["k"] = cantidadColores(colores_n) if colores_n else 0
+                return colores_n
+
+            lista, _, cota = colorearConReduccion(n, listaAdyacencia(n, aristas), resolverNucleo)
+            status = nucleo["status"]
+            # chi(G) >= max(chi(núcleo), clique): solo es óptimo si se alcanza esa cota
+            if lista is not None and status == "optimal" and cantidadColores(lista) > max(nucleo["k"], cota):
+                status = "feasible"
+        else:
+            lista, status = resolverGrafo(n, aristas)
+    finally:
+        if stream:
+            stream.close()
+
+    if lista_tabu is not None and lista is None and status != "infeasible":
+        # El modelo no encontró nada dentro de los límites: queda el coloreo tabú
+        lista, status = lista_tabu, "feasible"
+
+    if args.post is not None and lista is not None and status != "optimal":
+        k_antes = cantidadColores(lista)
+        lista = reducirColores(n, listaAdyacencia(n, aristas), lista, tiempo_limite=args.post)
+        print(f"c post-optimización: {k_antes} -> {cantidadColores(lista)} colores")
+
+    if cache is not None:
+        cache.guardar(n, aristas, "conjestables", parametros, status=status, colores=lista,
+                      tiempo=time.perf_counter() - inicio, hash_grafo=hash_grafo)
+
+    escribirResultado(n, lista, status, args.out, aristas)
+
     """    
     colores, clases_color, k = getColoreoRepresentantes(n, aristas)
 
@@ -1,9 +1,17 @@
-from pyscipopt import Model
 from collections import defaultdict
+import os
 import time
-import random
 import struct
 
+from reducciones_coloreo import reducirColoreo, extenderColoreo
+from dimacs import leerGrafo
+from generadores import grafoAleatorio
+from coloreo_heuristico import conjuntosEstablesIniciales
+from gestion_columnas import GestorColumnas
+from conjunto_independiente_max import mwssExacto
+from maestro_lp import crearMaestro, dualesConsistentes, DualesInvalidos
+from heuristica_maestro import colorearDesdeColumnas
+
 def decode_dimacs_binary_graph(file_path):
     """
     Decodifica un archivo binario de grafos DIMACS (.col.b)
@@ -141,129 +149,412 @@ def parse_dimacs_file(file_path):
     # Devolver el grafo en formato 1-based (como lo lee el parser)
     return adj
 
+def columnasHeuristicas(adj_list, heuristicas=("greedy", "dsatur", "rlf")):
+    """
+    Clases de color de coloreos heurísticos extendidas a conjuntos estables
+    maximales, con los vértices de adj_list. Columnas iniciales del maestro.
+    """
+    nodos = list(adj_list)
+    indice = {v: i for i, v in enumerate(nodos)}
+    adj0 = [{indice[u] for u in adj_list[v] if u in indice} for v in nodos]
+    columnas, _ = conjuntosEstablesIniciales(len(nodos), adj0, heuristicas)
+    return [{nodos[i] for i in columna} for columna in columnas]
+
+def leerColumnas(path, adj_list):
+    """
+    Lee un archivo de columnas (un conjunto estable por línea, vértices
+    separados por espacios; las líneas 'c' son comentarios). Se descartan las
+    columnas con vértices desconocidos o que no son conjuntos estables.
+    """
+    columnas = []
+    with open(path, 'r') as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0] == 'c':
+                continue
+            columna = {int(p) for p in parts}
+            if all(v in adj_list for v in columna) and \
+                    not any(adj_list[v] & columna for v in columna):
+                columnas.append(columna)
+    return columnas
+
+def escribirColumnas(path, columnas):
+    with open(path, 'w') as f:
+        f.write("c Columnas del maestro (un conjunto estable por línea)\n")
+        for columna in columnas:
+            f.write(" ".join(str(v) for v in sorted(columna)) + "\n")
+
 class GraphColoringCG:
-    def __init__(self, adj_list):
+    def __init__(self, adj_list, columnas_iniciales=None, edad_maxima=20, max_columnas=None,
+                 pricing_exacto=True, tiempo_pricing=None, maestro="simplex"):
         """
         Inicializa el problema de coloreo mediante generación de columnas.
         :param adj_list: Diccionario donde key=vertice, value=set(vecinos)
+        :param columnas_iniciales: Conjuntos estables que se agregan al maestro
+            además de las columnas singleton (por ejemplo columnasHeuristicas()
+            o leerColumnas()), para arrancar con un LP cercano al k heurístico
+        :param edad_maxima: Iteraciones que una columna puede estar sin usarse
+            antes de pasar al pool (None = no se retiran)
+        :param max_columnas: Tope de columnas activas en el maestro (None = sin tope)
+        :param pricing_exacto: Si las heurísticas y la búsqueda local no encuentran
+            columna, resolver el MWSS exacto (SCIP). Sin él la cota no queda probada
+        :param tiempo_pricing: Tiempo límite (s) de cada llamada al MWSS exacto (None = sin límite)
+        :param maestro: Implementación del LP maestro: "simplex" (por defecto) o "scip" (ver maestro_lp)
         """
         self.adj = adj_list
         self.nodes = list(adj_list.keys())
         self.n = len(self.nodes)
         
-        # Inicializar PySCIPOpt Model (Master Problem)
-        self.model = Model("FractionalColoring_LP")
-        
-        # Desactivar Presolving para evitar que modifique la estructura del problema
-        self.model.setPresolve(0)
-        self.model.setParam("presolving/maxrounds", 0)
-        self.model.setParam("presolving/maxrestarts", 0)
-        
-        # Desactivar Propagación: Evita que SCIP fije variables "obvias" 
-        # y elimine las restricciones asociadas, lo cual causa el error de duales NULL.
-        self.model.setParam("propagating/maxrounds", 0)
-        self.model.setParam("propagating/maxroundsroot", 0)
-
-        self.model.setParam("separating/maxrounds", 0)
-        self.model.setParam("separating/maxroundsroot", 0)
-
-        self.model.setParam("lp/presolving", False)
-        
-        self.model.hideOutput()
+        # LP maestro restringido (Master Problem)
+        self.maestro = crearMaestro(maestro)
+        self.tiempo_maestro = 0.0
         
-        self.conss = {}
-        self.vars = []
+        self.columnas = []
+        # Clave de cada columna en el gestor (las posiciones cambian al retirar)
+        self.claves = []
+        self._siguiente_clave = 0
+        self.gestor = GestorColumnas(edad_maxima=edad_maxima, max_columnas=max_columnas)
+
+        self.pricing_exacto = pricing_exacto
+        self.tiempo_pricing = tiempo_pricing
+        # lower_bound es siempre una cota inferior válida del número cromático
+        # fraccionario: el LP si el pricing exacto probó que no hay columnas,
+        # o la cota de Farley LP / w* en las iteraciones con w* probado
+        self.bound_proven = False
+        self.lower_bound = 0.0
         
         self._init_master_problem()
 
+        vistas = {frozenset(c) for c in self.columnas}
+        for columna in columnas_iniciales or []:
+            if len(columna) > 1 and frozenset(columna) not in vistas:
+                vistas.add(frozenset(columna))
+                self.add_column(columna)
+
     def _init_master_problem(self):
         """
-        Inicializa variables y restricciones simultáneamente.
+        Inicializa variables y restricciones simultáneamente: cada fila de
+        cobertura nace con su columna singleton.
         """
-        for i, v in enumerate(self.nodes):
-            # Al no poner cota superior estricta de 1.0, evitamos que el propagador
-            # detecte la solución trivial inmediata y elimine la restricción.
-            var = self.model.addVar(name=f"S_init_{v}", vtype="C", lb=0.0, ub=None, obj=1.0)
-            self.vars.append(var)
-            
-            # Crear restricción: var >= 1
-            # modifiable=True es vital para poder agregar coeficientes luego
-            cons = self.model.addCons(var >= 1, name=f"cover_{v}", separate=False, modifiable=True, removable=False)
-            self.conss[v] = cons
+        for v in self.nodes:
+            self.maestro.agregarFila(v, self._track_column({v}, protegida=True))
 
     def add_column(self, stable_set):
         """Agrega una nueva variable (columna) al modelo."""
-        col_idx = len(self.vars)
-        # También usamos ub=None para las nuevas columnas por consistencia
-        var = self.model.addVar(name=f"S_{col_idx}", vtype="C", lb=0.0, ub=None, obj=1.0)
-        self.vars.append(var)
-        
-        for v in stable_set:
-            self.model.addConsCoeff(self.conss[v], var, 1.0)
+        clave = self._track_column(set(stable_set))
+        self.maestro.agregarColumna(clave, stable_set)
+
+    def _track_column(self, columna, protegida=False):
+        """Registra la columna en las listas paralelas y en el gestor. Devuelve su clave."""
+        clave = self._siguiente_clave
+        self._siguiente_clave += 1
+        self.columnas.append(columna)
+        self.claves.append(clave)
+        self.gestor.registrar(clave, columna, protegida=protegida)
+        return clave
+
+    def _retire_columns(self, claves):
+        """Saca del maestro las columnas indicadas; el gestor las guarda en el pool."""
+        claves = set(claves)
+        for i in reversed(range(len(self.claves))):
+            if self.claves[i] in claves:
+                self.maestro.quitarColumna(self.claves[i], self.columnas[i])
+                self.gestor.retirar(self.claves[i])
+                del self.columnas[i], self.claves[i]
+
+    def get_lp_statistics(self):
+        """Tamaño del maestro (filas, columnas activas), pool y tiempo en el LP."""
+        estadisticas = self.gestor.estadisticas()
+        estadisticas["filas"] = len(self.nodes)
+        estadisticas["columnas"] = len(self.claves)
+        estadisticas["tiempo_maestro"] = self.tiempo_maestro
+        return estadisticas
+
+    # Cambios incrementales del grafo. Cada cambio repara las columnas que
+    # dejaron de ser estables y mantiene el resto; después solve() retoma la
+    # generación de columnas desde el maestro actual.
+    def add_edge(self, u, v):
+        """Agrega la arista (u, v). Las columnas que contienen a ambos pierden un extremo."""
+        if u == v or v in self.adj[u]:
+            return
+        self._invalidar_cota()
+        self.adj[u].add(v)
+        self.adj[v].add(u)
+        for i, columna in enumerate(self.columnas):
+            if u in columna and v in columna:
+                # Se saca el extremo de mayor grado: el otro sigue cubierto
+                # por la columna y el que sale por su columna singleton
+                quitar = u if len(self.adj[u]) >= len(self.adj[v]) else v
+                self._remove_from_column(i, quitar)
+        self.gestor.descartarPool((u, v))
+        self._compact()
+
+    def remove_edge(self, u, v):
+        """Saca la arista (u, v). Las columnas siguen siendo estables; se extienden si se puede."""
+        if v not in self.adj[u]:
+            return
+        self._invalidar_cota()
+        self.adj[u].discard(v)
+        self.adj[v].discard(u)
+        for i, columna in enumerate(self.columnas):
+            for a, b in ((u, v), (v, u)):
+                if a in columna and b not in columna and not (self.adj[b] & columna):
+                    self.maestro.agregarCoeficiente(b, self.claves[i])
+                    columna.add(b)
+                    self.gestor.cambiar(self.claves[i], columna)
+
+    def add_vertex(self, v, vecinos=()):
+        """Agrega el vértice v con sus vecinos: nueva fila de cobertura y columna singleton."""
+        if v in self.adj:
+            raise ValueError(f"El vértice {v} ya existe")
+        self._invalidar_cota()
+        vecinos = {u for u in vecinos if u in self.adj and u != v}
+        self.adj[v] = set(vecinos)
+        for u in vecinos:
+            self.adj[u].add(v)
+        self.nodes.append(v)
+        self.n = len(self.nodes)
+
+        self.maestro.agregarFila(v, self._track_column({v}, protegida=True))
+        # v entra en las columnas existentes donde no tiene vecinos
+        for i, columna in enumerate(self.columnas[:-1]):
+            if columna and not (vecinos & columna):
+                self.maestro.agregarCoeficiente(v, self.claves[i])
+                columna.add(v)
+                self.gestor.cambiar(self.claves[i], columna)
+
+    def remove_vertex(self, v):
+        """Saca el vértice v, su fila de cobertura y su columna singleton."""
+        self._invalidar_cota()
+        for u in self.adj.pop(v):
+            self.adj[u].discard(v)
+        self.nodes.remove(v)
+        self.n = len(self.nodes)
+        self.maestro.quitarFila(v)
+        self.gestor.descartarPool((v,))
+        for i, columna in enumerate(self.columnas):
+            if v in columna:
+                columna.discard(v)
+                if not columna or any(columna == otra for j, otra in enumerate(self.columnas) if j != i):
+                    self._deactivate_column(i)
+                else:
+                    self.gestor.cambiar(self.claves[i], columna)
+        self._compact()
+
+    def _invalidar_cota(self):
+        """Después de editar el grafo la cota de la última corrida ya no vale."""
+        self.bound_proven = False
+        self.lower_bound = 0.0
+
+    def _remove_from_column(self, i, v):
+        """Saca v de la columna i; si queda vacía o repetida, la columna se desactiva."""
+        columna = self.columnas[i]
+        self.maestro.quitarCoeficiente(v, self.claves[i])
+        columna.discard(v)
+        if not columna or any(columna == otra for j, otra in enumerate(self.columnas) if j != i):
+            self._deactivate_column(i)
+        else:
+            self.gestor.cambiar(self.claves[i], columna)
+        if not any(v in otra for otra in self.columnas):
+            # v quedó sin cubrir (su singleton se había extendido)
+            self.add_column({v})
+
+    def _deactivate_column(self, i):
+        """Saca la columna del maestro y la deja vacía hasta el próximo _compact()."""
+        self.maestro.quitarColumna(self.claves[i], self.columnas[i])
+        self.columnas[i] = set()
+        self.gestor.olvidar(self.claves[i])
+
+    def _compact(self):
+        """Borra de las listas paralelas las columnas desactivadas."""
+        vivas = [i for i, columna in enumerate(self.columnas) if columna]
+        self.columnas = [self.columnas[i] for i in vivas]
+        self.claves = [self.claves[i] for i in vivas]
+
+    def guardar_columnas(self, path):
+        """Guarda las columnas actuales para arrancar otra corrida desde ellas."""
+        # También las del pool: en otra corrida pueden volver a servir
+        escribirColumnas(path, [c for c in self.columnas if c] + [set(c) for c in self.gestor.pool])
 
     def get_dual_values(self):
         """Obtiene los valores duales (pi_v)."""
-        duals = {}
-        for v in self.nodes:
-            # Ahora que la propagación está desactivada y la restricción es 'modifiable',
-            # SCIP mantendrá la fila en la matriz LP y podremos leer su dual.
-            pi = self.model.getDualsolLinear(self.conss[v])
-            if pi > 1e15:
-                duals[v] = 0.0
-            else:
-                duals[v] = pi
-        return duals
+        return self.maestro.duales()
 
-    def solve(self, max_iter=100):
-        """Ejecuta el bucle de generación de columnas."""
-        print(f"{'Iter':<5} | {'LP Obj':<10} | {'Heuristic':<15} | {'Weight':<10} | {'Size':<5}")
-        print("-" * 60)
+    def _solve_master(self):
+        """Resuelve el LP maestro y acumula el tiempo que lleva."""
+        inicio = time.perf_counter()
+        valor = self.maestro.resolver()
+        self.tiempo_maestro += time.perf_counter() - inicio
+        return valor
+
+    def solve(self, max_iter=100, verbose=True):
+        """
+        Ejecuta el bucle de generación de columnas.
+        :param verbose: Si es False no se imprime la tabla de iteraciones
+        """
+        self._invalidar_cota()
+        log = print if verbose else lambda *args: None
+        log(f"{'Iter':<5} | {'LP Obj':<10} | {'Heuristic':<15} | {'Weight':<10} | {'Size':<5} | {'Cols':<6} | {'Pool':<6}")
+        log("-" * 78)
 
         for it in range(max_iter):
             # 1. Optimizar
-            self.model.optimize()
-            lp_obj = self.model.getObjVal()
+            lp_obj = self._solve_master()
             
-            # 2. Obtener duales (Antes de liberar transformación)
-            duals = self.get_dual_values()
+            # 2. Obtener duales y valores
+            try:
+                duals = self.get_dual_values()
+            except DualesInvalidos as e:
+                log("-" * 78)
+                log(f"Terminado: {e} (cota no probada).")
+                break
+            # Solo con duales que cumplen dualidad fuerte el MWSS prueba algo
+            duales_validos = dualesConsistentes(duals, lp_obj)
+            valores = self.maestro.valores()
+            retirar = self.gestor.actualizar(valores, duals)
             
-            # 3. Resolver Pricing (Heurísticas MWSS)
-            stable_set, weight, method = self.run_mwss_heuristics(duals)
+            # 3. Columnas del pool que volvieron a tener costo reducido negativo:
+            # reingresan sin llamar al pricing
+            reingresos = self.gestor.reingresar(duals)
+            if reingresos:
+                stable_set = reingresos[0]
+                weight = sum(duals[v] for v in stable_set)
+                method = f"Pool ({len(reingresos)})"
+                exacto = False
+            else:
+                # Resolver Pricing: heurísticas, búsqueda local y MWSS exacto
+                stable_set, weight, method, exacto = self.price(duals)
+                exacto = exacto and duales_validos
+
+            if exacto:
+                # weight es el MWSS óptimo: LP / max(1, w*) es cota inferior (Farley)
+                self.lower_bound = max(self.lower_bound, lp_obj / max(1.0, weight))
             
             # 4. Criterio de parada: Peso <= 1 indica que no hay columnas con costo reducido negativo
             # (Nota: costo reducido = 1 - weight. Si weight <= 1, costo reducido >= 0 -> óptimo)
             if weight <= 1.0 + 1e-6:
-                print("-" * 60)
-                print(f"Terminado: No se encontraron conjuntos con peso > 1 (Heurísticas agotadas).")
+                log("-" * 78)
+                if exacto:
+                    self.bound_proven = True
+                    self.lower_bound = lp_obj
+                    log("Terminado: el MWSS exacto no encontró columnas (cota LP probada).")
+                else:
+                    log(f"Terminado: No se encontraron conjuntos con peso > 1 (Heurísticas agotadas).")
                 break
             
-            print(f"{it:<5} | {lp_obj:<10.4f} | {method:<15} | {weight:<10.4f} | {len(stable_set):<5}")
+            log(f"{it:<5} | {lp_obj:<10.4f} | {method:<15} | {weight:<10.4f} | {len(stable_set):<5} | "
+                  f"{len(self.claves):<6} | {len(self.gestor.pool):<6}")
             
-            # 5. Liberar transformación para modificar el modelo
-            self.model.freeTransform()
-            
-            # 6. Agregar columna
-            self.add_column(stable_set)
+            # 5. Retirar columnas viejas y agregar las nuevas
+            self._retire_columns(retirar)
+            for columna in reingresos or [stable_set]:
+                self.add_column(columna)
+
+        lp_obj = self._solve_master()
+        if self.bound_proven:
+            self.lower_bound = lp_obj
+        return lp_obj
+
+    def integer_solution(self, tiempo_limite=10.0, metodos=("redondeo", "buceo", "ip")):
+        """
+        Coloreo entero sobre las columnas del maestro y del pool (ver
+        heuristica_maestro). Devuelve (colores {v: 0..k-1}, k, método).
+        """
+        valores = self.maestro.valores()
+        columnas = self.columnas + [set(c) for c in self.gestor.pool]
+        valores = [valores.get(clave, 0.0) for clave in self.claves] + [0.0] * len(self.gestor.pool)
+        return colorearDesdeColumnas(self.adj, columnas, valores, tiempo_limite=tiempo_limite, metodos=metodos,
+                                     cota_inferior=self.lower_bound or None)
+
+    # Pricing
+    def price(self, duals):
+        """
+        Pricing escalonado: heurísticas greedy, búsqueda local sobre el mejor
+        conjunto y, si ninguna encuentra peso > 1, el MWSS exacto.
+        Devuelve (S, peso, método, exacto); exacto indica que el peso es el
+        óptimo del MWSS y por lo tanto que peso <= 1 prueba el LP.
+        """
+        S, w, method = self.run_mwss_heuristics(duals)
+        if w > 1.00001:
+            return S, w, method, False
+
+        # La búsqueda local arranca del mejor conjunto de las greedies
+        S = self.improve_stable_set(S, duals)
+        w = sum(duals[v] for v in S)
+        if w > 1.00001 or not self.pricing_exacto:
+            return S, w, "LocalSearch", False
 
-        self.model.optimize()
-        return self.model.getObjVal()
+        S, w, optimo = mwssExacto(self.adj, duals, tiempo_limite=self.tiempo_pricing)
+        return list(S), w, "Exact" if optimo else "Exact (límite)", optimo
+
+    def improve_stable_set(self, S, duals):
+        """
+        Búsqueda local (1, k)-swap: agrega los vértices libres de peso
+        positivo y cambia un vértice u de S por vecinos suyos que solo
+        chocan con u cuando juntos pesan más.
+        """
+        S = set(S)
+        # tight[v] = cantidad de vecinos de v en S
+        tight = defaultdict(int)
+        for u in S:
+            for v in self.adj[u]:
+                tight[v] += 1
+
+        def agregar(v):
+            S.add(v)
+            for x in self.adj[v]:
+                tight[x] += 1
+
+        def sacar(u):
+            S.discard(u)
+            for x in self.adj[u]:
+                tight[x] -= 1
+
+        mejoro = True
+        while mejoro:
+            mejoro = False
+            for v in self.nodes:
+                if v not in S and tight[v] == 0 and duals[v] > 1e-9:
+                    agregar(v)
+            for u in list(S):
+                # Vecinos de u que solo tienen a u en S, elegidos en forma greedy por peso
+                candidatos = sorted((v for v in self.adj[u] if tight[v] == 1 and duals[v] > 1e-9),
+                                    key=lambda v: duals[v], reverse=True)
+                entran = []
+                prohibidos = set()
+                for v in candidatos:
+                    if v not in prohibidos:
+                        entran.append(v)
+                        prohibidos.update(self.adj[v])
+                if sum(duals[v] for v in entran) > duals[u] + 1e-9:
+                    sacar(u)
+                    for v in entran:
+                        agregar(v)
+                    mejoro = True
+                    break
+        return list(S)
 
     # Heurísticas
     def run_mwss_heuristics(self, duals):
+        """Devuelve el primer conjunto con peso > 1 o, si no hay, el de mayor peso."""
+        best_S, best_w = [], 0.0
 
         S = self.greedy_strategy_2(duals)
         w = sum(duals[v] for v in S)
         if w > 1.00001: return S, w, "DynSurplus"
+        if w > best_w: best_S, best_w = S, w
 
         S = self.greedy_strategy_3(duals)
         w = sum(duals[v] for v in S)
         if w > 1.00001: return S, w, "StatSurplus"
+        if w > best_w: best_S, best_w = S, w
         
         S = self.greedy_strategy_1(duals)
         w = sum(duals[v] for v in S)
         if w > 1.00001: return S, w, "MaxWeight"
+        if w > best_w: best_S, best_w = S, w
             
-        return [], 0.0, "None"
+        return best_S, best_w, "None"
 
     def _build_greedy_stable_set(self, sorted_candidates, duals):
         S = set()
@@ -312,14 +603,13 @@ class GraphColoringCG:
         return list(S)
     
 # Función auxiliar para testear grafos aleatorios
-def generate_random_graph(n, p):
-    """Genera un grafo Erdos-Renyi G(n, p)."""
+def generate_random_graph(n, p, seed=None):
+    """Genera un grafo Erdos-Renyi G(n, p) en O(n + m) (generadores.grafoAleatorio)."""
+    _, aristas = grafoAleatorio(n, p, semilla=seed)
     adj = {i: set() for i in range(n)}
-    for i in range(n):
-        for j in range(i + 1, n):
-            if random.random() < p:
-                adj[i].add(j)
-                adj[j].add(i)
+    for u, v in aristas:
+        adj[u].add(v)
+        adj[v].add(u)
     return adj
 
 if __name__ == "__main__":
@@ -329,33 +619,21 @@ if __name__ == "__main__":
     #FILE_PATH = "DSJC250.9.col.b"  # Mejor k conseguido = 165
     FILE_PATH = "flat300_20_0.col"  # Mejor k conseguido = 40 
 
-    print(f"Iniciando decodificación binaria de {FILE_PATH}...")
-    
-    ascii_graph_content = decode_dimacs_binary_graph(FILE_PATH)
-    output_file_path = FILE_PATH.replace(".col.b", ".col")
-
-    if ascii_graph_content:
-        # Imprimir las primeras 10 líneas de la salida
-        print("\n--- Cabecera y Primeras Aristas Decodificadas (DIMACS ASCII) ---")
-        print("\n".join(ascii_graph_content.split('\n')[:15]))
-        
-        # Opcional: Guardar la salida decodificada en un nuevo archivo .col
-        
-        with open(output_file_path, 'w') as f:
-             f.write(ascii_graph_content)
-        
-        print(f"\nDecodificación completa. {len(ascii_graph_content.splitlines()) - 10} aristas encontradas.")
-        print(f"El grafo decodificado se ha guardado en: {output_file_path}")
-
-    print(f"1. Parseando archivo DIMACS: {FILE_PATH}...")
+    print(f"1. Leyendo archivo DIMACS: {FILE_PATH}...")
     try:
-        adj_list = parse_dimacs_file(output_file_path)
-        N = len(adj_list)
-        E = sum(len(neighbors) for neighbors in adj_list.values()) // 2
-        print(f"   Grafo cargado: {N} nodos, {E} aristas.")
+        # leerGrafo decodifica el .col.b en memoria, sin escribir un .col al lado
+        n, aristas = leerGrafo(FILE_PATH)
     except FileNotFoundError:
         print(f"Error: No se encontró el archivo '{FILE_PATH}'. Asegúrate de que esté en el directorio correcto.")
         exit()
+    adj_list = {i: set() for i in range(1, n + 1)}
+    for u, v in aristas:
+        if u != v:
+            adj_list[u + 1].add(v + 1)
+            adj_list[v + 1].add(u + 1)
+    N = len(adj_list)
+    E = sum(len(neighbors) for neighbors in adj_list.values()) // 2
+    print(f"   Grafo cargado: {N} nodos, {E} aristas.")
 
     #N_NODES = 150
     #DENSITY = 0.5
@@ -363,7 +641,47 @@ if __name__ == "__main__":
     #print(f"Generando grafo aleatorio ({N_NODES} nodos, densidad {DENSITY})...")
     #adj_list = generate_random_graph(N_NODES, DENSITY)
 
+    # Eliminar vértices de grado bajo y dominados antes de la generación de columnas
+    REDUCIR = True
+    if REDUCIR:
+        nodos = sorted(adj_list)
+        indice = {v: i for i, v in enumerate(nodos)}
+        adj0 = [{indice[u] for u in adj_list[v]} for v in nodos]
+        nucleo, pila, cota_clique = reducirColoreo(len(nodos), adj0)
+        en_nucleo = set(nucleo)
+        adj_list = {nodos[v]: {nodos[u] for u in adj0[v] if u in en_nucleo} for v in nucleo}
+        print(f"   Núcleo: {len(adj_list)}/{N} nodos (cota clique = {cota_clique})")
+
+    # Arrancar el maestro con las clases de color de heurísticas rápidas
+    WARM_START = True
+    # Archivo de columnas de una corrida anterior (se lee si existe y se
+    # sobrescribe al terminar), p.ej. FILE_PATH + ".columnas". None = no usar:
+    # así dos corridas seguidas dan el mismo resultado
+    COLUMNAS = None
+    columnas_iniciales = []
+    if WARM_START:
+        columnas_iniciales = columnasHeuristicas(adj_list)
+    if COLUMNAS is not None and os.path.exists(COLUMNAS):
+        columnas_iniciales += leerColumnas(COLUMNAS, adj_list)
+    print(f"   Columnas iniciales: {len(columnas_iniciales)}")
+
     print("Iniciando Generación de Columnas...")
-    cg_solver = GraphColoringCG(adj_list)
+    cg_solver = GraphColoringCG(adj_list, columnas_iniciales=columnas_iniciales)
     final_obj = cg_solver.solve()
-    print(f"\nResultado: {final_obj:.4f}")
\ No newline at end of file
+    if COLUMNAS is not None:
+        cg_solver.guardar_columnas(COLUMNAS)
+    print(f"\nResultado: {final_obj:.4f}")
+    print(f"Cota inferior: {cg_solver.lower_bound:.4f} ({'LP probado' if cg_solver.bound_proven else 'Farley'})")
+    colores, k, metodo = cg_solver.integer_solution()
+    if REDUCIR:
+        # El coloreo es del núcleo: se extiende a los vértices eliminados
+        print(f"Coloreo entero del núcleo: {k} colores ({metodo})")
+        extendido = extenderColoreo({indice[v]: c for v, c in colores.items()}, pila, adj0)
+        colores = {nodos[i]: c for i, c in extendido.items()}
+        k = len(set(colores.values()))
+    print(f"Coloreo entero: {k} colores ({metodo})")
+    estadisticas = cg_solver.get_lp_statistics()
+    print(f"Maestro: {estadisticas['filas']} filas, {estadisticas['columnas']} columnas, "
+          f"{estadisticas['pool']} en el pool ({estadisticas['retiradas']} retiradas, {estadisticas['reingresos']} reingresos)")
+    if REDUCIR:
+        print(f"Cota clique del grafo completo: {cota_clique}")
\ No newline at end of file
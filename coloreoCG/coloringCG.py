@@ -1,10 +1,102 @@
+import math
+import os
+import sys
+import time
 import parserDimacs
 import heuristics
-import pyscipopt
 import mwssRecursion
-from pyscipopt import Model, SCIP_PARAMSETTING
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from conjunto_independiente_max import mwssExacto
+from reducciones_coloreo import reducirColoreo, extenderColoreo
+from descomposicion import mwssPorComponentes
+from matriz_bits import parserDimacsBits
+from cache_resultados import CacheResultados
+from coloreoCG import columnasHeuristicas, leerColumnas, escribirColumnas
+from gestion_columnas import GestorColumnas
+from heuristica_maestro import colorearDesdeColumnas
+from maestro_lp import dualesConsistentes
+from verificacion import verificarColoreo, reporteVerificacion, reducirColores
+
+# Pricer exacto: "recursion" (mwssRecursion), "scip" (modelo por cliques) o
+# "ambos" (se ejecutan los dos, se comparan tiempos y se usa el mejor)
+PRICER_EXACTO = "recursion"
+
+# Tiempo límite total (s) de la generación de columnas. None = sin límite
+TIEMPO_LIMITE = None
+
+# Eliminar vértices de grado bajo y dominados y resolver solo el núcleo
+REDUCIR = False
+
+# Resolver el MWSS exacto por componentes conexas del subgrafo de duales positivos
+DESCOMPONER_PRICING = True
+
+# Guardar la adyacencia en una matriz de bits mapeada en memoria en lugar de
+# un diccionario de sets (grafos densos de miles de vértices)
+MATRIZ_BITS = False
+
+# Directorio de la cache de resultados (None = sin cache). Una configuración
+# ya resuelta se devuelve sin iterar y las columnas guardadas de corridas
+# anteriores se agregan al maestro inicial
+CACHE = None
+
+# Sembrar el maestro con las clases de color (extendidas a estables maximales)
+# de los coloreos greedy, DSATUR y RLF en lugar de solo columnas singleton
+WARM_START = True
+
+# Archivo de columnas de una corrida anterior (se lee si existe y se
+# sobrescribe al terminar). None = no usar
+COLUMNAS_ARCHIVO = None
+
+# Envejecimiento de columnas: iteraciones sin usarse antes de pasar al pool y
+# tope de columnas activas en el maestro (None = sin límite)
+EDAD_MAXIMA = 20
+MAX_COLUMNAS = None
+
+# Tiempo límite (s) del cubrimiento entero sobre las columnas generadas
+TIEMPO_IP = 10.0
+
+# Segundos de post-optimización (Kempe y greedy iterado) del coloreo final
+# cuando no se probó óptimo. None = no post-optimizar
+TIEMPO_POST = 1.0
+
+def leerDuales(model, n_nodos, nodes_weights):
+    """Copia en nodes_weights el dual de la restricción de cobertura de cada vértice."""
+    for v in range(n_nodos):
+        pi = model.getDualsolLinear(model.getConss()[v])
+        nodes_weights[v+1] = 0.0 if pi > 1e15 else pi
+
+def agregarColumna(model, constraints, columna):
+    """Agrega la columna (conjunto estable) al maestro; el nombre son sus vértices."""
+    varName = ''.join(str(val)+"_" for val in columna)
+    var = model.addVar(name=varName, vtype="C", obj=1.0, lb=0.0, ub=None)
+    for v in columna:
+        model.addConsCoeff(constraints[v], var, 1.0)
+    return var
+
+def retirarColumnas(model, constraints, gestor, claves):
+    """Saca del maestro las columnas (por nombre de variable) y las pasa al pool."""
+    claves = set(claves)
+    for var in model.getVars():
+        # El nombre se lee antes de delVar: después SCIP ya liberó la variable
+        clave = var.name
+        if clave in claves:
+            for v in gestor.activas[clave]:
+                model.delCoefLinear(constraints[v], var)
+            model.delVar(var)
+            gestor.retirar(clave)
+
+def mwssRecursionComponente(adj_c, pesos_c):
+    return mwssRecursion.mwssRecursion(S={}, F=dict(pesos_c), X=set(), adj=adj_c, maxIt=200000)
+
+def mwssExactoComponente(adj_c, pesos_c):
+    S, w, _ = mwssExacto(adj_c, pesos_c)
+    return S, w
 
 if __name__ == "__main__":
+    # SCIP solo hace falta para el maestro: se importa al correr el script
+    import pyscipopt
+    from pyscipopt import Model, SCIP_PARAMSETTING
 
     #n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/grafoTest")
     #n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/DSJC125.1.col") # Mejor K Heuristicas: 8 - Mejor k MWSS = 7 - Mejor conocido = ?
@@ -12,7 +104,10 @@ if __name__ == "__main__":
     #n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/DSJC250.9.col") # Mejor k Heuristicas = 95 - Mejor k MWSS = 86 - Mejor conocido = 71
     #n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/flat300_20_0.col") # Mejor k Heuristicas = 43 - Mejor k MWSS = 20 - Mejor conocido = 20
     n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/le450_5c.col") # Mejor k heuristicas = 11 - Mejor k MWSS = 10 - Mejor conocido = 5
-    n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/queen12_12.col") # Mejor k heuristicas = 19 - Mejor k MWSS = 15 - Mejor conocido = 12
+    if MATRIZ_BITS:
+        n_nodos, n_aristas, adj = parserDimacsBits("coloreoCG/queen12_12.col")
+    else:
+        n_nodos, n_aristas, adj = parserDimacs.parserDimacs("coloreoCG/queen12_12.col") # Mejor k heuristicas = 19 - Mejor k MWSS = 15 - Mejor conocido = 12
 
     g_densidad = (2*n_aristas)/(n_nodos*(n_nodos-1))
 
@@ -22,6 +117,33 @@ if __name__ == "__main__":
     #for i in adj:
         #print(f"Vecinos de {i}: {adj.get(i)}")
 
+    cache = CacheResultados(CACHE) if CACHE else None
+    parametros = {"pricer": PRICER_EXACTO, "reducir": REDUCIR, "descomponer_pricing": DESCOMPONER_PRICING,
+                  "tiempo": TIEMPO_LIMITE}
+    n_grafo = n_nodos
+    columnas_cache = []
+    if cache is not None:
+        aristas_grafo = [(v-1, u-1) for v in adj for u in adj[v] if v < u]
+        registro = cache.buscar(n_grafo, aristas_grafo, "cg", parametros)
+        if registro is not None:
+            print(f"Resultado en cache ({registro['fecha']}): cota LP = {registro['cota_lp']}")
+            print(f"s {registro['status']} {registro['k']}")
+            sys.exit(0)
+        # Columnas de corridas con la misma numeración (con o sin reducción)
+        for otro in cache.registros(n_grafo, aristas_grafo).values():
+            if otro["motor"] == "cg" and otro["parametros"].get("reducir") == REDUCIR and otro["columnas"]:
+                columnas_cache.extend(tuple(c) for c in otro["columnas"])
+
+    if REDUCIR:
+        # El núcleo se renumera de 1 a k para mantener el maestro indexado por vértice
+        adj0 = [{u-1 for u in adj[v]} for v in range(1, n_nodos+1)]
+        nucleo, pila, cota_clique = reducirColoreo(n_nodos, adj0)
+        renumerado = {v: i+1 for i, v in enumerate(nucleo)}
+        adj = {renumerado[v]: {renumerado[u] for u in adj0[v] if u in renumerado} for v in nucleo}
+        n_original = n_nodos
+        n_nodos = len(nucleo)
+        print(f"Núcleo: {n_nodos}/{n_original} nodos (cota clique = {cota_clique})")
+
     model = pyscipopt.Model("ColoringCG")
 
     model.setPresolve(0)
@@ -31,8 +153,11 @@ if __name__ == "__main__":
     model.setParam("propagating/maxrounds",0)
     model.setParam("separating/maxrounds",0)
     model.setParam("lp/presolving",0)
+    # Sin cutoff en el LP: al liberar la transformación SCIP conserva la
+    # solución anterior y, si el LP vale lo mismo (p.ej. el coloreo entero
+    # del warm start), corta el LP sin dejar duales (todos en 0)
+    model.setParam("lp/disablecutoff",1)
 
-    #model.setParam("limits/time", 20) # Limitamos el tiempo de ejecución
 
     model.hideOutput()
 
@@ -42,33 +167,85 @@ if __name__ == "__main__":
     variables = []
     nodes_weights = {}
     color_asign = {}
+    gestor = GestorColumnas(edad_maxima=EDAD_MAXIMA, max_columnas=MAX_COLUMNAS)
 
     # Problema maestro restringido
     for v in range(1,n_nodos+1):
-        var = model.addVar(name=f"{v}_", vtype="C", lb=0.0, ub=1.0, obj=1.0)
+        # Sin cota superior: x <= 1 sobra en el cubrimiento, pero con la cota
+        # activa parte del dual queda en ella y los duales de las filas no
+        # suman el valor del LP
+        var = model.addVar(name=f"{v}_", vtype="C", lb=0.0, ub=None, obj=1.0)
         variables.append(var)
 
         cons = model.addCons(var >= 1, name=f"cover_{v}", separate=False,modifiable=True,removable=False)
         constraints[v] = cons
+        gestor.registrar(var.name, (v,), protegida=True)
 
         nodes_weights[v] = 0
         color_asign[v] = v
 
+    # Las columnas de la cache se revisan contra el grafo actual (el núcleo si
+    # REDUCIR) igual que las del archivo en leerColumnas
+    estables = [c for c in columnas_cache
+                if all(v in adj for v in c) and not any(adj[v] & set(c) for v in c)]
+    if len(estables) < len(columnas_cache):
+        print(f"Columnas de la cache descartadas: {len(columnas_cache) - len(estables)}")
+    columnas_cache = estables
+
+    if WARM_START:
+        columnas_cache.extend(tuple(sorted(c)) for c in columnasHeuristicas(adj))
+    if COLUMNAS_ARCHIVO is not None and os.path.exists(COLUMNAS_ARCHIVO):
+        columnas_cache.extend(tuple(sorted(c)) for c in leerColumnas(COLUMNAS_ARCHIVO, adj))
+
+    # Columnas iniciales: cache, heurísticas y archivo (se omiten las singleton, que ya están)
+    for columna in sorted(set(columnas_cache)):
+        if len(columna) > 1:
+            var = agregarColumna(model, constraints, columna)
+            gestor.registrar(var.name, columna)
+    if columnas_cache:
+        print(f"Columnas iniciales: {len(set(columnas_cache))}")
+
     model.optimize()
 
 
     max_it = 100
     i=0
+    # Pasa a True si el pricing exacto no encuentra columnas: el LP es cota inferior
+    lp_probado = False
+    inicio = time.perf_counter()
     while(i<=max_it):
+        if TIEMPO_LIMITE is not None and time.perf_counter() - inicio > TIEMPO_LIMITE:
+            print(f"Tiempo límite alcanzado ({TIEMPO_LIMITE}s)")
+            break
         print(f"Iteración {i}")
         model.optimize()
         if model.getStatus() != 'optimal':
             print(f"ADVERTENCIA: EL LP NO ÓPTIMO. ESTADO:{model.getStatus()}")
         print(f"{model.getStatus()}")
-        for v in range(n_nodos):
-            pi = model.getDualsolLinear(model.getConss()[v])
-            if pi > 1e15: nodes_weights[v+1] = 0.0
-            else : nodes_weights[v+1] = pi
+        leerDuales(model, n_nodos, nodes_weights)
+        # Solo con duales que cumplen dualidad fuerte el MWSS prueba el LP.
+        # Si SCIP no los dejó bien (p.ej. todos en 0) se resuelve de nuevo
+        duales_validos = dualesConsistentes(nodes_weights, model.getObjVal())
+        if not duales_validos:
+            model.freeTransform()
+            model.optimize()
+            leerDuales(model, n_nodos, nodes_weights)
+            duales_validos = dualesConsistentes(nodes_weights, model.getObjVal())
+            if not duales_validos:
+                print("ADVERTENCIA: duales inconsistentes con el valor del LP, la cota no queda probada")
+
+        # Edad de las columnas y reingreso desde el pool antes del pricing
+        retirar = gestor.actualizar({var.name: model.getVal(var) for var in model.getVars()}, nodes_weights)
+        reingresos = gestor.reingresar(nodes_weights)
+        if reingresos:
+            print(f"Reingresan {len(reingresos)} columnas del pool")
+            model.freeTransform()
+            retirarColumnas(model, constraints, gestor, retirar)
+            for columna in reingresos:
+                var = agregarColumna(model, constraints, columna)
+                gestor.registrar(var.name, columna)
+            i=i+1
+            continue
 
         bestW = 0.0
         bestS = []
@@ -104,29 +281,44 @@ if __name__ == "__main__":
         '''
         if bestW > 1:
             print(f"Se encontró una columna S:{bestS} - w:{bestW} con {bestStrat}")
-            varName = ''.join(str(val)+"_" for val in bestS)
             model.freeTransform()
-            new_col_var = model.addVar( name=varName,vtype="C", obj=0.0, lb=0.0, ub=1.0)
-            for v in bestS:
-                model.addConsCoeff(model.getConss()[v-1], new_col_var, 1.0)
+            retirarColumnas(model, constraints, gestor, retirar)
+            new_col_var = agregarColumna(model, constraints, bestS)
+            gestor.registrar(new_col_var.name, bestS)
         else:      
                  
             print("Ejecutando MWSS Exacto")
-            S = {}
-            F = dict(nodes_weights) # {1,1,....,1} en la primer iteración
-            X = set()
-            mwssSol,mwssW = mwssRecursion.mwssRecursion(S=S,F=F,X=X,adj=adj,maxIt=200000)
+            mwssSol, mwssW = (), 0.0
+            if PRICER_EXACTO in ("recursion", "ambos"):
+                t0 = time.perf_counter()
+                if DESCOMPONER_PRICING:
+                    mwssSol, mwssW = mwssPorComponentes(adj, nodes_weights, mwssRecursionComponente)
+                else:
+                    S = {}
+                    F = dict(nodes_weights) # {1,1,....,1} en la primer iteración
+                    X = set()
+                    mwssSol,mwssW = mwssRecursion.mwssRecursion(S=S,F=F,X=X,adj=adj,maxIt=200000)
+                print(f"Tiempo mwssRecursion: {time.perf_counter() - t0:.3f}s")
+            if PRICER_EXACTO in ("scip", "ambos"):
+                t0 = time.perf_counter()
+                if DESCOMPONER_PRICING:
+                    scipSol, scipW = mwssPorComponentes(adj, nodes_weights, mwssExactoComponente)
+                else:
+                    scipSol, scipW, _ = mwssExacto(adj, nodes_weights)
+                print(f"Tiempo MWSS SCIP: {time.perf_counter() - t0:.3f}s")
+                if scipW > mwssW:
+                    mwssSol, mwssW = scipSol, scipW
             print(f"MWSS S{mwssSol}")
             print(f"MWSW S{mwssW}")
 
             model.freeTransform()
             if mwssW > 1.0:
                 print("Agrego Columna por MWSS")
-                varName = ''.join(str(val)+"_" for val in mwssSol)         
-                new_mwss = model.addVar( name=varName,vtype="C", obj=0.0, lb=0.0, ub=1.0)
-                for v in mwssSol:
-                    model.addConsCoeff(model.getConss()[v-1], new_mwss, 1.0)
+                retirarColumnas(model, constraints, gestor, retirar)
+                new_mwss = agregarColumna(model, constraints, mwssSol)
+                gestor.registrar(new_mwss.name, mwssSol)
             else:
+                lp_probado = duales_validos
                 break
             
             #break
@@ -135,33 +327,63 @@ if __name__ == "__main__":
     model.optimize()
 
     print(f"ITERACIONES: {i}")
+    estadisticas = gestor.estadisticas()
+    print(f"Columnas activas: {estadisticas['activas']} - Pool: {estadisticas['pool']} "
+          f"({estadisticas['retiradas']} retiradas, {estadisticas['reingresos']} reingresos)")
 
     solucion = model.getBestSol()
-    solution_dict = {}
     variables = model.getVars()
-    for var in variables:
-        solution_dict[var.name] = model.getSolVal(solucion,var)
-    
-    stableSets = dict({key:value for key,value in solution_dict.items() if value > 0.0})
-    
-    color = 0
-    for sol in stableSets:
-        color += 1
-        nodes = sol.split('_')
-        nodes.pop()
-        for node in nodes:
-            intNode = int(node)
-            color_asign[intNode] = color
+    columnas = [[int(node) for node in var.name.split('_')[:-1]] for var in variables]
+    valores = [model.getSolVal(solucion, var) for var in variables]
+    stableSets = {var.name: x for var, x in zip(variables, valores) if x > 0.0}
+
+    # Coloreo entero: redondeo, buceo y cubrimiento entero sobre las columnas
+    # generadas y las del pool (un vértice cubierto por varias columnas queda
+    # en una sola, así que el coloreo es válido y k es el de la partición)
+    pool = [sorted(c) for c in gestor.pool]
+    cota_lp = model.getObjVal() if lp_probado else None
+    colores, color, metodo = colorearDesdeColumnas(adj, columnas + pool, valores + [0.0] * len(pool),
+                                                   tiempo_limite=TIEMPO_IP, cota_inferior=cota_lp)
+    print(f"Coloreo entero: {color} colores ({metodo})")
+    color_asign = {v: colores[v]+1 for v in sorted(colores)}
+
+    if REDUCIR:
+        # Coloreamos los vértices eliminados en orden inverso
+        coloresNucleo = {nucleo[v-1]: c for v, c in color_asign.items()}
+        completo = extenderColoreo(coloresNucleo, pila, adj0)
+        color_asign = {v+1: completo[v]+1 for v in range(n_original)}
+        color = len(set(color_asign.values()))
 
     #Salida
     # Exito: s optimal <k> o s feasible <k>
     # No existe: s unsatisfiable
     # v <node_id> <color_id>
 
+    # Óptimo si el LP está probado y k alcanza su redondeo hacia arriba
+    status = "optimal" if lp_probado and color <= math.ceil(model.getObjVal() - 1e-6) else "feasible"
+
+    # Verificación sobre el grafo completo (numeración 0..n-1)
+    n_total = n_original if REDUCIR else n_nodos
+    adj_total = adj0 if REDUCIR else [{u-1 for u in adj[v]} for v in range(1, n_total+1)]
+    lista = [color_asign[v+1]-1 for v in range(n_total)]
+    verificacion = verificarColoreo(n_total, [(v, u) for v in range(n_total) for u in adj_total[v] if v < u], lista)
+    print(reporteVerificacion(verificacion, color))
+    if not verificacion["valido"]:
+        status = "unknown"
+    elif TIEMPO_POST is not None and status != "optimal":
+        # Kempe y greedy iterado mantienen el coloreo válido
+        lista = reducirColores(n_total, adj_total, lista, tiempo_limite=TIEMPO_POST)
+        if max(lista, default=-1) + 1 < color:
+            print(f"Post-optimización: {color} -> {max(lista) + 1} colores")
+            color_asign = {v+1: lista[v]+1 for v in range(n_total)}
+            color = max(lista) + 1
+            if lp_probado and color <= math.ceil(model.getObjVal() - 1e-6):
+                status = "optimal"
+
     output_comment = 'c Coloreo generado por coloreo HCS'
-    output_status = 's ' + model.getStatus() + " " + str(color)
+    output_status = 's ' + status + " " + str(color) if status != "unknown" else 's unknown'
     output_coloring = ''
-    for node in color_asign:
+    for node in (color_asign if status != "unknown" else ()):
         output_coloring += "v "+ str(node) + " " + str(color_asign[node]) + "\n"
     #print(output_comment)
     print(output_status)
@@ -173,4 +395,13 @@ if __name__ == "__main__":
     with open("oputputHCS", 'w') as f:
         f.write(output_comment+"\n")
         f.write(output_status+"\n")
-        f.write(output_coloring)
\ No newline at end of file
+        f.write(output_coloring)
+
+    if COLUMNAS_ARCHIVO is not None:
+        escribirColumnas(COLUMNAS_ARCHIVO, [[int(node) for node in var.name.split('_')[:-1]] for var in model.getVars()])
+
+    if cache is not None:
+        columnas = [[int(node) for node in var.name.split('_')[:-1]] for var in model.getVars()]
+        cache.guardar(n_grafo, aristas_grafo, "cg", parametros, status=status,
+                      colores=[color_asign[v] for v in range(1, n_grafo+1)], cota_lp=cota_lp,
+                      columnas=columnas, tiempo=time.perf_counter() - inicio)
\ No newline at end of file
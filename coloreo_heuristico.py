@@ -0,0 +1,115 @@
+"""
+Heurísticas rápidas de coloreo. Sirven como cota superior inicial para los
+modelos exactos. Los vértices se numeran de 0 a n-1 y adj[v] es el set de
+vecinos de v.
+"""
+
+def coloreoGreedy(n, adj, orden=None):
+    """
+    Coloreo first-fit: cada vértice toma el menor color no usado por sus
+    vecinos ya coloreados. Por defecto se recorre por grado decreciente
+    (Welsh-Powell). Devuelve la lista de colores (0..k-1) de cada vértice.
+    """
+    if orden is None:
+        orden = sorted(range(n), key=lambda v: len(adj[v]), reverse=True)
+    colores = [-1] * n
+    for v in orden:
+        usados = {colores[u] for u in adj[v]}
+        c = 0
+        while c in usados:
+            c += 1
+        colores[v] = c
+    return colores
+
+def cantidadColores(colores):
+    """Cantidad de colores distintos de un coloreo."""
+    return len(set(c for c in colores if c >= 0))
+
+def coloreoValido(n, aristas, colores):
+    """True si colores asigna un color a cada vértice y ninguna arista es monocromática."""
+    if colores is None or len(colores) != n or any(c is None or c < 0 for c in colores):
+        return False
+    return all(u == v or colores[u] != colores[v] for u, v in aristas)
+
+def coloreoDSATUR(n, adj):
+    """
+    DSATUR: en cada paso se colorea el vértice con más colores distintos entre
+    sus vecinos (saturación), desempatando por grado. Devuelve la lista de colores.
+    """
+    colores = [-1] * n
+    saturacion = [set() for _ in range(n)]
+    sin_color = set(range(n))
+    while sin_color:
+        v = max(sin_color, key=lambda u: (len(saturacion[u]), len(adj[u])))
+        c = 0
+        while c in saturacion[v]:
+            c += 1
+        colores[v] = c
+        sin_color.discard(v)
+        for u in adj[v]:
+            saturacion[u].add(c)
+    return colores
+
+def coloreoRLF(n, adj):
+    """
+    Recursive Largest First: arma una clase de color por vez. Empieza por el
+    vértice sin colorear de mayor grado y agrega el candidato con más vecinos
+    entre los vértices ya excluidos de la clase. Devuelve la lista de colores.
+    """
+    colores = [-1] * n
+    sin_color = set(range(n))
+    c = 0
+    while sin_color:
+        candidatos = set(sin_color)
+        excluidos = set()
+        v = max(candidatos, key=lambda u: len(adj[u] & sin_color))
+        while v is not None:
+            colores[v] = c
+            candidatos.discard(v)
+            nuevos = adj[v] & candidatos
+            candidatos -= nuevos
+            excluidos |= nuevos
+            if not candidatos:
+                break
+            v = max(candidatos, key=lambda u: (len(adj[u] & excluidos), -len(adj[u] & candidatos)))
+        sin_color = {u for u in sin_color if colores[u] < 0}
+        c += 1
+    return colores
+
+# Heurísticas disponibles por nombre
+HEURISTICAS = {
+    "greedy": coloreoGreedy,
+    "dsatur": coloreoDSATUR,
+    "rlf": coloreoRLF,
+}
+
+def clasesDeColor(colores):
+    """Clases de color como lista de sets de vértices."""
+    clases = {}
+    for v, c in enumerate(colores):
+        clases.setdefault(c, set()).add(v)
+    return list(clases.values())
+
+def extenderMaximal(clase, adj, orden):
+    """Agrega a la clase (conjunto estable) los vértices de orden que no tienen vecinos en ella."""
+    estable = set(clase)
+    for v in orden:
+        if v not in estable and not (adj[v] & estable):
+            estable.add(v)
+    return estable
+
+def conjuntosEstablesIniciales(n, adj, heuristicas=("greedy", "dsatur", "rlf")):
+    """
+    Clases de color de las heurísticas pedidas, extendidas a conjuntos
+    estables maximales y sin repetidos. Sirven como columnas iniciales de la
+    generación de columnas. Devuelve (lista de frozensets, mejor k).
+    """
+    orden = sorted(range(n), key=lambda v: len(adj[v]))
+    columnas = set()
+    mejor_k = n
+    for nombre in heuristicas:
+        colores = HEURISTICAS[nombre](n, adj)
+        mejor_k = min(mejor_k, cantidadColores(colores))
+        for clase in clasesDeColor(colores):
+            columnas.add(frozenset(extenderMaximal(clase, adj, orden)))
+    return sorted(columnas, key=sorted), mejor_k
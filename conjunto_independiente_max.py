@@ -1,48 +1,60 @@
 import argparse
-from pyscipopt import Model
+import time
+from modelos import agregarRestricciones, reporteConstruccion
+from grafos import listaAdyacencia, cubrimientoCliquesAristas
+from dimacs import leerGrafo
+from reducciones_mis import reducirMIS, levantarSolucion
 
 def parserDimacs(path):
-    n = None
-    aristas = []
-    max_index = -1
+    """Lee un grafo DIMACS (.col o .col.b) en una sola pasada y devuelve (n, aristas)."""
+    return leerGrafo(path)
+
+def leerPesos(path):
+    """Lee los pesos de los vértices, un valor por línea (vértice 1, 2, ...)."""
+    pesos = []
     with open(path, 'r') as f:
         for line in f:
             line = line.strip()
-            if not line or line[0] == 'c':
-                continue
-            parts = line.split()
-            if parts[0] == 'p' and len(parts) >= 4:
-                try:
-                    n = int(parts[2])
-                except:
-                    n = None
-            elif parts[0] == 'e' and len(parts) >= 3:
-                try:
-                    u = int(parts[1]) - 1
-                    v = int(parts[2]) - 1
-                    aristas.append((u,v))
-                    max_index = max(max_index, u, v)
-                except ValueError:
-                    continue
-    if n is None:
-        if max_index >= 0:
-            n = max_index + 1
-        else:
-            n = 0
-    return n, aristas
-
-def getConjuntoIndependienteMax(n, aristas):
+            if line and line[0] != 'c':
+                pesos.append(float(line.split()[-1]))
+    return pesos
+
+def construirModeloMIS(n, aristas, pesos=None, cliques=False):
+    """
+    Arma el modelo de conjunto independiente máximo (o de peso máximo).
+    Con cliques=True las restricciones por arista se reemplazan por un
+    cubrimiento greedy de aristas por cliques: sum x[i] <= 1 para i en K,
+    que da una relajación lineal más fuerte.
+    """
+    from pyscipopt import Model, quicksum
+
     model = Model("ConjuntoIndependienteMax")
 
     # Variable binaria Xi indica si el nodo i pertenece al conjunto independiente.
     x = [model.addVar(vtype="B", name=f"x_{i}") for i in range(n)]
 
     # Si dos nodos son vecinos no pueden pertenecer a un conjunto independiente.
-    for u,v in aristas:
-        model.addCons(x[u] + x[v] <= 1)
+    if cliques:
+        adj = listaAdyacencia(n, aristas)
+        cubrimiento = cubrimientoCliquesAristas(set(range(n)), adj)
+        agregarRestricciones(model, (quicksum(x[i] for i in K) <= 1 for K in cubrimiento))
+    else:
+        agregarRestricciones(model, (x[u] + x[v] <= 1 for u,v in aristas))
+
+    # Se busca maximizar el tamaño (o el peso) del conjunto independiente.
+    if pesos is None:
+        model.setObjective(quicksum(x), "maximize")
+    else:
+        model.setObjective(quicksum(pesos[i]*x[i] for i in range(n)), "maximize")
 
-    # Se busca maximizar el tamaño del conjunto independiente.
-    model.setObjective(sum(x), "maximize")
+    return model, x
+
+def getConjuntoIndependienteMax(n, aristas, reporte=False, pesos=None, cliques=False):
+    inicio = time.perf_counter()
+    model, x = construirModeloMIS(n, aristas, pesos=pesos, cliques=cliques)
+
+    if reporte:
+        reporteConstruccion(model, inicio)
 
     model.optimize()
 
@@ -58,17 +70,84 @@ def getConjuntoIndependienteMax(n, aristas):
     
     return conjuntoFinal
 
+def mwssExacto(adj, pesos, tiempo_limite=None):
+    """
+    Oráculo exacto de pricing (MWSS) con SCIP y formulación por cliques.
+    adj: diccionario vértice -> set de vecinos, pesos: diccionario vértice -> peso
+    (por ejemplo los duales del maestro). Solo se consideran pesos positivos.
+    Devuelve (S, peso, optimo) con S como tupla ordenada.
+    """
+    vertices = [v for v in adj if pesos[v] > 1e-9]
+    if not vertices:
+        return (), 0.0, True
+    indice = {v: i for i, v in enumerate(vertices)}
+    aristasPos = [(indice[u], indice[v]) for u in vertices for v in adj[u] if v in indice and indice[u] < indice[v]]
+
+    model, x = construirModeloMIS(len(vertices), aristasPos, pesos=[pesos[v] for v in vertices], cliques=True)
+    model.hideOutput()
+    if tiempo_limite is not None:
+        model.setParam("limits/time", tiempo_limite)
+    model.optimize()
+
+    sol = model.getBestSol()
+    if sol is None:
+        return (), 0.0, False
+    S = [vertices[i] for i, var in enumerate(x) if model.getSolVal(sol, var) > 0.5]
+    optimo = model.getStatus() == "optimal"
+    return tuple(sorted(S)), sum(pesos[v] for v in S), optimo
+
+def getConjuntoIndependienteReducido(n, aristas, reporte=False, pesos=None, cliques=False):
+    """
+    Aplica las reducciones exactas de reducciones_mis y resuelve con SCIP
+    solo el kernel. La solución se levanta al grafo original.
+    """
+    adj = listaAdyacencia(n, aristas)
+    kernel, pesosKernel, offset, pila = reducirMIS({v: adj[v] for v in range(n)},
+                                                   None if pesos is None else {v: pesos[v] for v in range(n)})
+
+    m_kernel = sum(len(vecinos) for vecinos in kernel.values()) // 2
+    m = sum(len(vecinos) for vecinos in adj) // 2
+    print(f"Kernel: {len(kernel)}/{n} vértices, {m_kernel}/{m} aristas, peso fijado por reducciones: {offset:g}")
+
+    # Renumeramos el kernel de 0 a k-1 para el modelo
+    vertices = list(kernel)
+    indice = {v: i for i, v in enumerate(vertices)}
+    aristasKernel = [(indice[u], indice[v]) for u in vertices for v in kernel[u] if indice[u] < indice[v]]
+    pesosLista = [pesosKernel[v] for v in vertices]
+
+    solucionKernel = []
+    if vertices:
+        elegidos = getConjuntoIndependienteMax(len(vertices), aristasKernel, reporte=reporte, pesos=pesosLista, cliques=cliques)
+        solucionKernel = [vertices[i-1] for i in elegidos]
+
+    return sorted(v+1 for v in levantarSolucion(solucionKernel, pila))
+
 def main():
     parser = argparse.ArgumentParser(description="Conjunto Independiente Máximo")
     parser.add_argument("input", help="Grafo en formato DIMACS")
+    parser.add_argument("--reporte", action="store_true", help="Reportar tiempo de construcción, filas, no ceros y memoria del modelo")
+    parser.add_argument("--reducir", action="store_true", help="Aplicar reducciones exactas y resolver solo el kernel")
+    parser.add_argument("--pesos", "-w", default=None, help="Archivo con pesos (una línea por vértice)")
+    parser.add_argument("--cliques", action="store_true", help="Reemplazar las restricciones por arista por un cubrimiento de cliques")
     args = parser.parse_args()
 
     n, aristas = parserDimacs(args.input)
     print(f"Vertices: {n}, Aristas: {len(aristas)}")
 
-    result = getConjuntoIndependienteMax(n, aristas)
+    pesos = None
+    if args.pesos:
+        pesos = leerPesos(args.pesos)
+        if len(pesos) < n:
+            parser.error(f"El archivo de pesos tiene {len(pesos)} valores y el grafo {n} vértices")
+
+    if args.reducir:
+        result = getConjuntoIndependienteReducido(n, aristas, reporte=args.reporte, pesos=pesos, cliques=args.cliques)
+    else:
+        result = getConjuntoIndependienteMax(n, aristas, reporte=args.reporte, pesos=pesos, cliques=args.cliques)
 
     print(f"Tamaño del conjunto independiente: {len(result)}")
+    if pesos is not None:
+        print(f"Peso del conjunto independiente: {sum(pesos[v-1] for v in result):g}")
     print("Nodos: ")
     if result:
         print(" ".join(map(str,result)))
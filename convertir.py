@@ -0,0 +1,41 @@
+"""
+Conversión entre los formatos DIMACS ASCII (.col) y binario (.col.b).
+El sentido se deduce de la extensión de la entrada: un .col.b se convierte a
+.col y cualquier otro archivo a .col.b. Los comentarios se conservan.
+"""
+import argparse
+import os
+import time
+
+from dimacs import leerGrafo, escribirDimacsBinario, escribirDimacsTexto, comentariosDimacs
+
+def convertir(entrada, salida=None):
+    """Convierte entrada al otro formato y devuelve el path de salida."""
+    binario = entrada.endswith('.b')
+    if salida is None:
+        salida = entrada[:-2] if binario else entrada + '.b'
+    n, aristas = leerGrafo(entrada)
+    comentarios = comentariosDimacs(entrada)
+    if binario:
+        escribirDimacsTexto(salida, n, aristas, comentarios)
+    else:
+        escribirDimacsBinario(salida, n, aristas, comentarios)
+    return salida
+
+def main():
+    parser = argparse.ArgumentParser(description="Convierte grafos DIMACS entre .col y .col.b")
+    parser.add_argument("entradas", nargs="+", help="Archivos .col o .col.b")
+    parser.add_argument("--out", "-o", default=None, help="Archivo de salida (solo con una entrada)")
+    args = parser.parse_args()
+
+    if args.out is not None and len(args.entradas) > 1:
+        parser.error("--out solo se puede usar con una única entrada")
+
+    for entrada in args.entradas:
+        inicio = time.perf_counter()
+        salida = convertir(entrada, args.out)
+        print(f"{entrada} ({os.path.getsize(entrada)} bytes) -> {salida} ({os.path.getsize(salida)} bytes) "
+              f"en {time.perf_counter() - inicio:.2f}s")
+
+if __name__ == "__main__":
+    main()
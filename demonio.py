@@ -0,0 +1,292 @@
+"""
+Modo servidor: un proceso de larga duración que recibe trabajos en líneas
+JSON por entrada estándar o por un socket Unix. pyscipopt se importa una sola
+vez y los grafos leídos y los modelos construidos quedan en memoria entre
+trabajos, así que pedidos chicos sobre las mismas instancias no pagan el
+arranque del proceso, la lectura del grafo ni la construcción del modelo.
+
+Cada pedido es un objeto JSON con "id" y "op":
+    {"id": 1, "op": "cargar", "grafo": "DSJC125.1.col"}
+    {"id": 2, "op": "heuristica", "grafo": "DSJC125.1.col"}
+    {"id": 3, "op": "resolver", "grafo": "DSJC125.1.col", "motor": "conjestables", "tiempo": 10}
+    {"id": 4, "op": "cancelar", "trabajo": 3}
+    {"id": 5, "op": "estado"}
+    {"id": 6, "op": "olvidar", "grafo": "DSJC125.1.col"}
+    {"id": 7, "op": "salir"}
+Las respuestas llevan el mismo "id" con "ok": true/false. Los trabajos de
+"resolver" corren en un hilo aparte, emiten {"id", "evento": "incumbente"}
+con cada mejora y se pueden cancelar. Si se vuelve a pedir el mismo motor
+sobre el mismo grafo, SCIP continúa el modelo guardado desde donde cortó el
+límite anterior.
+"""
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+
+from dimacs import leerGrafo
+from grafos import listaAdyacencia
+from coloreo_heuristico import coloreoGreedy, cantidadColores
+
+# Motores que usan un modelo de coloreo.py y pueden guardarse entre trabajos
+MOTORES_MODELO = ("tradicional", "conjestables", "representantes")
+
+class Demonio:
+    """Estado compartido entre trabajos: grafos, modelos y trabajos en curso."""
+
+    def __init__(self):
+        self.grafos = {}      # path -> (mtime, n, aristas, adj, k_greedy)
+        self.modelos = {}     # (path, motor) -> entrada del modelo
+        self.trabajos = {}    # id -> threading.Event de cancelación
+        self.candado = threading.Lock()
+        self.terminar = threading.Event()
+
+    def esperar(self):
+        """Espera a que terminen los trabajos en curso."""
+        while True:
+            with self.candado:
+                if not self.trabajos:
+                    return
+            time.sleep(0.1)
+
+    def grafo(self, path):
+        """Devuelve el grafo en memoria; se vuelve a leer si el archivo cambió."""
+        mtime = os.path.getmtime(path)
+        with self.candado:
+            guardado = self.grafos.get(path)
+            if guardado is not None and guardado[0] == mtime:
+                return guardado
+        n, aristas = leerGrafo(path)
+        adj = listaAdyacencia(n, aristas)
+        k_greedy = cantidadColores(coloreoGreedy(n, adj))
+        guardado = (mtime, n, aristas, adj, k_greedy)
+        with self.candado:
+            if path in self.grafos and self.grafos[path][0] != mtime:
+                # El grafo cambió: los modelos construidos ya no sirven
+                for clave in [c for c in self.modelos if c[0] == path]:
+                    del self.modelos[clave]
+            self.grafos[path] = guardado
+        return guardado
+
+    def modelo(self, path, motor, n, aristas, k_greedy):
+        """Entrada del modelo guardado para (path, motor), construyéndolo si hace falta."""
+        clave = (path, motor)
+        with self.candado:
+            entrada = self.modelos.get(clave)
+            if entrada is not None:
+                return entrada, True
+        import coloreo
+
+        if motor == "tradicional":
+            model, variables = coloreo.construirTradicional(n, aristas, max_colors=k_greedy)
+            extraer = coloreo.solucionTradicional
+        elif motor == "conjestables":
+            model, variables = coloreo.construirConjEstables(n, aristas, max_colors=k_greedy)
+            extraer = coloreo.solucionConjEstables
+        else:
+            model, variables = coloreo.construirRepresentantes(n, aristas)
+            extraer = coloreo.solucionRepresentantes
+        model.hideOutput()
+        entrada = {"model": model, "variables": variables, "extraer": extraer, "manejadores": {},
+                   "candado": threading.Lock(), "status": None, "colores": None}
+        with self.candado:
+            entrada = self.modelos.setdefault(clave, entrada)
+        return entrada, False
+
+    def procesar(self, pedido, responder):
+        """Atiende un pedido. Los trabajos de resolución se lanzan en un hilo."""
+        ident = pedido.get("id")
+        op = pedido.get("op")
+        try:
+            if op == "cargar":
+                _, n, aristas, _, k_greedy = self.grafo(pedido["grafo"])
+                responder({"id": ident, "ok": True, "n": n, "m": len(aristas), "k_greedy": k_greedy})
+            elif op == "heuristica":
+                _, n, _, adj, _ = self.grafo(pedido["grafo"])
+                colores = coloreoGreedy(n, adj)
+                responder({"id": ident, "ok": True, "k": cantidadColores(colores), "coloreo": colores})
+            elif op == "resolver":
+                cancelar = threading.Event()
+                with self.candado:
+                    self.trabajos[ident] = cancelar
+                hilo = threading.Thread(target=self.trabajoResolver, args=(pedido, cancelar, responder), daemon=True)
+                hilo.start()
+            elif op == "cancelar":
+                with self.candado:
+                    cancelar = self.trabajos.get(pedido.get("trabajo"))
+                if cancelar is not None:
+                    cancelar.set()
+                responder({"id": ident, "ok": cancelar is not None})
+            elif op == "estado":
+                with self.candado:
+                    responder({"id": ident, "ok": True, "grafos": sorted(self.grafos),
+                               "modelos": [{"grafo": p, "motor": m, "status": e["status"]}
+                                           for (p, m), e in self.modelos.items()],
+                               "trabajos": sorted(self.trabajos, key=str)})
+            elif op == "olvidar":
+                path = pedido["grafo"]
+                with self.candado:
+                    self.grafos.pop(path, None)
+                    for clave in [c for c in self.modelos if c[0] == path]:
+                        del self.modelos[clave]
+                responder({"id": ident, "ok": True})
+            elif op == "salir":
+                with self.candado:
+                    for cancelar in self.trabajos.values():
+                        cancelar.set()
+                self.terminar.set()
+                responder({"id": ident, "ok": True})
+            else:
+                responder({"id": ident, "ok": False, "error": f"Operación desconocida: {op}"})
+        except Exception as e:
+            responder({"id": ident, "ok": False, "error": repr(e)})
+
+    def trabajoResolver(self, pedido, cancelar, responder):
+        ident = pedido.get("id")
+        inicio = time.perf_counter()
+        try:
+            motor = pedido.get("motor", "conjestables")
+            _, n, aristas, adj, k_greedy = self.grafo(pedido["grafo"])
+            if motor == "cg":
+                respuesta = self.resolverCG(n, adj)
+            elif motor in MOTORES_MODELO:
+                respuesta = self.resolverModelo(pedido, motor, n, aristas, k_greedy, cancelar, responder)
+            else:
+                raise ValueError(f"Motor desconocido: {motor}")
+            respuesta.update({"id": ident, "ok": True, "cancelado": cancelar.is_set(),
+                              "tiempo": time.perf_counter() - inicio})
+            responder(respuesta)
+        except Exception as e:
+            responder({"id": ident, "ok": False, "error": repr(e)})
+        finally:
+            with self.candado:
+                self.trabajos.pop(ident, None)
+
+    def resolverModelo(self, pedido, motor, n, aristas, k_greedy, cancelar, responder):
+        ident = pedido.get("id")
+        entrada, guardado = self.modelo(pedido["grafo"], motor, n, aristas, k_greedy)
+        with entrada["candado"]:
+            if entrada["status"] in ("optimal", "infeasible"):
+                # Ya se resolvió del todo: se devuelve la respuesta guardada
+                return {"status": entrada["status"], "k": cantidadColores(entrada["colores"] or []),
+                        "coloreo": entrada["colores"], "modelo_guardado": True}
+
+            model = entrada["model"]
+
+            def alMejorar(objetivo, segundos, gap):
+                responder({"id": ident, "evento": "incumbente", "k": round(objetivo), "t": segundos, "gap": gap})
+
+            # Los límites de SCIP son acumulados: se suman a lo ya usado
+            tiempo = pedido.get("tiempo")
+            limites = {"tiempo": model.getSolvingTime() + tiempo if tiempo is not None else 1e20}
+            if pedido.get("gap") is not None:
+                limites["gap"] = pedido["gap"]
+            if pedido.get("nodos") is not None:
+                limites["nodos"] = model.getNNodes() + pedido["nodos"]
+
+            from modelos import resolver
+            status = resolver(model, alMejorar=alMejorar, detener=cancelar.is_set,
+                              manejadores=entrada["manejadores"], **limites)
+            entrada["status"] = status
+            if status in ("optimal", "feasible"):
+                colores = entrada["extraer"](model, n, entrada["variables"])[0]
+                ids = {}
+                entrada["colores"] = [ids.setdefault(colores[v], len(ids)) for v in range(n)]
+            colores = entrada["colores"]
+            return {"status": status, "k": cantidadColores(colores) if colores else None,
+                    "coloreo": colores, "modelo_guardado": guardado}
+
+    def resolverCG(self, n, adj):
+        """Generación de columnas (sin cancelación: el ciclo no tiene punto de corte)."""
+        from coloreoCG import GraphColoringCG
+
+        cg = GraphColoringCG({v + 1: {u + 1 for u in adj[v]} for v in range(n)})
+        # La tabla de iteraciones iría a stdout, que es el canal de las respuestas
+        valor = cg.solve(verbose=False)
+        return {"status": "lp", "valor_lp": valor, "cota_inferior": cg.lower_bound, "cota_probada": cg.bound_proven}
+
+def leerPedido(line):
+    line = line.strip()
+    if not line:
+        return None
+    return json.loads(line)
+
+def servirEntradaEstandar(demonio):
+    """Lee pedidos por stdin y escribe las respuestas por stdout."""
+    candado = threading.Lock()
+
+    def responder(respuesta):
+        with candado:
+            sys.stdout.write(json.dumps(respuesta) + "\n")
+            sys.stdout.flush()
+
+    for line in sys.stdin:
+        try:
+            pedido = leerPedido(line)
+        except json.JSONDecodeError as e:
+            responder({"ok": False, "error": f"JSON inválido: {e}"})
+            continue
+        if pedido is not None:
+            demonio.procesar(pedido, responder)
+        if demonio.terminar.is_set():
+            break
+    # Al cerrarse la entrada se terminan los trabajos pendientes antes de salir
+    demonio.esperar()
+
+def servirSocket(demonio, path):
+    """Atiende conexiones en un socket Unix; cada línea de una conexión es un pedido."""
+
+    class Manejador(socketserver.StreamRequestHandler):
+        def handle(self):
+            candado = threading.Lock()
+
+            def responder(respuesta):
+                with candado:
+                    try:
+                        self.wfile.write((json.dumps(respuesta) + "\n").encode())
+                        self.wfile.flush()
+                    except (BrokenPipeError, ValueError):
+                        # El cliente cerró la conexión
+                        pass
+
+            for line in self.rfile:
+                try:
+                    pedido = leerPedido(line.decode())
+                except json.JSONDecodeError as e:
+                    responder({"ok": False, "error": f"JSON inválido: {e}"})
+                    continue
+                if pedido is not None:
+                    demonio.procesar(pedido, responder)
+                if demonio.terminar.is_set():
+                    threading.Thread(target=self.server.shutdown, daemon=True).start()
+                    break
+
+    if os.path.exists(path):
+        os.remove(path)
+    with socketserver.ThreadingUnixStreamServer(path, Manejador) as servidor:
+        servidor.daemon_threads = True
+        try:
+            servidor.serve_forever()
+        finally:
+            os.remove(path)
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de trabajos de coloreo (líneas JSON)")
+    parser.add_argument("--socket", default=None, help="Path del socket Unix (por defecto, stdin/stdout)")
+    parser.add_argument("--precargar", action="store_true", help="Importar pyscipopt al arrancar")
+    args = parser.parse_args()
+
+    if args.precargar:
+        import coloreo  # noqa: F401  (importa pyscipopt y los modelos)
+
+    demonio = Demonio()
+    if args.socket:
+        servirSocket(demonio, args.socket)
+    else:
+        servirEntradaEstandar(demonio)
+
+if __name__ == "__main__":
+    main()
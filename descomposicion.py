@@ -0,0 +1,201 @@
+"""
+Descomposición del grafo para resolver por partes:
+    - coloreo por componentes conexas: chi(G) = max chi(componente)
+    - coloreo por bloques (componentes biconexas): chi(G) = max chi(bloque),
+      pegando los coloreos en los vértices de corte con una permutación
+    - MWSS por componentes conexas: el peso es la suma de las componentes
+Las partes se pueden despachar a un pool de procesos. En ese caso la función
+que resuelve cada parte tiene que poder serializarse (definida a nivel de
+módulo o con functools.partial).
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+def componentesConexas(vertices, adj):
+    """Componentes conexas del subgrafo inducido por vertices (listas de vértices)."""
+    vertices = set(vertices)
+    vistos = set()
+    componentes = []
+    for inicio in vertices:
+        if inicio in vistos:
+            continue
+        vistos.add(inicio)
+        componente = [inicio]
+        pila = [inicio]
+        while pila:
+            v = pila.pop()
+            for u in adj[v]:
+                if u in vertices and u not in vistos:
+                    vistos.add(u)
+                    componente.append(u)
+                    pila.append(u)
+        componentes.append(componente)
+    return componentes
+
+def bloques(n, adj):
+    """
+    Componentes biconexas (Tarjan iterativo). Devuelve la lista de bloques,
+    cada uno como lista de vértices. Los vértices aislados no forman bloque.
+    """
+    disc = [-1] * n
+    low = [0] * n
+    tiempo = 0
+    resultado = []
+    pila_aristas = []
+
+    for raiz in range(n):
+        if disc[raiz] != -1 or not adj[raiz]:
+            continue
+        disc[raiz] = low[raiz] = tiempo
+        tiempo += 1
+        pila = [(raiz, -1, iter(adj[raiz]))]
+        while pila:
+            v, padre, vecinos = pila[-1]
+            avanzo = False
+            for u in vecinos:
+                if disc[u] == -1:
+                    disc[u] = low[u] = tiempo
+                    tiempo += 1
+                    pila_aristas.append((v, u))
+                    pila.append((u, v, iter(adj[u])))
+                    avanzo = True
+                    break
+                elif u != padre and disc[u] < disc[v]:
+                    low[v] = min(low[v], disc[u])
+                    pila_aristas.append((v, u))
+            if avanzo:
+                continue
+            pila.pop()
+            if padre != -1:
+                low[padre] = min(low[padre], low[v])
+                if low[v] >= disc[padre]:
+                    # padre separa al bloque que contiene la arista (padre, v)
+                    bloque = set()
+                    while True:
+                        a, b = pila_aristas.pop()
+                        bloque.add(a)
+                        bloque.add(b)
+                        if (a, b) == (padre, v):
+                            break
+                    resultado.append(sorted(bloque))
+    return resultado
+
+def subgrafo(vertices, adj):
+    """Renumera vertices de 0 a k-1 y devuelve (k, aristas)."""
+    indice = {v: i for i, v in enumerate(vertices)}
+    aristas = [(indice[u], indice[v]) for u in vertices for v in adj[u] if v in indice and indice[u] < indice[v]]
+    return len(vertices), aristas
+
+def resolverPartes(partes, adj, resolver, procesos=None):
+    """Resuelve cada parte con resolver(k, aristas), en paralelo si procesos > 1."""
+    subgrafos = [subgrafo(parte, adj) for parte in partes]
+    if procesos is None or procesos <= 1 or len(subgrafos) <= 1:
+        return [resolver(k, aristas) for k, aristas in subgrafos]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [pool.submit(resolver, k, aristas) for k, aristas in subgrafos]
+        return [f.result() for f in futuros]
+
+def normalizar(colores):
+    ids = {}
+    return [ids.setdefault(c, len(ids)) for c in colores]
+
+def estadoGlobal(resultados):
+    """optimal si todas las partes son óptimas, None si alguna falló."""
+    if any(colores is None for colores, _ in resultados):
+        return None
+    return "optimal" if all(status == "optimal" for _, status in resultados) else "feasible"
+
+def colorearPorComponentes(n, adj, resolver, procesos=None):
+    """
+    Colorea cada componente conexa por separado. resolver(k, aristas) devuelve
+    (colores, status) de la componente, con colores None si falla.
+    Devuelve (colores, status) del grafo; los colores se reutilizan entre
+    componentes, así que k = max k de las componentes y el resultado es
+    óptimo si lo es en cada componente.
+    """
+    componentes = componentesConexas(range(n), adj)
+    resultados = resolverPartes(componentes, adj, resolver, procesos)
+    status = estadoGlobal(resultados)
+    if status is None:
+        return None, None
+    colores = [0] * n
+    for componente, (resultado, _) in zip(componentes, resultados):
+        for v, c in zip(componente, normalizar(resultado)):
+            colores[v] = c
+    return colores, status
+
+def colorearPorBloques(n, adj, resolver, procesos=None):
+    """
+    Colorea cada bloque por separado y los pega recorriendo el árbol de
+    bloques y vértices de corte: en cada bloque se intercambian colores para
+    que el vértice de corte mantenga el color que ya tenía.
+    Misma interfaz que colorearPorComponentes.
+    """
+    lista_bloques = bloques(n, adj)
+    resultados = resolverPartes(lista_bloques, adj, resolver, procesos)
+    status = estadoGlobal(resultados)
+    if status is None:
+        return None, None
+
+    bloques_de = {}
+    for b, bloque in enumerate(lista_bloques):
+        for v in bloque:
+            bloques_de.setdefault(v, []).append(b)
+
+    colores = [0] * n  # los vértices aislados quedan con el color 0
+    procesado = [False] * len(lista_bloques)
+    for raiz in range(len(lista_bloques)):
+        if procesado[raiz]:
+            continue
+        cola = [(raiz, None)]
+        procesado[raiz] = True
+        while cola:
+            b, ancla = cola.pop()
+            locales = dict(zip(lista_bloques[b], normalizar(resultados[b][0])))
+            permutacion = {}
+            if ancla is not None:
+                # Intercambiamos el color local del ancla con el color que ya tiene
+                local, destino = locales[ancla], colores[ancla]
+                permutacion = {local: destino, destino: local}
+            for v, c in locales.items():
+                colores[v] = permutacion.get(c, c)
+            for v in lista_bloques[b]:
+                for otro in bloques_de[v]:
+                    if not procesado[otro]:
+                        procesado[otro] = True
+                        cola.append((otro, v))
+    return colores, status
+
+def mwssPorComponentes(adj, pesos, resolverMWSS, procesos=None):
+    """
+    MWSS sobre el subgrafo de vértices con peso positivo, resolviendo cada
+    componente conexa por separado. resolverMWSS(adj, pesos) devuelve (S, w)
+    con adj y pesos restringidos a la componente.
+    Devuelve (S, w) con la unión de las soluciones y la suma de los pesos.
+    """
+    positivos = [v for v in adj if pesos[v] > 1e-9]
+    componentes = componentesConexas(positivos, adj)
+
+    S = []
+    w = 0.0
+    partes = []
+    for componente in componentes:
+        if len(componente) == 1:
+            # Una componente de un solo vértice se resuelve sola
+            S.append(componente[0])
+            w += pesos[componente[0]]
+        else:
+            en_componente = set(componente)
+            partes.append(({v: adj[v] & en_componente for v in componente},
+                           {v: pesos[v] for v in componente}))
+
+    if procesos is None or procesos <= 1 or len(partes) <= 1:
+        resultados = [resolverMWSS(a, p) for a, p in partes]
+    else:
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            futuros = [pool.submit(resolverMWSS, a, p) for a, p in partes]
+            resultados = [f.result() for f in futuros]
+
+    for S_parte, w_parte in resultados:
+        S.extend(S_parte)
+        w += w_parte
+    return tuple(sorted(S)), w
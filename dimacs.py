@@ -0,0 +1,271 @@
+"""
+Lectura de grafos en formato DIMACS, tanto ASCII (.col) como binario (.col.b).
+Los vértices se devuelven numerados de 0 a n-1, igual que parserDimacs.
+"""
+from array import array
+
+# Tamaño de los bloques que se leen del archivo
+TAMANIO_BLOQUE = 1 << 22
+
+class ListaAristas:
+    """
+    Lista de aristas guardada en dos arreglos de enteros (origen y destino)
+    en lugar de una lista de tuplas. Se comporta como una secuencia de pares
+    (u, v), así que los modelos la recorren igual que antes.
+    """
+
+    def __init__(self, origen=None, destino=None):
+        self.origen = origen if origen is not None else array('i')
+        self.destino = destino if destino is not None else array('i')
+
+    def __len__(self):
+        return len(self.origen)
+
+    def __iter__(self):
+        return zip(self.origen, self.destino)
+
+    def __getitem__(self, i):
+        return self.origen[i], self.destino[i]
+
+    def append(self, arista):
+        u, v = arista
+        self.origen.append(u)
+        self.destino.append(v)
+
+def bloquesDeLineas(path):
+    """Lee el archivo en bloques grandes y devuelve bloques que terminan en fin de línea."""
+    with open(path, 'rb') as f:
+        resto = b''
+        while True:
+            bloque = f.read(TAMANIO_BLOQUE)
+            if not bloque:
+                break
+            bloque = resto + bloque
+            corte = bloque.rfind(b'\n') + 1
+            if corte == 0:
+                resto = bloque
+                continue
+            resto = bloque[corte:]
+            yield bloque[:corte]
+        if resto:
+            yield resto + b'\n'
+
+def tokenizarLineas(bloque, origen, destino):
+    """Procesa las líneas una por una. Devuelve la línea 'p' si aparece."""
+    cabecera = None
+    for line in bloque.split(b'\n'):
+        parts = line.split()
+        if not parts or parts[0] == b'c':
+            continue
+        if parts[0] == b'p' and len(parts) >= 4:
+            cabecera = parts
+        elif parts[0] == b'e' and len(parts) >= 3:
+            try:
+                u = int(parts[1]) - 1
+                v = int(parts[2]) - 1
+            except ValueError:
+                continue
+            origen.append(u)
+            destino.append(v)
+    return cabecera
+
+def tokenizarAristas(bloque):
+    """
+    Convierte un bloque de líneas en dos arreglos (u, v) 0-indexados y la
+    línea 'p' si aparece. Las líneas 'c' y 'p' suelen estar todas al
+    principio: lo que viene antes de la última se procesa línea por línea y
+    el resto, si son todas líneas 'e u v', se tokeniza entero de una vez.
+    """
+    origen = array('i')
+    destino = array('i')
+    cabecera = None
+
+    corte = max(bloque.rfind(b'\nc'), bloque.rfind(b'\np'))
+    if corte == -1 and bloque.startswith((b'c', b'p')):
+        corte = 0
+    if corte != -1:
+        fin = bloque.find(b'\n', corte + 1) + 1 or len(bloque)
+        cabecera = tokenizarLineas(bloque[:fin], origen, destino)
+        bloque = bloque[fin:]
+
+    # Camino rápido solo si el bloque es exactamente una línea 'e u v' por
+    # línea: cada línea empieza con 'e' y los tokens son 'e' cada tres
+    tokens = bloque.split()
+    marcas = bloque.count(b'\ne') + bloque.startswith(b'e')
+    lineas = bloque.count(b'\n') + (not bloque.endswith(b'\n'))
+    if (len(tokens) == 3 * marcas and marcas == lineas and tokens.count(b'e') == marcas
+            and tokens[0::3].count(b'e') == marcas):
+        menosUno = (-1).__add__
+        try:
+            origen.extend(array('i', map(menosUno, map(int, tokens[1::3]))))
+            destino.extend(array('i', map(menosUno, map(int, tokens[2::3]))))
+            return origen, destino, cabecera
+        except ValueError:
+            # Hay líneas con otro formato: se procesan una por una
+            del origen[len(destino):]
+    otra = tokenizarLineas(bloque, origen, destino)
+    return origen, destino, otra if otra is not None else cabecera
+
+def iterarAristas(path):
+    """Generador de aristas (u, v) 0-indexadas para consumidores que solo recorren."""
+    for bloque in bloquesDeLineas(path):
+        origen, destino, _ = tokenizarAristas(bloque)
+        yield from zip(origen, destino)
+
+def leerDimacsTexto(path):
+    """
+    Lee un .col ASCII en una sola pasada y devuelve (n, ListaAristas).
+    Los arreglos se reservan con el m de la línea 'p' y se completan a medida
+    que se tokenizan los bloques.
+    """
+    n = None
+    m = 0
+    origen = destino = None
+    max_index = -1
+    for bloque in bloquesDeLineas(path):
+        u, v, cabecera = tokenizarAristas(bloque)
+        if cabecera is not None and n is None:
+            try:
+                n = int(cabecera[2])
+                reservado = int(cabecera[3])
+            except ValueError:
+                reservado = 0
+            if origen is None and reservado > 0:
+                origen = array('i', bytes(4 * reservado))
+                destino = array('i', bytes(4 * reservado))
+        if origen is None:
+            origen, destino = array('i'), array('i')
+        cantidad = len(u)
+        if cantidad == 0:
+            continue
+        if m + cantidad <= len(origen):
+            origen[m:m + cantidad] = u
+            destino[m:m + cantidad] = v
+        else:
+            del origen[m:]
+            del destino[m:]
+            origen.extend(u)
+            destino.extend(v)
+        m += cantidad
+        max_index = max(max_index, max(u), max(v))
+    if origen is None:
+        origen, destino = array('i'), array('i')
+    # Descartamos lo reservado de más (el m de la cabecera puede contar de más)
+    del origen[m:]
+    del destino[m:]
+    if n is None:
+        n = max_index + 1 if max_index >= 0 else 0
+    return n, ListaAristas(origen, destino)
+
+def leerCabeceraBinario(data):
+    """
+    Interpreta la cabecera de un .col.b: la primera línea tiene el largo del
+    preámbulo ASCII, que contiene la línea 'p edge N M'.
+    Devuelve (n, m, preambulo, posición donde empieza la matriz de bits).
+    """
+    fin_linea = data.find(b'\n')
+    largo = int(data[:fin_linea])
+    inicio = fin_linea + 1
+    preambulo = data[inicio:inicio + largo].decode('latin-1')
+    n = m = None
+    for line in preambulo.splitlines():
+        parts = line.split()
+        if parts and parts[0] == 'p' and len(parts) >= 4:
+            n = int(parts[2])
+            m = int(parts[3])
+    if n is None:
+        raise ValueError("No se encontró la línea 'p edge N M' en el preámbulo.")
+    return n, m, preambulo, inicio + largo
+
+def desplazamientosFilas(n):
+    """Posición (relativa a la matriz) donde empieza cada fila del triángulo inferior."""
+    desplazamientos = [0] * (n + 1)
+    for i in range(n):
+        desplazamientos[i + 1] = desplazamientos[i] + (i + 8) // 8
+    return desplazamientos
+
+def leerDimacsBinario(path):
+    """
+    Lee un .col.b y devuelve (n, ListaAristas).
+    La matriz de bits guarda el triángulo inferior: la fila i tiene i+1 bits
+    (columnas 0..i), el primer bit es el más significativo y cada fila se
+    completa hasta un byte entero.
+    """
+    with open(path, 'rb') as f:
+        data = f.read()
+    n, _, _, pos = leerCabeceraBinario(data)
+
+    aristas = ListaAristas()
+    for i in range(n):
+        nbytes = (i + 8) // 8
+        fila = int.from_bytes(data[pos:pos + nbytes], 'big')
+        pos += nbytes
+        if not fila:
+            continue
+        # Los unos de la fila se buscan sobre su representación binaria
+        bits = format(fila, f'0{nbytes * 8}b')
+        j = bits.find('1')
+        while 0 <= j < i:
+            aristas.append((j, i))
+            j = bits.find('1', j + 1)
+    return n, aristas
+
+def empaquetarMatriz(n, aristas):
+    """Arma la matriz de bits del triángulo inferior en un único bytearray."""
+    desplazamientos = desplazamientosFilas(n)
+    matriz = bytearray(desplazamientos[n])
+    for u, v in aristas:
+        if u == v:
+            continue
+        if u < v:
+            u, v = v, u
+        # La fila es el vértice mayor y la columna el menor
+        matriz[desplazamientos[u] + (v >> 3)] |= 0x80 >> (v & 7)
+    return matriz
+
+def escribirDimacsBinario(path, n, aristas, comentarios=()):
+    """
+    Escribe (n, aristas) en formato .col.b. Las aristas repetidas se guardan
+    una sola vez, así que el m de la cabecera es el de la matriz.
+    """
+    matriz = empaquetarMatriz(n, aristas)
+    m = bin(int.from_bytes(matriz, 'big')).count('1')
+    preambulo = "".join(f"c {c}\n" if c else "c\n" for c in comentarios) + f"p edge {n} {m}\n"
+    preambulo = preambulo.encode('latin-1')
+    with open(path, 'wb') as f:
+        f.write(f"{len(preambulo)}\n".encode('latin-1'))
+        f.write(preambulo)
+        f.write(matriz)
+
+def escribirDimacsTexto(path, n, aristas, comentarios=()):
+    """Escribe (n, aristas) en formato .col ASCII con vértices 1-indexados."""
+    with open(path, 'w') as f:
+        for c in comentarios:
+            f.write(f"c {c}\n" if c else "c\n")
+        f.write(f"p edge {n} {len(aristas)}\n")
+        f.writelines(f"e {u + 1} {v + 1}\n" for u, v in aristas)
+
+def comentariosDimacs(path):
+    """Devuelve las líneas de comentario (sin la 'c') de un .col o .col.b."""
+    comentarios = []
+    if str(path).endswith('.b'):
+        with open(path, 'rb') as f:
+            largo = int(f.readline())
+            lineas = f.read(largo).decode('latin-1').splitlines()
+    else:
+        with open(path, 'r', encoding='latin-1') as f:
+            lineas = []
+            for line in f:
+                if line.startswith('e'):
+                    break
+                lineas.append(line)
+    for line in lineas:
+        if line.startswith('c'):
+            comentarios.append(line[2:].rstrip())
+    return comentarios
+
+def leerGrafo(path):
+    """Lee un grafo DIMACS ASCII o binario según la extensión."""
+    if str(path).endswith('.b'):
+        return leerDimacsBinario(path)
+    return leerDimacsTexto(path)
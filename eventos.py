@@ -0,0 +1,47 @@
+"""
+Event handlers de SCIP usados por modelos.resolver(). Están separados de
+modelos.py para que importar las utilidades no cargue pyscipopt.
+"""
+from pyscipopt import Eventhdlr, SCIP_EVENTTYPE
+
+class EventoIncumbente(Eventhdlr):
+    """Event handler que avisa cada vez que SCIP encuentra una mejor solución."""
+
+    def __init__(self, alMejorar):
+        self.alMejorar = alMejorar
+
+    def callback(self, alMejorar):
+        self.alMejorar = alMejorar
+
+    def eventinit(self):
+        self.model.catchEvent(SCIP_EVENTTYPE.BESTSOLFOUND, self)
+
+    def eventexit(self):
+        self.model.dropEvent(SCIP_EVENTTYPE.BESTSOLFOUND, self)
+
+    def eventexec(self, event):
+        if self.alMejorar is None:
+            return
+        sol = self.model.getBestSol()
+        self.alMejorar(self.model.getSolObjVal(sol), self.model.getSolvingTime(), self.model.getGap())
+
+class EventoDetener(Eventhdlr):
+    """Event handler que interrumpe la resolución cuando detener() devuelve True."""
+
+    EVENTOS = SCIP_EVENTTYPE.NODESOLVED | SCIP_EVENTTYPE.LPSOLVED
+
+    def __init__(self, detener):
+        self.detener = detener
+
+    def callback(self, detener):
+        self.detener = detener
+
+    def eventinit(self):
+        self.model.catchEvent(self.EVENTOS, self)
+
+    def eventexit(self):
+        self.model.dropEvent(self.EVENTOS, self)
+
+    def eventexec(self, event):
+        if self.detener is not None and self.detener():
+            self.model.interruptSolve()
@@ -0,0 +1,240 @@
+"""
+Generadores de grafos para los estudios de escalado. Todos devuelven los
+vértices numerados de 0 a n-1 y las aristas en una ListaAristas (dos
+arreglos de enteros), igual que leerGrafo, sin pasar por una matriz n x n.
+    aleatorio  G(n, p) de Erdős–Rényi. Los saltos entre aristas se sortean
+               con una distribución geométrica (Batagelj y Brandes), así
+               que el costo es O(n + m) y no O(n²)
+    reina      grafo de la reina de un tablero filas x columnas
+    plantado   k clases ocultas de tamaño parejo y cada arista entre clases
+               distintas con probabilidad p: chi <= k
+    plano      como plantado pero con la misma cantidad de aristas entre
+               cada par de clases y grados parejos (grafos flat de Culberson)
+    leighton   k clases ocultas y cliques plantadas de tamaño 2..k, una de
+               ellas de tamaño k: chi = k exactamente
+Los generadores con clases ocultas devuelven además el coloreo plantado.
+Uso: python generadores.py aleatorio --n 5000 --p 0.1 --semilla 1 -o g.col.b
+(la extensión .b elige el formato binario).
+"""
+import argparse
+import math
+import random
+import time
+from array import array
+
+from dimacs import ListaAristas, escribirDimacsBinario, escribirDimacsTexto
+
+def saltosGeometricos(total, p, rng):
+    """
+    Índices de 0..total-1 elegidos cada uno con probabilidad p, en orden.
+    Entre un índice y el siguiente se saltea una cantidad geométrica.
+    """
+    if p <= 0.0:
+        return
+    if p >= 1.0:
+        yield from range(total)
+        return
+    log_q = math.log(1.0 - p)
+    i = -1
+    while True:
+        i += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if i >= total:
+            return
+        yield i
+
+def grafoAleatorio(n, p, semilla=None):
+    """G(n, p): cada par {u, v} es arista con probabilidad p. Devuelve (n, aristas)."""
+    rng = random.Random(semilla)
+    origen, destino = array('i'), array('i')
+    agregar_u, agregar_v = origen.append, destino.append
+    # Pares (v, w) con w < v en orden: el índice i del triángulo inferior
+    # corresponde a v(v-1)/2 + w
+    v, inicio_fila = 1, 0
+    for i in saltosGeometricos(n * (n - 1) // 2, p, rng):
+        while i >= inicio_fila + v:
+            inicio_fila += v
+            v += 1
+        agregar_u(v)
+        agregar_v(i - inicio_fila)
+    return n, ListaAristas(origen, destino)
+
+def grafoReina(filas, columnas=None):
+    """
+    Grafo de la reina: una casilla por vértice (numeradas por filas) y una
+    arista entre dos casillas de la misma fila, columna o diagonal.
+    Devuelve (n, aristas).
+    """
+    if columnas is None:
+        columnas = filas
+    aristas = ListaAristas()
+    agregar = aristas.append
+    for i in range(filas):
+        for j in range(columnas):
+            v = i * columnas + j
+            # Hacia la derecha en la fila
+            for jj in range(j + 1, columnas):
+                agregar((v, i * columnas + jj))
+            # Hacia abajo en la columna y en las dos diagonales
+            for d in range(1, filas - i):
+                agregar((v, (i + d) * columnas + j))
+                if j + d < columnas:
+                    agregar((v, (i + d) * columnas + j + d))
+                if j - d >= 0:
+                    agregar((v, (i + d) * columnas + j - d))
+    return filas * columnas, aristas
+
+def clasesOcultas(n, k, rng):
+    """Reparte los vértices al azar en k clases de tamaño parejo. Devuelve (colores, clases)."""
+    orden = list(range(n))
+    rng.shuffle(orden)
+    colores = [0] * n
+    clases = [[] for _ in range(k)]
+    for i, v in enumerate(orden):
+        colores[v] = i % k
+        clases[i % k].append(v)
+    return colores, clases
+
+def grafoPlantado(n, k, p, semilla=None):
+    """
+    k clases ocultas; cada par de vértices de clases distintas es arista con
+    probabilidad p. Devuelve (n, aristas, coloreo plantado).
+    """
+    rng = random.Random(semilla)
+    colores, clases = clasesOcultas(n, k, rng)
+    aristas = ListaAristas()
+    agregar = aristas.append
+    for a in range(k):
+        for b in range(a + 1, k):
+            A, B = clases[a], clases[b]
+            for i in saltosGeometricos(len(A) * len(B), p, rng):
+                fila, columna = divmod(i, len(B))
+                agregar((A[fila], B[columna]))
+    return n, aristas, colores
+
+def grafoPlano(n, k, p, semilla=None):
+    """
+    Grafo flat: k clases ocultas y, entre cada par de clases A y B, round(p|A||B|)
+    aristas repartidas para que, dentro de cada par, los grados difieran a lo
+    sumo en uno. Cada vértice de A toma una ventana consecutiva de una
+    permutación circular de B.
+    Devuelve (n, aristas, coloreo plantado).
+    """
+    rng = random.Random(semilla)
+    colores, clases = clasesOcultas(n, k, rng)
+    aristas = ListaAristas()
+    agregar = aristas.append
+    for a in range(k):
+        for b in range(a + 1, k):
+            A, B = clases[a], list(clases[b])
+            if not A or not B:
+                continue
+            rng.shuffle(B)
+            total = round(p * len(A) * len(B))
+            base, resto = divmod(total, len(A))
+            posicion = 0
+            for i, u in enumerate(rng.sample(A, len(A))):
+                for d in range(base + (i < resto)):
+                    agregar((u, B[(posicion + d) % len(B)]))
+                posicion = (posicion + base + (i < resto)) % len(B)
+    return n, aristas, colores
+
+def grafoLeighton(n, k, m, semilla=None):
+    """
+    Grafo al estilo de Leighton: k clases ocultas y cliques plantadas con
+    un vértice de cada una de s clases distintas, hasta llegar a m aristas.
+    La primera clique tiene tamaño k, así que chi = k (m se lleva a al menos
+    k(k-1)/2 para que entre completa); las demás reparten las aristas en
+    partes iguales entre los tamaños 2..k.
+    Devuelve (n, aristas, coloreo plantado).
+    """
+    if k > n:
+        raise ValueError(f"No hay {k} clases no vacías con {n} vértices")
+    rng = random.Random(semilla)
+    colores, clases = clasesOcultas(n, k, rng)
+    m = min(m, sum(len(A) * len(B) for a, A in enumerate(clases) for B in clases[a + 1:]))
+    m = max(m, k * (k - 1) // 2)
+    vistas = set()
+    aristas = ListaAristas()
+
+    def plantar(vertices):
+        for i, u in enumerate(vertices):
+            for v in vertices[i + 1:]:
+                clave = u * n + v if u < v else v * n + u
+                if clave not in vistas and len(aristas) < m:
+                    vistas.add(clave)
+                    aristas.append((u, v))
+
+    if k < 2:
+        return n, aristas, colores
+    plantar([rng.choice(clases[c]) for c in range(k)])
+    tamanos = list(range(2, k + 1))
+    presupuesto = {s: (m - len(aristas)) / len(tamanos) for s in tamanos}
+    while len(aristas) < m:
+        # El tamaño con más presupuesto de aristas sin usar
+        s = max(tamanos, key=presupuesto.get)
+        antes = len(aristas)
+        plantar([rng.choice(clases[c]) for c in rng.sample(range(k), s)])
+        presupuesto[s] -= max(len(aristas) - antes, 1)
+    return n, aristas, colores
+
+def escribirGrafo(path, n, aristas, comentarios=()):
+    """Escribe el grafo en .col.b si path termina en .b y en .col ASCII si no."""
+    if str(path).endswith('.b'):
+        escribirDimacsBinario(path, n, aristas, comentarios)
+    else:
+        escribirDimacsTexto(path, n, aristas, comentarios)
+
+def main():
+    parser = argparse.ArgumentParser(description="Generar grafos para benchmarks")
+    sub = parser.add_subparsers(dest="familia", required=True)
+
+    p = sub.add_parser("aleatorio", help="G(n, p) de Erdős–Rényi")
+    p.add_argument("--n", type=int, required=True)
+    p.add_argument("--p", type=float, required=True)
+
+    p = sub.add_parser("reina", help="Grafo de la reina")
+    p.add_argument("--filas", type=int, required=True)
+    p.add_argument("--columnas", type=int, default=None)
+
+    for familia, ayuda in (("plantado", "k clases ocultas, aristas entre clases con probabilidad p"),
+                           ("plano", "k clases ocultas con grados parejos (flat)")):
+        p = sub.add_parser(familia, help=ayuda)
+        p.add_argument("--n", type=int, required=True)
+        p.add_argument("--k", type=int, required=True)
+        p.add_argument("--p", type=float, required=True)
+
+    p = sub.add_parser("leighton", help="Cliques plantadas, chi = k")
+    p.add_argument("--n", type=int, required=True)
+    p.add_argument("--k", type=int, required=True)
+    p.add_argument("--m", type=int, required=True, help="Cantidad de aristas (al menos k(k-1)/2)")
+
+    for p in sub.choices.values():
+        p.add_argument("--semilla", type=int, default=None)
+        p.add_argument("--out", "-o", required=True, help="Archivo de salida (.col o .col.b)")
+    args = parser.parse_args()
+
+    inicio = time.perf_counter()
+    colores = None
+    if args.familia == "aleatorio":
+        n, aristas = grafoAleatorio(args.n, args.p, args.semilla)
+        descripcion = f"G(n, p) n={args.n} p={args.p}"
+    elif args.familia == "reina":
+        n, aristas = grafoReina(args.filas, args.columnas)
+        descripcion = f"reina {args.filas}x{args.columnas or args.filas}"
+    elif args.familia == "leighton":
+        n, aristas, colores = grafoLeighton(args.n, args.k, args.m, args.semilla)
+        descripcion = f"leighton n={args.n} k={args.k} m={args.m}"
+    else:
+        generador = grafoPlantado if args.familia == "plantado" else grafoPlano
+        n, aristas, colores = generador(args.n, args.k, args.p, args.semilla)
+        descripcion = f"{args.familia} n={args.n} k={args.k} p={args.p}"
+    generacion = time.perf_counter() - inicio
+
+    comentarios = [f"generadores.py: {descripcion} semilla={args.semilla}"]
+    if colores is not None:
+        comentarios.append(f"coloreo plantado con {len(set(colores))} colores")
+    escribirGrafo(args.out, n, aristas, comentarios)
+    print(f"{args.out}: {n} vértices, {len(aristas)} aristas ({generacion:.2f}s)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Envejecimiento de columnas del maestro restringido de coloreo.
+En cada iteración se calcula el costo reducido 1 - sum(pi_v) de cada columna
+activa. Una columna que está en 0 y con costo reducido positivo envejece; si
+vuelve a usarse (valor positivo o costo reducido ~0) su edad vuelve a 0. Las
+columnas que pasan edad_maxima iteraciones sin usarse salen del LP y quedan
+en un pool; antes de llamar al pricing se revisa el pool y las columnas que
+vuelven a tener costo reducido negativo reingresan al maestro.
+"""
+from collections import deque
+
+# Largo del historial de costos reducidos que se guarda por columna
+LARGO_HISTORIAL = 10
+
+class GestorColumnas:
+    """Edad, historial de costos reducidos y pool de columnas retiradas."""
+
+    def __init__(self, edad_maxima=20, max_columnas=None, tolerancia=1e-6):
+        """
+        :param edad_maxima: Iteraciones sin usarse antes de retirar una columna (None = nunca)
+        :param max_columnas: Tope de columnas activas; al superarlo se retiran
+            primero las más viejas (None = sin tope)
+        """
+        self.edad_maxima = edad_maxima
+        self.max_columnas = max_columnas
+        self.tolerancia = tolerancia
+        self.activas = {}      # clave -> columna (frozenset)
+        self.protegidas = set()
+        self.edades = {}
+        self.historial = {}    # clave -> deque de costos reducidos
+        self.pool = {}         # columna (frozenset) -> último costo reducido
+        self.retiradas = 0
+        self.reingresos = 0
+
+    def registrar(self, clave, columna, protegida=False):
+        """Agrega una columna activa. Las protegidas (p.ej. singleton) no se retiran nunca."""
+        columna = frozenset(columna)
+        self.activas[clave] = columna
+        self.edades[clave] = 0
+        self.historial[clave] = deque(maxlen=LARGO_HISTORIAL)
+        self.pool.pop(columna, None)
+        if protegida:
+            self.protegidas.add(clave)
+
+    def cambiar(self, clave, columna):
+        """Actualiza los vértices de una columna activa que fue reparada."""
+        self.activas[clave] = frozenset(columna)
+
+    def olvidar(self, clave):
+        """Saca una columna activa sin pasarla al pool (p.ej. dejó de ser estable)."""
+        self.activas.pop(clave, None)
+        self.protegidas.discard(clave)
+        self.edades.pop(clave, None)
+        self.historial.pop(clave, None)
+
+    def actualizar(self, valores, duales):
+        """
+        Registra una iteración del maestro y devuelve las claves a retirar.
+        :param valores: Diccionario clave -> valor de la columna en el LP
+        :param duales: Diccionario vértice -> pi_v
+        """
+        tol = self.tolerancia
+        for clave, columna in self.activas.items():
+            costo = 1.0 - sum(duales.get(v, 0.0) for v in columna)
+            self.historial[clave].append(costo)
+            if valores.get(clave, 0.0) > tol or costo <= tol:
+                self.edades[clave] = 0
+            else:
+                self.edades[clave] += 1
+
+        candidatas = [c for c in self.activas if c not in self.protegidas and self.edades[c] > 0]
+        # Primero las más viejas y, a igual edad, las de mayor costo reducido
+        candidatas.sort(key=lambda c: (self.edades[c], self.historial[c][-1]), reverse=True)
+        retirar = []
+        if self.edad_maxima is not None:
+            retirar = [c for c in candidatas if self.edades[c] >= self.edad_maxima]
+        if self.max_columnas is not None:
+            exceso = len(self.activas) - len(retirar) - self.max_columnas
+            if exceso > 0:
+                elegidas = set(retirar)
+                retirar.extend([c for c in candidatas if c not in elegidas][:exceso])
+        return retirar
+
+    def retirar(self, clave):
+        """Pasa la columna activa al pool."""
+        columna = self.activas[clave]
+        historial = self.historial[clave]
+        self.pool[columna] = historial[-1] if historial else 0.0
+        self.olvidar(clave)
+        self.retiradas += 1
+        return columna
+
+    def reingresar(self, duales, limite=None):
+        """
+        Columnas del pool con costo reducido negativo para los duales dados,
+        de la más negativa a la menos. Salen del pool; hay que registrarlas
+        de nuevo al agregarlas al maestro.
+        """
+        tol = self.tolerancia
+        candidatas = []
+        for columna in self.pool:
+            costo = 1.0 - sum(duales.get(v, 0.0) for v in columna)
+            if costo < -tol:
+                candidatas.append((costo, sorted(columna)))
+        candidatas.sort()
+        if limite is not None:
+            candidatas = candidatas[:limite]
+        for _, columna in candidatas:
+            del self.pool[frozenset(columna)]
+        self.reingresos += len(candidatas)
+        return [columna for _, columna in candidatas]
+
+    def descartarPool(self, vertices):
+        """Saca del pool las columnas que contienen a todos los vértices dados (el grafo cambió)."""
+        vertices = frozenset(vertices)
+        for columna in [c for c in self.pool if vertices <= c]:
+            del self.pool[columna]
+
+    def estadisticas(self):
+        """Tamaño del LP y del pool y movimientos acumulados."""
+        edades = list(self.edades.values())
+        return {"activas": len(self.activas), "pool": len(self.pool),
+                "retiradas": self.retiradas, "reingresos": self.reingresos,
+                "edad_maxima_actual": max(edades) if edades else 0}
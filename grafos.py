@@ -0,0 +1,54 @@
+"""
+Funciones auxiliares sobre grafos compartidas por los distintos modelos.
+Los vértices se numeran de 0 a n-1, igual que en los parsers de los modelos.
+"""
+
+def listaAdyacencia(n, aristas):
+    """
+    Devuelve la lista de vecinos de cada vértice (lista de sets).
+    Se ignoran los lazos y las aristas fuera de rango.
+    """
+    adj = [set() for _ in range(n)]
+    for u, v in aristas:
+        if 0 <= u < n and 0 <= v < n and u != v:
+            adj[u].add(v)
+            adj[v].add(u)
+    return adj
+
+def aristasInducidas(vertices, adj):
+    """
+    Genera las aristas (i, j) con i < j del subgrafo inducido por vertices.
+    Solo recorre los vecinos de cada vértice dentro del conjunto, sin mirar
+    la lista completa de aristas del grafo.
+    """
+    for i in vertices:
+        for j in adj[i] & vertices:
+            if i < j:
+                yield i, j
+
+def cubrimientoCliquesAristas(vertices, adj):
+    """
+    Cubrimiento greedy de las aristas del subgrafo inducido por vertices
+    mediante cliques. Cada arista queda contenida en al menos una clique.
+    Devuelve una lista de cliques (listas de vértices de tamaño >= 2).
+    """
+    # Aristas todavía no cubiertas de cada vértice
+    pendientes = {v: adj[v] & vertices for v in vertices}
+    orden = sorted(vertices, key=lambda v: len(pendientes[v]), reverse=True)
+
+    cliques = []
+    for v in orden:
+        while pendientes[v]:
+            # Arrancamos con una arista no cubierta y extendemos la clique
+            u = max(pendientes[v], key=lambda w: len(pendientes[w]))
+            K = [v, u]
+            candidatos = adj[v] & adj[u] & vertices
+            # Preferimos candidatos que cubran aristas pendientes con la clique
+            for w in sorted(candidatos, key=lambda w: len(pendientes[w] & candidatos), reverse=True):
+                if all(w in adj[x] for x in K):
+                    K.append(w)
+            Kset = set(K)
+            for x in K:
+                pendientes[x] -= Kset
+            cliques.append(K)
+    return cliques
@@ -0,0 +1,187 @@
+"""
+Heurísticas primales sobre las columnas del maestro restringido: a partir de
+los conjuntos estables generados y de sus valores en el LP se arma un
+coloreo entero, sin otra corrida de un solver.
+    redondeo  columnas por valor LP decreciente (y después por cobertura)
+              hasta cubrir todos los vértices
+    buceo     fija la columna de mayor valor, vuelve a resolver el LP sobre
+              los vértices sin cubrir (maestro_lp) y repite
+    ip        cubrimiento entero con SCIP sobre todas las columnas, con tiempo
+              límite y la mejor solución de las anteriores como inicial
+Un cubrimiento se repara a partición dejando cada vértice en una sola de sus
+columnas: un subconjunto de un estable sigue siendo estable.
+"""
+import math
+from collections import defaultdict
+
+from maestro_lp import crearMaestro
+
+METODOS = ("redondeo", "buceo", "ip")
+
+def particionar(cubrimiento, vertices, adj):
+    """
+    Convierte una lista de conjuntos estables en un coloreo {v: color} con
+    colores 0..k-1. Cada vértice queda en la primera columna que lo contiene;
+    los que no aparecen en ninguna van al primer color sin vecinos.
+    """
+    colores = {}
+    k = 0
+    for columna in cubrimiento:
+        nuevos = [v for v in columna if v not in colores]
+        if nuevos:
+            for v in nuevos:
+                colores[v] = k
+            k += 1
+    for v in vertices:
+        if v not in colores:
+            usados = {colores[u] for u in adj[v] if u in colores}
+            colores[v] = next(c for c in range(k + 1) if c not in usados)
+            k = max(k, colores[v] + 1)
+    return colores
+
+def coloreoVerificado(colores, adj):
+    """True si todos los vértices tienen color y ninguna arista es monocromática."""
+    return all(v in colores for v in adj) and all(colores[u] != colores[v] for v in adj for u in adj[v])
+
+def cubrimientoGreedy(columnas, restantes, elegidas):
+    """Completa el cubrimiento eligiendo la columna que cubre más vértices restantes."""
+    while restantes:
+        mejor = max(columnas, key=lambda c: len(c & restantes))
+        if not mejor & restantes:
+            break
+        elegidas.append(mejor)
+        restantes -= mejor
+    return elegidas
+
+def redondeo(columnas, valores, vertices):
+    """Columnas por valor LP decreciente mientras cubran algo nuevo; el resto, greedy."""
+    restantes = set(vertices)
+    elegidas = []
+    orden = sorted(range(len(columnas)), key=lambda j: (valores[j], len(columnas[j])), reverse=True)
+    for j in orden:
+        if valores[j] <= 1e-9 or not restantes:
+            break
+        if columnas[j] & restantes:
+            elegidas.append(columnas[j])
+            restantes -= columnas[j]
+    return cubrimientoGreedy(columnas, restantes, elegidas)
+
+def buceo(columnas, valores, vertices, maestro="simplex"):
+    """
+    Fija la columna de mayor valor LP y re-resuelve el maestro restringido a
+    los vértices que quedan sin cubrir, hasta cubrirlos todos. Devuelve las
+    columnas originales en el orden en que se fijaron: particionar() las
+    recorta igual que el buceo.
+    """
+    restantes = set(vertices)
+    elegidas = []
+    candidatas = dict(enumerate(columnas))
+    valores = dict(enumerate(valores))
+    while restantes:
+        j = max(candidatas, key=lambda j: (valores.get(j, 0.0), len(candidatas[j])))
+        elegidas.append(columnas[j] if isinstance(j, int) else candidatas[j])
+        restantes -= candidatas[j]
+        if not restantes:
+            break
+
+        # LP sobre los vértices restantes con las columnas recortadas a ellos
+        lp = crearMaestro(maestro)
+        candidatas = {}
+        for v in restantes:
+            lp.agregarFila(v, ("singleton", v))
+            candidatas[("singleton", v)] = {v}
+        vistas = set()
+        for k, columna in enumerate(columnas):
+            recortada = columna & restantes
+            if len(recortada) > 1 and frozenset(recortada) not in vistas:
+                vistas.add(frozenset(recortada))
+                lp.agregarColumna(k, recortada)
+                candidatas[k] = recortada
+        lp.resolver()
+        valores = lp.valores()
+    return elegidas
+
+def coberturaEntera(columnas, vertices, tiempo_limite=None, inicial=None):
+    """
+    Cubrimiento entero mínimo con las columnas dadas (SCIP). inicial es un
+    cubrimiento factible que se carga como primera solución.
+    Devuelve (columnas elegidas o None, status).
+    """
+    from pyscipopt import Model, quicksum
+    from modelos import agregarRestricciones, resolver
+
+    model = Model("CubrimientoColumnas")
+    model.hideOutput()
+    x = [model.addVar(name=f"x_{j}", vtype="B", obj=1.0) for j in range(len(columnas))]
+    por_vertice = defaultdict(list)
+    for j, columna in enumerate(columnas):
+        for v in columna:
+            por_vertice[v].append(j)
+    agregarRestricciones(model, (quicksum(x[j] for j in por_vertice[v]) >= 1 for v in vertices))
+
+    if inicial is not None:
+        indices = {frozenset(c): j for j, c in enumerate(columnas)}
+        sol = model.createSol()
+        for columna in inicial:
+            model.setSolVal(sol, x[indices[frozenset(columna)]], 1.0)
+        model.addSol(sol)
+
+    status = resolver(model, tiempo=tiempo_limite)
+    if model.getNSols() == 0:
+        return None, status
+    sol = model.getBestSol()
+    return [columnas[j] for j in range(len(columnas)) if model.getSolVal(sol, x[j]) > 0.5], status
+
+def colorearDesdeColumnas(adj, columnas, valores=None, tiempo_limite=10.0, metodos=METODOS,
+                          maestro="simplex", cota_inferior=None):
+    """
+    Coloreo entero a partir de las columnas generadas.
+    :param adj: Diccionario vértice -> set de vecinos
+    :param columnas: Conjuntos estables (por ejemplo las columnas del maestro y del pool)
+    :param valores: Valor LP de cada columna (None = todas en 0)
+    :param tiempo_limite: Tiempo límite (s) del cubrimiento entero
+    :param cota_inferior: Cota inferior de k (p.ej. el LP): si se alcanza no se sigue
+    Devuelve (colores {v: 0..k-1}, k, método). El coloreo siempre se verifica.
+    """
+    vertices = set(adj)
+    # Las singleton garantizan que el cubrimiento exista
+    vistas = set()
+    unicas, valores_unicos = [], []
+    for j, columna in enumerate(columnas):
+        columna = frozenset(columna) & vertices
+        if columna and columna not in vistas:
+            vistas.add(columna)
+            unicas.append(set(columna))
+            valores_unicos.append(valores[j] if valores is not None else 0.0)
+    for v in vertices:
+        if frozenset((v,)) not in vistas:
+            unicas.append({v})
+            valores_unicos.append(0.0)
+
+    objetivo = math.ceil(cota_inferior - 1e-6) if cota_inferior is not None else 0
+    mejor, mejor_k, mejor_metodo, mejores_colores = None, None, None, None
+    for metodo in metodos:
+        if mejor_k is not None and mejor_k <= objetivo:
+            break
+        if metodo == "redondeo":
+            cubrimiento = redondeo(unicas, valores_unicos, vertices)
+        elif metodo == "buceo":
+            cubrimiento = buceo(unicas, valores_unicos, vertices, maestro=maestro)
+        elif metodo == "ip":
+            try:
+                cubrimiento, _ = coberturaEntera(unicas, vertices, tiempo_limite=tiempo_limite, inicial=mejor)
+            except ImportError:
+                # Sin pyscipopt quedan el redondeo y el buceo
+                continue
+            if cubrimiento is None:
+                continue
+        else:
+            raise ValueError(f"Método desconocido: {metodo}")
+        colores = particionar(cubrimiento, vertices, adj)
+        k = len(set(colores.values()))
+        if not coloreoVerificado(colores, adj):
+            raise RuntimeError(f"El método {metodo} produjo un coloreo inválido")
+        if mejor_k is None or k < mejor_k:
+            mejor, mejor_k, mejor_metodo = cubrimiento, k, metodo
+            mejores_colores = colores
+    return mejores_colores, mejor_k, mejor_metodo
@@ -6,32 +6,11 @@ import random
 import itertools
 import math
 from collections import defaultdict
+from dimacs import leerGrafo
 
 def parse_dimacs(path):
-    n = None
-    edges = []
-    max_idx = -1
-    with open(path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('c'):
-                continue
-            parts = line.split()
-            if parts[0] == 'p' and len(parts) >= 4:
-                try:
-                    n = int(parts[2])
-                except:
-                    n = None
-            elif parts[0] == 'e' and len(parts) >= 3:
-                try:
-                    u = int(parts[1]) - 1
-                    v = int(parts[2]) - 1
-                except ValueError:
-                    continue
-                edges.append((u, v))
-                max_idx = max(max_idx, u, v)
-    if n is None:
-        n = max_idx + 1 if max_idx >= 0 else 0
+    # Las aristas quedan en arreglos compactos (ListaAristas), sin lista de tuplas intermedia
+    n, edges = leerGrafo(path)
     # Lista de vecinos (Conveniente ya que se consultan continuamente los vecinos de un vector)
     adj = [set() for _ in range(n)]
     for u, v in edges:
@@ -0,0 +1,234 @@
+"""
+Ejecución por lotes: resuelve un directorio (o glob) de instancias .col/.col.b
+en paralelo sobre un pool acotado de procesos, con límites de tiempo y de
+memoria por trabajo. Cada resultado se agrega al manifiesto JSONL apenas
+termina, de modo que una corrida interrumpida puede reanudarse.
+"""
+import argparse
+import glob
+import json
+import multiprocessing as mp
+import os
+import resource
+import signal
+import time
+from multiprocessing.connection import wait
+
+from dimacs import leerGrafo
+from grafos import listaAdyacencia
+from coloreo_heuristico import coloreoGreedy, cantidadColores
+from cache_resultados import CacheResultados, hashGrafo, DIRECTORIO as DIRECTORIO_CACHE
+from verificacion import verificarColoreo
+
+# Margen (s) antes de matar un trabajo que no respetó su tiempo límite
+MARGEN_TIEMPO = 10.0
+
+def motorGreedy(n, aristas, tiempo):
+    colores = coloreoGreedy(n, listaAdyacencia(n, aristas))
+    return "feasible", cantidadColores(colores), colores
+
+def motorFormulacion(nombre):
+    def motor(n, aristas, tiempo):
+        from portafolio import FORMULACIONES, normalizarColores
+
+        # El greedy acota la cantidad de colores del modelo
+        k_greedy = cantidadColores(coloreoGreedy(n, listaAdyacencia(n, aristas)))
+        opciones = {"limites": {"tiempo": tiempo}}
+        if nombre != "representantes":
+            opciones["max_colors"] = k_greedy
+        colores, _, k, status = FORMULACIONES[nombre](n, aristas, **opciones)
+        if colores is None:
+            return status, None, None
+        return status, k, normalizarColores(n, colores)
+    return motor
+
+def motorTabu(n, aristas, tiempo):
+    from busqueda_tabu import coloreoTabu
+
+    colores, k = coloreoTabu(n, listaAdyacencia(n, aristas), tiempo_limite=tiempo)
+    return "feasible", k, colores
+
+def motorPortafolio(n, aristas, tiempo):
+    from portafolio import resolverPortafolio
+    k, colores, status = resolverPortafolio(n, aristas, tiempo_limite=tiempo)
+    return status, k, colores
+
+MOTORES = {
+    "greedy": motorGreedy,
+    "tradicional": motorFormulacion("tradicional"),
+    "conjestables": motorFormulacion("conjestables"),
+    "representantes": motorFormulacion("representantes"),
+    "tabu": motorTabu,
+    "portafolio": motorPortafolio,
+}
+
+def listarInstancias(entradas):
+    """Expande directorios y globs a la lista ordenada de archivos .col/.col.b."""
+    archivos = set()
+    for entrada in entradas:
+        if os.path.isdir(entrada):
+            candidatos = glob.glob(os.path.join(entrada, "*.col")) + glob.glob(os.path.join(entrada, "*.col.b"))
+        else:
+            candidatos = glob.glob(entrada)
+        archivos.update(c for c in candidatos if c.endswith(".col") or c.endswith(".col.b"))
+    return sorted(archivos)
+
+def leerManifiesto(path):
+    """Devuelve el set de (instancia, motor) ya resueltos en el manifiesto."""
+    hechos = set()
+    if not os.path.exists(path):
+        return hechos
+    with open(path, "r") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                registro = json.loads(line)
+            except json.JSONDecodeError:
+                # Línea truncada por una interrupción: se vuelve a correr
+                continue
+            hechos.add((registro["instancia"], registro["motor"]))
+    return hechos
+
+def ejecutarTrabajo(instancia, motor, tiempo, memoria_mb, salida_dir, conexion, cache_dir=None):
+    """
+    Cuerpo de cada proceso del pool: resuelve una instancia y envía el resultado.
+    Con cache_dir, una configuración ya resuelta (o un óptimo probado por
+    cualquier motor) se devuelve sin volver a resolver.
+    """
+    # Grupo de procesos propio: al vencer el tiempo se mata el trabajo junto
+    # con los procesos que haya lanzado (p.ej. los trabajadores del portafolio)
+    os.setpgrp()
+    if memoria_mb is not None:
+        limite = int(memoria_mb * 1024 * 1024)
+        resource.setrlimit(resource.RLIMIT_AS, (limite, limite))
+
+    inicio = time.perf_counter()
+    resultado = {"instancia": instancia, "motor": motor}
+    try:
+        n, aristas = leerGrafo(instancia)
+        registro = None
+        if cache_dir is not None:
+            cache = CacheResultados(cache_dir)
+            hash_grafo = hashGrafo(n, aristas)
+            registro = cache.buscar(n, aristas, motor, {"tiempo": tiempo}, hash_grafo=hash_grafo)
+            mejor = cache.mejorConocido(n, aristas, hash_grafo=hash_grafo)
+            if (registro is None or registro["coloreo"] is None) and mejor is not None and mejor["status"] == "optimal":
+                registro = mejor
+        if registro is not None and registro["coloreo"] is not None:
+            status, k, colores = registro["status"], registro["k"], registro["coloreo"]
+            resultado["cache"] = True
+        else:
+            status, k, colores = MOTORES[motor](n, aristas, tiempo)
+            if cache_dir is not None:
+                cache.guardar(n, aristas, motor, {"tiempo": tiempo}, status=status, colores=colores,
+                              tiempo=time.perf_counter() - inicio, hash_grafo=hash_grafo)
+        resultado.update({"status": status, "k": k, "n": n, "m": len(aristas)})
+        if colores is not None:
+            verificacion = verificarColoreo(n, aristas, colores)
+            resultado["valido"] = verificacion["valido"]
+            if not verificacion["valido"]:
+                resultado.update({"status": "error", "error": f"coloreo inválido ({verificacion['conflictos']} "
+                                  f"conflictos, {verificacion['sin_color']} sin color)"})
+                colores = None
+            elif verificacion["k"] != k:
+                resultado["k"] = k = verificacion["k"]
+        if colores is not None and salida_dir is not None:
+            nombre = os.path.basename(instancia) + f".{motor}.sol"
+            path = os.path.join(salida_dir, nombre)
+            with open(path, "w") as f:
+                f.write(f"s {status} {k}\n")
+                for v in range(n):
+                    f.write(f"v {v} {colores[v]}\n")
+            resultado["coloreo"] = path
+    except MemoryError:
+        resultado["status"] = "memout"
+    except Exception as e:
+        resultado["status"] = "error"
+        resultado["error"] = repr(e)
+    resultado["tiempo"] = time.perf_counter() - inicio
+    conexion.send(resultado)
+    conexion.close()
+
+def terminarGrupo(p):
+    """Termina el proceso del trabajo y todo su grupo de procesos."""
+    try:
+        os.killpg(p.pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        # Todavía no creó su grupo (o ya terminó): solo el proceso
+        p.terminate()
+
+def ejecutarLote(instancias, motor, procesos, tiempo, memoria_mb, manifiesto, salida_dir, cache_dir=None):
+    """Planifica los trabajos en a lo sumo `procesos` procesos simultáneos."""
+    hechos = leerManifiesto(manifiesto)
+    pendientes = [i for i in instancias if (i, motor) not in hechos]
+    print(f"c {len(instancias)} instancias, {len(instancias) - len(pendientes)} ya resueltas, {len(pendientes)} pendientes")
+    if salida_dir is not None:
+        os.makedirs(salida_dir, exist_ok=True)
+
+    corriendo = {}  # conexión -> (proceso, instancia, inicio)
+    with open(manifiesto, "a") as f:
+
+        def registrar(resultado):
+            f.write(json.dumps(resultado) + "\n")
+            f.flush()
+            desde_cache = " [cache]" if resultado.get("cache") else ""
+            print(f"c {resultado['instancia']}: {resultado['status']} k={resultado.get('k')} ({resultado['tiempo']:.2f}s){desde_cache}")
+
+        try:
+            while pendientes or corriendo:
+                while pendientes and len(corriendo) < procesos:
+                    instancia = pendientes.pop(0)
+                    recibir, enviar = mp.Pipe(duplex=False)
+                    p = mp.Process(target=ejecutarTrabajo, args=(instancia, motor, tiempo, memoria_mb, salida_dir, enviar, cache_dir))
+                    p.start()
+                    enviar.close()
+                    corriendo[recibir] = (p, instancia, time.perf_counter())
+
+                for conexion in wait(list(corriendo), timeout=0.5):
+                    p, instancia, inicio = corriendo.pop(conexion)
+                    try:
+                        resultado = conexion.recv()
+                    except EOFError:
+                        # El proceso terminó sin enviar resultado (por ejemplo, lo mató el sistema)
+                        resultado = {"instancia": instancia, "motor": motor, "status": "error",
+                                     "tiempo": time.perf_counter() - inicio}
+                    p.join()
+                    registrar(resultado)
+
+                # Trabajos que excedieron el tiempo límite
+                if tiempo is not None:
+                    ahora = time.perf_counter()
+                    for conexion, (p, instancia, inicio) in list(corriendo.items()):
+                        if ahora - inicio > tiempo + MARGEN_TIEMPO:
+                            terminarGrupo(p)
+                            p.join()
+                            del corriendo[conexion]
+                            registrar({"instancia": instancia, "motor": motor, "status": "timeout",
+                                       "tiempo": ahora - inicio})
+        except KeyboardInterrupt:
+            # Los trabajos tienen su propio grupo y no reciben el Ctrl-C
+            for p, _, _ in corriendo.values():
+                terminarGrupo(p)
+            raise
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolución por lotes de instancias DIMACS")
+    parser.add_argument("entradas", nargs="+", help="Directorios o globs de archivos .col/.col.b")
+    parser.add_argument("--motor", choices=sorted(MOTORES), default="conjestables")
+    parser.add_argument("--procesos", "-j", type=int, default=os.cpu_count(), help="Cantidad máxima de trabajos simultáneos")
+    parser.add_argument("--tiempo", type=float, default=None, help="Tiempo límite por trabajo en segundos")
+    parser.add_argument("--memoria", type=float, default=None, help="Memoria límite por trabajo en MB")
+    parser.add_argument("--manifiesto", default="manifiesto.jsonl", help="Archivo JSONL con los resultados")
+    parser.add_argument("--salida", default=None, help="Directorio donde guardar los coloreos")
+    parser.add_argument("--cache", nargs="?", const=DIRECTORIO_CACHE, default=None,
+                        help="Directorio de la cache de resultados (por defecto .cache_coloreo)")
+    args = parser.parse_args()
+
+    instancias = listarInstancias(args.entradas)
+    ejecutarLote(instancias, args.motor, max(1, args.procesos), args.tiempo, args.memoria,
+                 args.manifiesto, args.salida, args.cache)
+
+if __name__ == "__main__":
+    main()
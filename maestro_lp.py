@@ -0,0 +1,359 @@
+"""
+Problema maestro restringido de la generación de columnas para coloreo:
+    min sum_S x_S   s.a.   sum_{S : v en S} x_S >= 1  para todo v,   x >= 0
+Es un LP de cubrimiento puro. Se ofrecen dos implementaciones con la misma
+interfaz, elegibles con crearMaestro(nombre):
+    simplex  simplex primal revisado en Python con la inversa de la base
+             explícita; agregar una columna es O(1) y el siguiente resolver()
+             arranca desde la base anterior. Es el maestro por defecto
+    scip     pyscipopt con presolve, propagación, separación, heurísticas y
+             cutoff del LP apagados
+
+Filas y columnas se identifican por el vértice y por una clave elegida por el
+llamador. Cada fila nace junto con su columna singleton, así que el maestro
+siempre es factible. Los duales que devuelve duales() cumplen dualidad fuerte
+(son no negativos y suman el valor del LP); si SCIP no los da así, se vuelve
+a resolver y, si siguen mal, se lanza DualesInvalidos.
+"""
+
+# Tolerancia (relativa al valor del LP) al validar los duales
+TOLERANCIA_DUALES = 1e-6
+
+class DualesInvalidos(RuntimeError):
+    """El solver devolvió duales que no cumplen dualidad fuerte."""
+
+def dualesConsistentes(duales, valor, tolerancia=TOLERANCIA_DUALES):
+    """True si los duales son no negativos y suman el valor del LP."""
+    tol = tolerancia * max(1.0, abs(valor))
+    return all(pi >= -tol for pi in duales.values()) and abs(sum(duales.values()) - valor) <= tol
+
+class MaestroSCIP:
+    """Maestro sobre un Model de SCIP que solo resuelve la relajación lineal."""
+
+    def __init__(self):
+        from pyscipopt import Model, SCIP_PARAMSETTING
+
+        self.model = Model("FractionalColoring_LP")
+        # Desactivar Presolving para evitar que modifique la estructura del problema
+        self.model.setPresolve(0)
+        self.model.setParam("presolving/maxrounds", 0)
+        self.model.setParam("presolving/maxrestarts", 0)
+        # Desactivar Propagación: Evita que SCIP fije variables "obvias"
+        # y elimine las restricciones asociadas, lo cual causa el error de duales NULL.
+        self.model.setParam("propagating/maxrounds", 0)
+        self.model.setParam("propagating/maxroundsroot", 0)
+        self.model.setParam("separating/maxrounds", 0)
+        self.model.setParam("separating/maxroundsroot", 0)
+        self.model.setParam("lp/presolving", False)
+        # Sin cutoff en el LP: al liberar la transformación SCIP conserva la
+        # solución anterior y, si el LP nuevo vale lo mismo, corta el LP en el
+        # límite de objetivo sin dejar la solución dual (duales todos en 0)
+        self.model.setParam("lp/disablecutoff", 1)
+        self.model.setHeuristics(SCIP_PARAMSETTING.OFF)
+        self.model.hideOutput()
+
+        self.conss = {}
+        self.vars = {}
+        self.transformado = False
+        self.objetivo = 0.0
+
+    def _editar(self):
+        """SCIP solo deja modificar el problema después de liberar la transformación."""
+        if self.transformado:
+            self.model.freeTransform()
+            self.transformado = False
+
+    def agregarFila(self, v, clave):
+        self._editar()
+        # Al no poner cota superior estricta de 1.0, evitamos que el propagador
+        # detecte la solución trivial inmediata y elimine la restricción.
+        var = self.model.addVar(name=f"S_{clave}", vtype="C", lb=0.0, ub=None, obj=1.0)
+        # modifiable=True es vital para poder agregar coeficientes luego
+        self.conss[v] = self.model.addCons(var >= 1, name=f"cover_{v}", separate=False,
+                                           modifiable=True, removable=False)
+        self.vars[clave] = var
+
+    def quitarFila(self, v):
+        self._editar()
+        self.model.delCons(self.conss.pop(v))
+
+    def agregarColumna(self, clave, vertices):
+        self._editar()
+        var = self.model.addVar(name=f"S_{clave}", vtype="C", lb=0.0, ub=None, obj=1.0)
+        self.vars[clave] = var
+        for v in vertices:
+            self.model.addConsCoeff(self.conss[v], var, 1.0)
+
+    def quitarColumna(self, clave, vertices):
+        self._editar()
+        var = self.vars.pop(clave)
+        for v in vertices:
+            if v in self.conss:
+                self.model.delCoefLinear(self.conss[v], var)
+        self.model.delVar(var)
+
+    def agregarCoeficiente(self, v, clave):
+        self._editar()
+        self.model.addConsCoeff(self.conss[v], self.vars[clave], 1.0)
+
+    def quitarCoeficiente(self, v, clave):
+        self._editar()
+        self.model.delCoefLinear(self.conss[v], self.vars[clave])
+
+    def resolver(self):
+        self.model.optimize()
+        self.transformado = True
+        self.objetivo = self.model.getObjVal()
+        return self.objetivo
+
+    def _leerDuales(self):
+        duales = {}
+        for v, cons in self.conss.items():
+            # Con la propagación desactivada y la restricción 'modifiable',
+            # SCIP mantiene la fila en el LP y se puede leer su dual.
+            pi = self.model.getDualsolLinear(cons)
+            duales[v] = 0.0 if pi > 1e15 else pi
+        return duales
+
+    def duales(self):
+        # getLPSolstat no se puede consultar una vez terminado el solve: el
+        # estado del modelo dice si el LP de la raíz llegó al óptimo
+        if self.model.getStatus() != "optimal":
+            raise DualesInvalidos(f"SCIP terminó con estado {self.model.getStatus()}")
+        duales = self._leerDuales()
+        if not dualesConsistentes(duales, self.objetivo):
+            # A veces SCIP no deja la solución dual del último LP (p.ej. todos
+            # los duales en 0): se resuelve de nuevo desde el problema original
+            self._editar()
+            self.resolver()
+            duales = self._leerDuales()
+            if not dualesConsistentes(duales, self.objetivo):
+                raise DualesInvalidos(f"Los duales de SCIP suman {sum(duales.values()):.6f} "
+                                      f"y el LP vale {self.objetivo:.6f}")
+        return duales
+
+    def valores(self):
+        return {clave: self.model.getVal(var) for clave, var in self.vars.items()}
+
+# Tipos de variable del simplex: columna del llamador, artificial e_v (costo
+# 1, equivale al singleton {v}) y holgura -e_v (costo 0)
+COLUMNA, ARTIFICIAL, HOLGURA = 0, 1, 2
+
+# Valores menores se tratan como cero en la actualización de la inversa
+CERO = 1e-13
+
+class MaestroSimplex:
+    """
+    Simplex primal revisado para el LP de cubrimiento. La base inicial son
+    las artificiales e_v (la base de columnas singleton, factible con x = 1);
+    agregar columnas no la cambia, así que cada resolver() sigue pivoteando
+    desde la base óptima anterior. Una columna básica en 0 se saca con un
+    pivote degenerado; cambiar o sacar una columna básica positiva, o sacar
+    una fila, reinicia la base.
+    """
+
+    # Pivotes degenerados seguidos antes de pasar a la regla de Bland
+    MAX_DEGENERADOS = 50
+    # Cada cuántos pivotes se recalculan x_B y pi desde la inversa
+    RECALCULAR = 100
+    # Pivote mínimo del test del cociente: pivotear en elementos más chicos
+    # hace explotar la inversa explícita
+    PIVOTE_MIN = 1e-7
+
+    def __init__(self, tolerancia=1e-9):
+        self.tol = tolerancia
+        self.indice = {}      # vértice -> fila
+        self.columnas = {}    # clave -> set de vértices
+        self.orden = {}       # variable -> número (regla de Bland)
+        self.base = []        # variable básica de cada fila
+        self.invB = []        # filas de B^{-1}
+        self.xB = []
+        self.pi = []
+        self.reiniciar = True
+        self.pivotes = 0
+
+    def _numerar(self, var):
+        self.orden.setdefault(var, len(self.orden))
+
+    def agregarFila(self, v, clave):
+        m = len(self.indice)
+        self.indice[v] = m
+        self.columnas[clave] = {v}
+        self._numerar((COLUMNA, clave))
+        self._numerar((ARTIFICIAL, v))
+        self._numerar((HOLGURA, v))
+        if not self.reiniciar:
+            # La fila nueva solo la cubre su singleton: la base crece en bloque
+            for fila in self.invB:
+                fila.append(0.0)
+            self.invB.append([0.0] * m + [1.0])
+            self.base.append((COLUMNA, clave))
+            self.xB.append(1.0)
+            self.pi.append(1.0)
+
+    def quitarFila(self, v):
+        del self.indice[v]
+        self.indice = {u: i for i, u in enumerate(self.indice)}
+        for vertices in self.columnas.values():
+            vertices.discard(v)
+        self.reiniciar = True
+
+    def agregarColumna(self, clave, vertices):
+        self.columnas[clave] = set(vertices)
+        self._numerar((COLUMNA, clave))
+
+    def quitarColumna(self, clave, vertices=None):
+        if not self.reiniciar and (COLUMNA, clave) in self.base:
+            self._sacarDeBase(self.base.index((COLUMNA, clave)))
+        del self.columnas[clave]
+
+    def agregarCoeficiente(self, v, clave):
+        self.columnas[clave].add(v)
+        if (COLUMNA, clave) in self.base:
+            self.reiniciar = True
+
+    def quitarCoeficiente(self, v, clave):
+        self.columnas[clave].discard(v)
+        if (COLUMNA, clave) in self.base:
+            self.reiniciar = True
+
+    def _sacarDeBase(self, r):
+        """
+        Saca la variable básica de la fila r. Si vale 0 (lo usual con las
+        columnas que retira el envejecimiento) se hace un pivote degenerado
+        con una artificial y la base sigue siendo óptima o casi; si no, se
+        reinicia la base.
+        """
+        if self.xB[r] > self.tol:
+            self.reiniciar = True
+            return
+        fila_r = self.invB[r]
+        j = max(range(len(fila_r)), key=lambda j: abs(fila_r[j]))
+        v = next(u for u, i in self.indice.items() if i == j)
+        alpha = [fila[j] for fila in self.invB]
+        self._pivotear(r, (ARTIFICIAL, v), alpha, 1.0 - self.pi[j])
+
+    def _pivotear(self, r, q, alpha, rc):
+        """Entra q por la básica de la fila r: actualiza B^{-1}, x_B y pi."""
+        m = len(self.base)
+        piv = alpha[r]
+        theta = max(0.0, self.xB[r]) / piv
+        fila_r = [x / piv for x in self.invB[r]]
+        self.invB[r] = fila_r
+        # La fila r de B^{-1} suele ser rala: solo se actualizan sus no ceros
+        no_ceros = [(j, y) for j, y in enumerate(fila_r) if abs(y) > CERO]
+        for i in range(m):
+            a = alpha[i]
+            if i != r and abs(a) > CERO:
+                fila = self.invB[i]
+                for j, y in no_ceros:
+                    fila[j] -= a * y
+                self.xB[i] -= a * theta
+        self.xB[r] = theta
+        self.pi = [p + rc * y for p, y in zip(self.pi, fila_r)]
+        self.base[r] = q
+
+        self.pivotes += 1
+        if self.pivotes % self.RECALCULAR == 0:
+            self._recalcular()
+
+    def _crash(self):
+        """Base de artificiales: B = I, x_B = 1, pi = 1."""
+        m = len(self.indice)
+        self.base = [(ARTIFICIAL, v) for v in self.indice]
+        self.invB = [[0.0] * m for _ in range(m)]
+        for i in range(m):
+            self.invB[i][i] = 1.0
+        self.xB = [1.0] * m
+        self.pi = [1.0] * m
+        self.reiniciar = False
+
+    def _costo(self, var):
+        return 0.0 if var[0] == HOLGURA else 1.0
+
+    def _vector(self, var):
+        """Columna de la variable como lista de (fila, coeficiente)."""
+        tipo, ident = var
+        if tipo == COLUMNA:
+            indice = self.indice
+            return [(indice[v], 1.0) for v in self.columnas[ident]]
+        return [(self.indice[ident], 1.0 if tipo == ARTIFICIAL else -1.0)]
+
+    def _recalcular(self):
+        """x_B = B^{-1} 1 y pi = c_B B^{-1}, para no acumular error de redondeo."""
+        m = len(self.base)
+        self.xB = [sum(fila) for fila in self.invB]
+        costos = [self._costo(var) for var in self.base]
+        self.pi = [sum(costos[i] * self.invB[i][j] for i in range(m) if costos[i]) for j in range(m)]
+
+    def _entrante(self, bland):
+        """Variable no básica de costo reducido negativo (Dantzig, o Bland si hay ciclos)."""
+        pi, tol, indice = self.pi, self.tol, self.indice
+        en_base = set(self.base)
+        candidatas = [((COLUMNA, c), 1.0 - sum(pi[indice[v]] for v in vertices))
+                      for c, vertices in self.columnas.items()]
+        candidatas += [((ARTIFICIAL, v), 1.0 - pi[i]) for v, i in indice.items()]
+        candidatas += [((HOLGURA, v), pi[i]) for v, i in indice.items()]
+        candidatas = [(var, rc) for var, rc in candidatas if rc < -tol and var not in en_base]
+        if not candidatas:
+            return None, 0.0
+        if bland:
+            return min(candidatas, key=lambda c: self.orden[c[0]])
+        return min(candidatas, key=lambda c: c[1])
+
+    def resolver(self, max_pivotes=1000000):
+        if self.reiniciar:
+            self._crash()
+        degenerados = 0
+        bland = False
+        for _ in range(max_pivotes):
+            # Una vez en Bland se sigue en Bland: un paso apenas no degenerado
+            # por redondeo no debe volver a Dantzig y reabrir el ciclo
+            bland = bland or degenerados > self.MAX_DEGENERADOS
+            q, rc = self._entrante(bland)
+            if q is None:
+                break
+            m = len(self.base)
+            vector = self._vector(q)
+            alpha = [sum(coef * fila[j] for j, coef in vector) for fila in self.invB]
+
+            # Test del cociente. Empates: el pivote más grande (el más estable
+            # numéricamente) o, con Bland, la básica de menor número
+            r, theta = None, None
+            for i in range(m):
+                if alpha[i] > self.PIVOTE_MIN:
+                    t = max(0.0, self.xB[i]) / alpha[i]
+                    if theta is None or t < theta - self.tol:
+                        r, theta = i, t
+                    elif t <= theta + self.tol:
+                        if (self.orden[self.base[i]] < self.orden[self.base[r]] if bland
+                                else alpha[i] > alpha[r]):
+                            r, theta = i, t
+            if r is None:
+                raise RuntimeError("Maestro no acotado: no debería pasar con costos no negativos")
+            degenerados = degenerados + 1 if theta <= self.tol else 0
+            self._pivotear(r, q, alpha, rc)
+        else:
+            raise RuntimeError(f"El simplex no terminó en {max_pivotes} pivotes")
+        self._recalcular()
+        return sum(self._costo(var) * x for var, x in zip(self.base, self.xB))
+
+    def duales(self):
+        return {v: max(0.0, self.pi[i]) for v, i in self.indice.items()}
+
+    def valores(self):
+        valores = dict.fromkeys(self.columnas, 0.0)
+        for (tipo, ident), x in zip(self.base, self.xB):
+            if tipo == COLUMNA:
+                valores[ident] = max(0.0, x)
+        return valores
+
+MAESTROS = {
+    "scip": MaestroSCIP,
+    "simplex": MaestroSimplex,
+}
+
+def crearMaestro(nombre="simplex"):
+    if nombre not in MAESTROS:
+        raise ValueError(f"Maestro desconocido: {nombre} (opciones: {', '.join(MAESTROS)})")
+    return MAESTROS[nombre]()
@@ -0,0 +1,223 @@
+"""
+Adyacencia sobre una matriz de bits empaquetada y mapeada en memoria (mmap).
+Cada fila ocupa ceil(n/8) bytes y el bit j de la fila i (byte j>>3, bit j&7)
+indica la arista (i, j). La matriz es simétrica para que cada fila sea el
+conjunto de vecinos completo. Para n = 10.000 son 12,5 MB, contra varios
+cientos de MB de los diccionarios de sets.
+
+AdyacenciaBits adapta la matriz a la interfaz {v: set(vecinos)} que usan las
+heurísticas y mwssRecursion, de modo que corren sin cambios.
+"""
+import mmap
+import os
+import struct
+import tempfile
+from array import array
+from collections.abc import Mapping, Set
+
+from dimacs import iterarAristas, leerCabeceraBinario
+
+# Cabecera del archivo: identificador y cantidad de vértices
+FIRMA = b'MATBITS1'
+CABECERA = struct.Struct('<8sQ')
+
+def bitsAIndices(bits):
+    """Índices de los bits prendidos de un entero, en orden creciente."""
+    if not bits:
+        return []
+    cadena = bin(bits)[:1:-1]
+    indices = []
+    j = cadena.find('1')
+    while j != -1:
+        indices.append(j)
+        j = cadena.find('1', j + 1)
+    return indices
+
+class MatrizBits:
+    """Matriz de adyacencia n x n de bits sobre un archivo mapeado en memoria."""
+
+    def __init__(self, path, escritura=False):
+        self.path = path
+        self.archivo = open(path, 'r+b' if escritura else 'rb')
+        acceso = mmap.ACCESS_WRITE if escritura else mmap.ACCESS_READ
+        self.mm = mmap.mmap(self.archivo.fileno(), 0, access=acceso)
+        firma, self.n = CABECERA.unpack_from(self.mm, 0)
+        if firma != FIRMA:
+            raise ValueError(f"{path} no es una matriz de bits")
+        self.bytes_fila = (self.n + 7) // 8
+        self.inicio = CABECERA.size
+        self._grados = None
+
+    @classmethod
+    def crear(cls, path, n):
+        """Crea el archivo con la matriz vacía y lo abre para escritura."""
+        bytes_fila = (n + 7) // 8
+        with open(path, 'wb') as f:
+            f.write(CABECERA.pack(FIRMA, n))
+            f.truncate(CABECERA.size + n * bytes_fila)
+        return cls(path, escritura=True)
+
+    @classmethod
+    def desdeAristas(cls, n, aristas, path=None):
+        """Arma la matriz a partir de un iterable de aristas 0-indexadas."""
+        temporal = path is None
+        if temporal:
+            fd, path = tempfile.mkstemp(suffix='.bits')
+            os.close(fd)
+        matriz = cls.crear(path, n)
+        if temporal:
+            # El mapeo sigue siendo válido después de borrar el archivo
+            os.remove(path)
+        for u, v in aristas:
+            matriz.agregarArista(u, v)
+        matriz.mm.flush()
+        return matriz
+
+    @classmethod
+    def desdeDimacs(cls, entrada, path=None):
+        """
+        Arma la matriz leyendo un .col o .col.b sin construir la lista de
+        aristas: el .col se recorre por bloques y el .col.b fila por fila.
+        Sin path, la matriz vive en un archivo temporal que se borra enseguida.
+        """
+        temporal = path is None
+        if temporal:
+            fd, path = tempfile.mkstemp(suffix='.bits')
+            os.close(fd)
+        if not str(entrada).endswith('.b'):
+            n = None
+            with open(entrada, 'r', encoding='latin-1') as f:
+                for line in f:
+                    parts = line.split()
+                    if parts and parts[0] == 'p' and len(parts) >= 4:
+                        n = int(parts[2])
+                        break
+            if n is None:
+                raise ValueError("No se encontró la línea 'p edge N M'.")
+            if temporal:
+                os.remove(path)
+                path = None
+            return cls.desdeAristas(n, iterarAristas(entrada), path)
+
+        with open(entrada, 'rb') as f:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            n, _, _, pos = leerCabeceraBinario(data)
+            matriz = cls.crear(path, n)
+            if temporal:
+                os.remove(path)
+            for i in range(n):
+                nbytes = (i + 8) // 8
+                fila = int.from_bytes(data[pos:pos + nbytes], 'big')
+                pos += nbytes
+                if not fila:
+                    continue
+                # En el .col.b el primer bit de la fila es la columna 0
+                for b in bitsAIndices(fila):
+                    j = nbytes * 8 - 1 - b
+                    if j < i:
+                        matriz.agregarArista(i, j)
+            data.close()
+        matriz.mm.flush()
+        return matriz
+
+    def agregarArista(self, u, v):
+        if u == v:
+            return
+        mm, inicio, bytes_fila = self.mm, self.inicio, self.bytes_fila
+        mm[inicio + u * bytes_fila + (v >> 3)] |= 1 << (v & 7)
+        mm[inicio + v * bytes_fila + (u >> 3)] |= 1 << (u & 7)
+        self._grados = None
+
+    def adyacentes(self, u, v):
+        """True si (u, v) es arista. O(1): se lee un solo byte."""
+        return (self.mm[self.inicio + u * self.bytes_fila + (v >> 3)] >> (v & 7)) & 1 == 1
+
+    def fila(self, v):
+        """Vecinos de v como entero (bitset)."""
+        desde = self.inicio + v * self.bytes_fila
+        return int.from_bytes(self.mm[desde:desde + self.bytes_fila], 'little')
+
+    def vecinos(self, v):
+        return bitsAIndices(self.fila(v))
+
+    def interseccion(self, u, v):
+        """Vecinos comunes de u y v como bitset."""
+        return self.fila(u) & self.fila(v)
+
+    def grado(self, v):
+        if self._grados is None:
+            self._grados = array('i', (bin(self.fila(u)).count('1') for u in range(self.n)))
+        return self._grados[v]
+
+    def cantidadAristas(self):
+        return sum(self.grado(v) for v in range(self.n)) // 2
+
+    def cerrar(self):
+        self.mm.close()
+        self.archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+class FilaBits(Set):
+    """Vecinos de un vértice, vistos como set de solo lectura."""
+
+    def __init__(self, matriz, v, base):
+        self.matriz = matriz
+        self.v = v
+        self.base = base
+
+    @classmethod
+    def _from_iterable(cls, it):
+        # Las operaciones de conjuntos (|, &, -) devuelven sets comunes
+        return set(it)
+
+    def __contains__(self, u):
+        i = u - self.base
+        return 0 <= i < self.matriz.n and self.matriz.adyacentes(self.v, i)
+
+    def __iter__(self):
+        base = self.base
+        return (j + base for j in self.matriz.vecinos(self.v))
+
+    def __len__(self):
+        return self.matriz.grado(self.v)
+
+    def __and__(self, otro):
+        if isinstance(otro, FilaBits) and otro.matriz is self.matriz:
+            # Intersección directa de los bitsets
+            base = self.base
+            return {j + base for j in bitsAIndices(self.matriz.interseccion(self.v, otro.v))}
+        return {u for u in otro if u in self}
+
+    __rand__ = __and__
+
+class AdyacenciaBits(Mapping):
+    """
+    Diccionario {v: vecinos} de solo lectura sobre una MatrizBits. Con
+    base=1 reproduce la numeración de parserDimacs (vértices 1..n).
+    """
+
+    def __init__(self, matriz, base=1):
+        self.matriz = matriz
+        self.base = base
+
+    def __getitem__(self, v):
+        i = v - self.base
+        if not (isinstance(i, int) and 0 <= i < self.matriz.n):
+            raise KeyError(v)
+        return FilaBits(self.matriz, i, self.base)
+
+    def __iter__(self):
+        return iter(range(self.base, self.base + self.matriz.n))
+
+    def __len__(self):
+        return self.matriz.n
+
+def parserDimacsBits(path, destino=None):
+    """Equivalente a coloreoCG/parserDimacs sobre la matriz de bits: (n, m, adj)."""
+    matriz = MatrizBits.desdeDimacs(path, destino)
+    return matriz.n, matriz.cantidadAristas(), AdyacenciaBits(matriz)
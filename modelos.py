@@ -0,0 +1,96 @@
+"""
+Utilidades compartidas para construir los modelos de SCIP.
+Las restricciones se arman como expresiones con quicksum y se agregan en
+bloque con addConss, en lugar de una llamada a addCons por restricción.
+El módulo no importa pyscipopt: los event handlers están en eventos.py y se
+cargan recién al resolver.
+"""
+import resource
+import time
+
+def agregarRestricciones(model, conss):
+    """Agrega en bloque una lista (o generador) de restricciones al modelo."""
+    conss = list(conss)
+    if conss:
+        model.addConss(conss)
+    return len(conss)
+
+def picoMemoriaMB():
+    """Pico de memoria residente del proceso (MB)."""
+    # En Linux ru_maxrss está en KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0
+
+def estadisticasModelo(model):
+    """Cantidad de variables, filas y no ceros del modelo (antes de optimize)."""
+    conss = model.getConss()
+    nonzeros = 0
+    for cons in conss:
+        if cons.isLinear():
+            nonzeros += len(model.getValsLinear(cons))
+    return {
+        "variables": model.getNVars(),
+        "filas": len(conss),
+        "nonzeros": nonzeros,
+    }
+
+def reporteConstruccion(model, inicio, mostrar=True):
+    """
+    Arma el reporte de construcción del modelo: tiempo desde inicio,
+    filas, no ceros y pico de memoria. Se debe llamar antes de optimize().
+    """
+    reporte = estadisticasModelo(model)
+    reporte["tiempo_construccion"] = time.perf_counter() - inicio
+    reporte["pico_rss_mb"] = picoMemoriaMB()
+    if mostrar:
+        print(f"c Modelo {model.getProbName()}: {reporte['variables']} variables, "
+              f"{reporte['filas']} filas, {reporte['nonzeros']} no ceros")
+        print(f"c Construcción: {reporte['tiempo_construccion']:.3f}s, pico RSS: {reporte['pico_rss_mb']:.1f} MB")
+    return reporte
+
+def instalarManejador(model, manejadores, nombre, clase, callback, descripcion):
+    """
+    Incluye el event handler la primera vez; si el modelo ya lo tiene (se está
+    resolviendo de nuevo) solo se reemplaza el callback.
+    """
+    if nombre in manejadores:
+        manejadores[nombre].callback(callback)
+    elif callback is not None:
+        manejador = clase(callback)
+        model.includeEventhdlr(manejador, nombre, descripcion)
+        manejadores[nombre] = manejador
+
+def resolver(model, tiempo=None, gap=None, nodos=None, alMejorar=None, detener=None, manejadores=None):
+    """
+    Wrapper común de optimize() con límites de tiempo (s), gap relativo y nodos.
+    alMejorar(objetivo, segundos, gap) se invoca con cada nueva mejor solución.
+    detener() se consulta en cada nodo/LP: si devuelve True se interrumpe la resolución.
+    manejadores: diccionario donde se guardan los event handlers del modelo,
+    para poder volver a llamar a resolver() sobre el mismo modelo (SCIP
+    continúa desde donde cortó el límite anterior).
+    Devuelve el estado de SCIP normalizado: optimal, feasible, infeasible o unknown.
+    """
+    from eventos import EventoIncumbente, EventoDetener
+
+    if manejadores is None:
+        manejadores = {}
+    if tiempo is not None:
+        model.setParam("limits/time", tiempo)
+    if gap is not None:
+        model.setParam("limits/gap", gap)
+    if nodos is not None:
+        model.setParam("limits/nodes", nodos)
+    instalarManejador(model, manejadores, "incumbente", EventoIncumbente, alMejorar,
+                      "Reporta cada nueva mejor solución")
+    instalarManejador(model, manejadores, "detener", EventoDetener, detener,
+                      "Interrumpe la resolución a pedido")
+
+    model.optimize()
+
+    status = str(model.getStatus()).lower() if model.getStatus() is not None else ""
+    if 'optimal' in status:
+        return "optimal"
+    if 'infeasible' in status:
+        return "infeasible"
+    if model.getNSols() > 0:
+        return "feasible"
+    return "unknown"
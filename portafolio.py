@@ -0,0 +1,246 @@
+"""
+Portafolio paralelo: corre las tres formulaciones de coloreo.py, la
+generación de columnas y la búsqueda tabú en procesos separados sobre la
+misma instancia. Los procesos comparten el mejor k conocido: cada
+formulación agrega el corte sum y <= k-1 y, si otro proceso (típicamente la
+búsqueda tabú) mejora k, reinicia con el corte nuevo.
+Cuando un proceso prueba optimalidad se detienen todos.
+"""
+import argparse
+import math
+import multiprocessing as mp
+import queue
+import time
+
+from coloreo import parserDimacs, getColoreoTradicional, getColoreoConjEstables, getColoreoRepresentantes
+from coloreo_heuristico import coloreoGreedy, cantidadColores
+from grafos import listaAdyacencia
+
+# Tiempo (s) de la búsqueda tabú cuando el portafolio no tiene tiempo límite
+TIEMPO_TABU = 60.0
+
+FORMULACIONES = {
+    "tradicional": getColoreoTradicional,
+    "conjestables": getColoreoConjEstables,
+    "representantes": getColoreoRepresentantes,
+}
+
+def normalizarColores(n, colores):
+    """Renumera los colores (o representantes) de 0 a k-1."""
+    ids = {}
+    return [ids.setdefault(colores[v], len(ids)) for v in range(n)]
+
+def trabajadorFormulacion(nombre, n, aristas, k_max, mejor_k, candado, detener_todo, cola, tiempo_limite):
+    """Resuelve una formulación reiniciando con el corte cada vez que otro proceso mejora k."""
+    inicio = time.perf_counter()
+    # El "fin" se envía aunque la formulación lance una excepción
+    try:
+        formulacion = FORMULACIONES[nombre]
+
+        while not detener_todo.is_set():
+            cota = mejor_k.value - 1
+            if cota < 1:
+                break
+
+            def alMejorar(objetivo, segundos, gap):
+                k = round(objetivo)
+                with candado:
+                    if k < mejor_k.value:
+                        mejor_k.value = k
+                cola.put(("incumbente", nombre, k, time.perf_counter() - inicio))
+
+            def detener():
+                return detener_todo.is_set() or mejor_k.value - 1 < cota
+
+            limites = {}
+            if tiempo_limite is not None:
+                restante = tiempo_limite - (time.perf_counter() - inicio)
+                if restante <= 0:
+                    break
+                limites["tiempo"] = restante
+
+            opciones = {"limites": limites, "alMejorar": alMejorar, "cota": cota, "detener": detener}
+            if nombre != "representantes":
+                opciones["max_colors"] = k_max
+            colores, _, k, status = formulacion(n, aristas, **opciones)
+
+            # El coloreo se envía siempre: alMejorar ya pudo haber bajado mejor_k
+            # con él aunque otro proceso haya probado optimalidad mientras tanto
+            if colores is not None:
+                cola.put(("coloreo", nombre, k, normalizarColores(n, colores)))
+            if detener_todo.is_set():
+                break
+            if status == "optimal":
+                # El óptimo con el corte sum y <= cota es el óptimo del problema
+                cola.put(("optimo", nombre, k, time.perf_counter() - inicio))
+                break
+            if status == "infeasible":
+                # No existe coloreo con cota colores: el mejor k conocido es óptimo
+                cola.put(("optimo", nombre, cota + 1, time.perf_counter() - inicio))
+                break
+            if mejor_k.value - 1 < cota:
+                # Otro proceso mejoró k: reiniciamos con el corte nuevo
+                continue
+            # Límite de tiempo alcanzado
+            break
+    finally:
+        cola.put(("fin", nombre, None, time.perf_counter() - inicio))
+
+def trabajadorCG(n, aristas, cola):
+    """Generación de columnas (cota de la relajación lineal)."""
+    from coloreoCG import GraphColoringCG
+
+    inicio = time.perf_counter()
+    try:
+        adj = listaAdyacencia(n, aristas)
+        cg = GraphColoringCG({v+1: {u+1 for u in adj[v]} for v in range(n)})
+        valor = cg.solve()
+        cola.put(("lp", "cg", valor, time.perf_counter() - inicio))
+        # Coloreo entero sobre las columnas generadas
+        colores, k, _ = cg.integer_solution()
+        cola.put(("coloreo", "cg", k, [colores[v+1] for v in range(n)]))
+        # lower_bound es el LP si el pricing exacto lo probó, o la cota de Farley
+        if cg.lower_bound > 0:
+            cola.put(("cota", "cg", cg.lower_bound, time.perf_counter() - inicio))
+    finally:
+        cola.put(("fin", "cg", None, time.perf_counter() - inicio))
+
+def trabajadorTabu(n, aristas, mejor_k, candado, cola, tiempo_limite):
+    """Búsqueda tabú: cada k nuevo baja la cota superior que ven las formulaciones."""
+    from busqueda_tabu import coloreoTabu
+
+    inicio = time.perf_counter()
+
+    def alMejorar(k, colores, segundos):
+        with candado:
+            if k < mejor_k.value:
+                mejor_k.value = k
+        cola.put(("incumbente", "tabu", k, segundos))
+        cola.put(("coloreo", "tabu", k, list(colores)))
+
+    # Si otro proceso prueba el óptimo antes, el proceso se termina desde afuera
+    try:
+        coloreoTabu(n, listaAdyacencia(n, aristas), tiempo_limite=tiempo_limite if tiempo_limite is not None else TIEMPO_TABU,
+                    alMejorar=alMejorar)
+    finally:
+        cola.put(("fin", "tabu", None, time.perf_counter() - inicio))
+
+def resolverPortafolio(n, aristas, motores=None, tiempo_limite=None):
+    """
+    Lanza los motores pedidos en paralelo y devuelve (k, colores, status).
+    status es optimal si algún proceso probó optimalidad.
+    """
+    if motores is None:
+        motores = list(FORMULACIONES) + ["cg", "tabu"]
+
+    # Cota superior inicial con un coloreo greedy
+    adj = listaAdyacencia(n, aristas)
+    mejores_colores = coloreoGreedy(n, adj)
+    k_greedy = cantidadColores(mejores_colores)
+    print(f"c Greedy: {k_greedy} colores")
+
+    mejor_k = mp.Value('i', k_greedy)
+    candado = mp.Lock()
+    detener_todo = mp.Event()
+    cola = mp.Queue()
+
+    procesos = {}
+    for nombre in dict.fromkeys(motores):
+        if nombre == "cg":
+            p = mp.Process(target=trabajadorCG, args=(n, aristas, cola))
+        elif nombre == "tabu":
+            p = mp.Process(target=trabajadorTabu, args=(n, aristas, mejor_k, candado, cola, tiempo_limite))
+        else:
+            p = mp.Process(target=trabajadorFormulacion,
+                           args=(nombre, n, aristas, k_greedy, mejor_k, candado, detener_todo, cola, tiempo_limite))
+        p.start()
+        procesos[nombre] = p
+
+    k = k_greedy
+    k_probado = None
+    cota_inferior = 0
+    terminados = set()
+    inicio = time.perf_counter()
+    while len(terminados) < len(procesos):
+        if tiempo_limite is not None and time.perf_counter() - inicio > tiempo_limite + 5:
+            break
+        try:
+            tipo, nombre, valor, extra = cola.get(timeout=0.5)
+        except queue.Empty:
+            # Un proceso que murió sin enviar "fin" (p.ej. matado por el
+            # sistema) cuenta como terminado
+            for nombre, p in procesos.items():
+                if nombre not in terminados and p.exitcode is not None:
+                    print(f"c [{nombre}] terminó sin avisar (exitcode {p.exitcode})")
+                    terminados.add(nombre)
+            continue
+        if tipo == "incumbente":
+            print(f"c [{nombre}] k={valor} ({extra:.2f}s)")
+        elif tipo == "coloreo" and valor <= k:
+            k = valor
+            mejores_colores = extra
+        elif tipo == "lp":
+            print(f"c [{nombre}] valor LP = {valor:.4f} ({extra:.2f}s)")
+        elif tipo == "cota":
+            cota_inferior = max(cota_inferior, math.ceil(valor - 1e-6))
+            print(f"c [{nombre}] cota inferior = {cota_inferior} ({extra:.2f}s)")
+            if k <= cota_inferior:
+                print(f"c [{nombre}] la cota prueba optimalidad de k={k}")
+                k_probado = k
+                detener_todo.set()
+                break
+        elif tipo == "optimo":
+            print(f"c [{nombre}] probó optimalidad con k={valor} ({extra:.2f}s)")
+            k_probado = valor
+            detener_todo.set()
+            break
+        elif tipo == "fin":
+            terminados.add(nombre)
+
+    detener_todo.set()
+    for p in procesos.values():
+        p.join(timeout=2)
+        if p.is_alive():
+            p.terminate()
+            p.join()
+
+    # Vaciamos los mensajes pendientes por si llegó un coloreo mejor
+    while True:
+        try:
+            tipo, nombre, valor, extra = cola.get_nowait()
+        except (queue.Empty, EOFError, OSError):
+            break
+        if tipo == "coloreo" and valor <= k:
+            k = valor
+            mejores_colores = extra
+
+    k = cantidadColores(mejores_colores)
+    if k <= cota_inferior:
+        k_probado = k
+    status = "optimal" if k_probado is not None and k <= k_probado else "feasible"
+    return k, mejores_colores, status
+
+def main():
+    parser = argparse.ArgumentParser(description="Portafolio paralelo de formulaciones de coloreo")
+    parser.add_argument("input", help="Grafo en formato DIMACS")
+    parser.add_argument("--motores", default="tradicional,conjestables,representantes,cg,tabu",
+                        help="Motores a lanzar separados por coma")
+    parser.add_argument("--tiempo", type=float, default=None, help="Tiempo límite en segundos")
+    parser.add_argument("--out", "-o", default=None, help="Fichero adicional para guardar la salida (opcional)")
+    args = parser.parse_args()
+
+    n, aristas = parserDimacs(args.input)
+    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+
+    k, colores, status = resolverPortafolio(n, aristas, motores=args.motores.split(","), tiempo_limite=args.tiempo)
+
+    salida = f"s {status} {k}\n"
+    print(salida, end="")
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(salida)
+            for v in range(n):
+                f.write(f"v {v} {colores[v]}\n")
+
+if __name__ == "__main__":
+    main()
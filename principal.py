@@ -0,0 +1,233 @@
+"""
+Punto de entrada único con subcomandos:
+    decodificar (decode)        .col.b -> .col y viceversa
+    estadisticas (parse-stats)  n, m, densidad, grados y tiempo de lectura
+    heuristicas (heuristics)    coloreo greedy y cota de clique, sin SCIP
+    resolver (solve)            formulaciones de coloreo.py o el portafolio
+    cg                          generación de columnas (coloreoCG.py)
+    tabu                        búsqueda tabú TabuCol / PartialCol (busqueda_tabu.py)
+    verificar (verify)          verificar un archivo de salida y post-optimizarlo
+Cada subcomando importa su motor recién cuando se ejecuta, así que los que no
+usan SCIP no pagan el import de pyscipopt.
+"""
+import argparse
+import time
+
+def cmdDecodificar(args):
+    from convertir import convertir
+
+    for entrada in args.entradas:
+        salida = convertir(entrada, args.out)
+        print(f"{entrada} -> {salida}")
+
+def cmdEstadisticas(args):
+    from dimacs import leerGrafo
+
+    inicio = time.perf_counter()
+    n, aristas = leerGrafo(args.input)
+    lectura = time.perf_counter() - inicio
+
+    grados = [0] * n
+    for u, v in aristas:
+        grados[u] += 1
+        grados[v] += 1
+    m = len(aristas)
+    densidad = 2 * m / (n * (n - 1)) if n > 1 else 0.0
+    print(f"Vertices: {n}, Aristas: {m}, Densidad: {densidad:.4f}")
+    if n:
+        print(f"Grado mínimo: {min(grados)}, máximo: {max(grados)}, promedio: {2 * m / n:.2f}")
+    print(f"Lectura: {lectura:.3f}s")
+
+def cmdHeuristicas(args):
+    from dimacs import leerGrafo
+    from grafos import listaAdyacencia
+    from coloreo_heuristico import coloreoGreedy, cantidadColores
+    from clique_bnb import cliqueMaximaBits
+    from verificacion import reducirColores
+
+    n, aristas = leerGrafo(args.input)
+    adj = listaAdyacencia(n, aristas)
+    colores = coloreoGreedy(n, adj)
+    clique, optimo = cliqueMaximaBits(n, aristas, tiempo_limite=args.tiempo)
+    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+    print(f"Greedy: {cantidadColores(colores)} colores")
+    print(f"Clique: {len(clique)}{'' if optimo else ' (no probada máxima)'}")
+    if args.post is not None:
+        colores = reducirColores(n, adj, colores, tiempo_limite=args.post, cota_inferior=len(clique))
+        print(f"Post-optimización: {cantidadColores(colores)} colores")
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(f"s feasible {cantidadColores(colores)}\n")
+            for v in range(n):
+                f.write(f"v {v} {colores[v]}\n")
+
+def cmdResolver(args):
+    from dimacs import leerGrafo
+
+    n, aristas = leerGrafo(args.input)
+    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+    if args.motor == "portafolio":
+        from portafolio import resolverPortafolio
+
+        k, colores, status = resolverPortafolio(n, aristas, tiempo_limite=args.tiempo)
+    else:
+        from portafolio import FORMULACIONES, normalizarColores
+        from grafos import listaAdyacencia
+        from coloreo_heuristico import coloreoGreedy, coloreoDSATUR, cantidadColores
+
+        opciones = {"limites": {"tiempo": args.tiempo, "gap": args.gap}}
+        if args.motor != "representantes":
+            # Cota superior de colores del modelo (sin ella tradicional usa 10)
+            adj = listaAdyacencia(n, aristas)
+            opciones["max_colors"] = min(cantidadColores(coloreoGreedy(n, adj)), cantidadColores(coloreoDSATUR(n, adj)))
+        colores, _, k, status = FORMULACIONES[args.motor](n, aristas, **opciones)
+        if colores is not None:
+            colores = normalizarColores(n, colores)
+
+    if colores is not None:
+        from verificacion import verificarColoreo, reporteVerificacion
+
+        verificacion = verificarColoreo(n, aristas, colores)
+        print(reporteVerificacion(verificacion, k))
+        if not verificacion["valido"]:
+            colores, status = None, "unknown"
+        k = verificacion["k"]
+    if colores is None:
+        salida = "s unsatisfiable\n" if status == "infeasible" else "s unknown\n"
+    else:
+        salida = f"s {status} {k}\n"
+    print(salida, end="")
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(salida)
+            for v in range(n if colores else 0):
+                f.write(f"v {v} {colores[v]}\n")
+
+def cmdCG(args):
+    from dimacs import leerGrafo
+    from coloreoCG import GraphColoringCG
+    from verificacion import verificarColoreo, reporteVerificacion
+
+    n, aristas = leerGrafo(args.input)
+    adj = {v: set() for v in range(1, n + 1)}
+    for u, v in aristas:
+        if u != v:
+            adj[u + 1].add(v + 1)
+            adj[v + 1].add(u + 1)
+    cg = GraphColoringCG(adj, tiempo_pricing=args.tiempo_pricing, maestro=args.maestro)
+    valor = cg.solve(max_iter=args.iteraciones)
+    print(f"Valor LP: {valor}")
+    print(f"Cota inferior: {cg.lower_bound:.4f}{'' if cg.bound_proven else ' (LP no probado)'}")
+    colores, k, metodo = cg.integer_solution(tiempo_limite=args.tiempo_ip)
+    print(f"Coloreo entero: {k} colores ({metodo})")
+    verificacion = verificarColoreo(n, aristas, [colores[v + 1] for v in range(n)])
+    print(reporteVerificacion(verificacion, k))
+    if args.out:
+        with open(args.out, "w") as f:
+            f.write(f"s feasible {k}\n")
+            for v in range(n):
+                f.write(f"v {v} {colores[v + 1]}\n")
+
+def cmdTabu(args):
+    from dimacs import leerGrafo
+    from grafos import listaAdyacencia
+    from busqueda_tabu import coloreoTabu
+    from verificacion import verificarColoreo, reporteVerificacion, escribirSalida
+
+    n, aristas = leerGrafo(args.input)
+    print(f"Vertices: {n}, Aristas: {len(aristas)}")
+
+    def alMejorar(k, colores, segundos):
+        print(f"c incumbente k={k} t={segundos:.3f}")
+
+    colores, k = coloreoTabu(n, listaAdyacencia(n, aristas), tiempo_limite=args.tiempo, semilla=args.semilla,
+                             metodo=args.metodo, alMejorar=alMejorar)
+    print(reporteVerificacion(verificarColoreo(n, aristas, colores), k))
+    print(f"s feasible {k}")
+    if args.out:
+        escribirSalida(args.out, "feasible", colores)
+
+def cmdVerificar(args):
+    from dimacs import leerGrafo
+    from grafos import listaAdyacencia
+    from verificacion import leerSalida, escribirSalida, verificarColoreo, reporteVerificacion, reducirColores
+
+    n, aristas = leerGrafo(args.input)
+    try:
+        status, k, colores = leerSalida(args.salida, n, args.base)
+    except ValueError as e:
+        raise SystemExit(f"c ERROR: {e}; indicar --base 0 o --base 1")
+    verificacion = verificarColoreo(n, aristas, colores)
+    print(reporteVerificacion(verificacion, k))
+    if not verificacion["valido"]:
+        raise SystemExit(1)
+    if args.post is not None:
+        colores = reducirColores(n, listaAdyacencia(n, aristas), colores, tiempo_limite=args.post, semilla=args.semilla)
+        k = max(colores, default=-1) + 1
+        print(f"Post-optimización: {verificacion['k']} -> {k} colores")
+    # Coloreo verificado (post-optimizado si se pidió --post)
+    if args.out:
+        escribirSalida(args.out, "optimal" if status == "optimal" else "feasible", colores)
+
+def construirParser():
+    parser = argparse.ArgumentParser(description="Herramientas de coloreo de grafos")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("decodificar", aliases=["decode"], help="Convertir entre .col y .col.b")
+    p.add_argument("entradas", nargs="+")
+    p.add_argument("--out", "-o", default=None)
+    p.set_defaults(funcion=cmdDecodificar)
+
+    p = sub.add_parser("estadisticas", aliases=["parse-stats"], help="Leer el grafo e informar tamaño y grados")
+    p.add_argument("input")
+    p.set_defaults(funcion=cmdEstadisticas)
+
+    p = sub.add_parser("heuristicas", aliases=["heuristics"], help="Coloreo greedy y cota de clique")
+    p.add_argument("input")
+    p.add_argument("--tiempo", type=float, default=1.0, help="Tiempo límite de la búsqueda de clique")
+    p.add_argument("--post", type=float, default=None, help="Segundos de post-optimización del greedy")
+    p.add_argument("--out", "-o", default=None)
+    p.set_defaults(funcion=cmdHeuristicas)
+
+    p = sub.add_parser("resolver", aliases=["solve"], help="Resolver con una formulación de SCIP")
+    p.add_argument("input")
+    p.add_argument("--motor", choices=["tradicional", "conjestables", "representantes", "portafolio"], default="conjestables")
+    p.add_argument("--tiempo", type=float, default=None)
+    p.add_argument("--gap", type=float, default=None)
+    p.add_argument("--out", "-o", default=None)
+    p.set_defaults(funcion=cmdResolver)
+
+    p = sub.add_parser("cg", help="Generación de columnas")
+    p.add_argument("input")
+    p.add_argument("--iteraciones", type=int, default=100)
+    p.add_argument("--tiempo-pricing", type=float, default=None, help="Tiempo límite de cada MWSS exacto")
+    p.add_argument("--maestro", choices=["simplex", "scip"], default="simplex", help="Implementación del LP maestro")
+    p.add_argument("--tiempo-ip", type=float, default=10.0, help="Tiempo límite del cubrimiento entero final")
+    p.add_argument("--out", "-o", default=None)
+    p.set_defaults(funcion=cmdCG)
+
+    p = sub.add_parser("tabu", help="Coloreo por búsqueda tabú (cota superior rápida)")
+    p.add_argument("input")
+    p.add_argument("--metodo", choices=["tabucol", "partialcol"], default="tabucol")
+    p.add_argument("--tiempo", type=float, default=10.0)
+    p.add_argument("--semilla", type=int, default=0)
+    p.add_argument("--out", "-o", default=None)
+    p.set_defaults(funcion=cmdTabu)
+
+    p = sub.add_parser("verificar", aliases=["verify"], help="Verificar un coloreo y opcionalmente reducir sus colores")
+    p.add_argument("input", help="Grafo")
+    p.add_argument("salida", help="Archivo con las líneas s/v del coloreo")
+    p.add_argument("--post", type=float, default=None, help="Segundos de post-optimización (Kempe y greedy iterado)")
+    p.add_argument("--semilla", type=int, default=0)
+    p.add_argument("--out", "-o", default=None)
+    p.add_argument("--base", type=int, choices=(0, 1), default=None,
+                   help="Numeración de los vértices del archivo (por defecto se deduce)")
+    p.set_defaults(funcion=cmdVerificar)
+    return parser
+
+def main():
+    args = construirParser().parse_args()
+    args.funcion(args)
+
+if __name__ == "__main__":
+    main()
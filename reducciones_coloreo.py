@@ -0,0 +1,110 @@
+"""
+Preprocesamiento para coloreo. Se eliminan repetidamente:
+    - vértices de grado menor que una cota inferior (clique) del número cromático
+    - vértices dominados por un vértice no adyacente (N(v) ⊆ N(u))
+El núcleo que queda se resuelve por separado y los vértices eliminados se
+colorean después, en orden inverso a su eliminación.
+Los vértices se numeran de 0 a n-1 y adj[v] es el set de vecinos de v.
+"""
+from clique_bnb import cliqueMaximaBits
+
+def cotaInferiorClique(n, adj, tiempo_limite=1.0):
+    """Tamaño de una clique grande (máxima si alcanza el tiempo)."""
+    aristas = [(u, v) for u in range(n) for v in adj[u] if u < v]
+    clique, _ = cliqueMaximaBits(n, aristas, tiempo_limite=tiempo_limite)
+    return len(clique)
+
+def reducirColoreo(n, adj, cota_inferior=None):
+    """
+    Devuelve (nucleo, pila, cota_inferior): nucleo es la lista de vértices que
+    quedan y pila las eliminaciones en orden, ("grado", v) o ("dominado", v, u).
+    """
+    if cota_inferior is None:
+        cota_inferior = cotaInferiorClique(n, adj)
+
+    activos = set(range(n))
+    vecinos = [set(adj[v]) for v in range(n)]
+    pila = []
+    pendientes = set(range(n))
+
+    def eliminar(v):
+        activos.discard(v)
+        for u in vecinos[v]:
+            vecinos[u].discard(v)
+            pendientes.add(u)
+            # Los vértices que compartían vecinos con u pueden quedar dominados
+            pendientes.update(vecinos[u])
+
+    while pendientes:
+        v = pendientes.pop()
+        if v not in activos:
+            continue
+        grado = len(vecinos[v])
+
+        # Grado menor que la cota: siempre hay un color libre para v
+        if grado < cota_inferior:
+            pila.append(("grado", v))
+            eliminar(v)
+            continue
+
+        # Dominado por un vértice no adyacente: v puede usar el color de u
+        if not vecinos[v]:
+            continue
+        x = min(vecinos[v], key=lambda w: len(vecinos[w]))
+        dominante = None
+        for u in vecinos[x]:
+            if u != v and u not in vecinos[v] and len(vecinos[u]) >= grado and vecinos[v] <= vecinos[u]:
+                dominante = u
+                break
+        if dominante is not None:
+            pila.append(("dominado", v, dominante))
+            eliminar(v)
+
+    return sorted(activos), pila, cota_inferior
+
+def extenderColoreo(colores, pila, adj):
+    """
+    Colorea los vértices eliminados deshaciendo la pila en orden inverso.
+    colores: diccionario vértice -> color con el coloreo del núcleo. Los
+    colores se renumeran de 0 a k-1 para que la extensión no agregue colores.
+    """
+    ids = {}
+    colores = {v: ids.setdefault(c, len(ids)) for v, c in colores.items()}
+    for op in reversed(pila):
+        if op[0] == "grado":
+            v = op[1]
+            usados = {colores[u] for u in adj[v] if u in colores}
+            c = 0
+            while c in usados:
+                c += 1
+            colores[v] = c
+        else:
+            _, v, u = op
+            colores[v] = colores[u]
+    return colores
+
+def subgrafoNucleo(nucleo, adj):
+    """Renumera el núcleo de 0 a k-1 y devuelve (k, aristas)."""
+    indice = {v: i for i, v in enumerate(nucleo)}
+    aristas = [(indice[u], indice[v]) for u in nucleo for v in adj[u] if v in indice and indice[u] < indice[v]]
+    return len(nucleo), aristas
+
+def colorearConReduccion(n, adj, resolverNucleo, cota_inferior=None):
+    """
+    Reduce el grafo, resuelve el núcleo con resolverNucleo(k, aristas), que
+    devuelve la lista (o diccionario) de colores del núcleo, y extiende el
+    coloreo al grafo completo. Devuelve (colores, nucleo, cota_inferior).
+    """
+    nucleo, pila, cota_inferior = reducirColoreo(n, adj, cota_inferior)
+    print(f"c Reducción: núcleo de {len(nucleo)}/{n} vértices (cota clique = {cota_inferior})")
+
+    coloresNucleo = {}
+    if nucleo:
+        k, aristas = subgrafoNucleo(nucleo, adj)
+        resultado = resolverNucleo(k, aristas)
+        if resultado is None:
+            return None, nucleo, cota_inferior
+        coloresNucleo = {v: resultado[i] for i, v in enumerate(nucleo)}
+
+    colores = extenderColoreo(coloresNucleo, pila, adj)
+    return [colores[v] for v in range(n)], nucleo, cota_inferior
@@ -0,0 +1,147 @@
+"""
+Reducciones exactas para conjunto independiente máximo (con pesos).
+Se aplican hasta que no haya cambios y se obtiene un kernel más chico:
+    - vértices aislados y vértices que pesan al menos tanto como su vecindario
+    - vértices colgantes (grado 1), plegando el peso sobre el vecino
+    - plegado de vértices de grado 2
+    - dominación
+    - gemelos (vértices no adyacentes con el mismo vecindario)
+Cada operación queda registrada en una pila para luego levantar la
+solución del kernel a una solución del grafo original.
+Sin pesos (todos 1) las reglas coinciden con las reducciones clásicas.
+"""
+
+EPS = 1e-9
+
+def reducirMIS(adj, pesos=None):
+    """
+    adj: diccionario vértice -> set de vecinos (no se modifica).
+    pesos: diccionario vértice -> peso positivo (por defecto 1).
+    Devuelve (adjKernel, pesosKernel, offset, pila), donde offset es el peso
+    ya asegurado por las reducciones.
+    """
+    adj = {v: set(vecinos) for v, vecinos in adj.items()}
+    if pesos is None:
+        pesos = {v: 1.0 for v in adj}
+    else:
+        pesos = {v: float(pesos[v]) for v in adj}
+
+    pila = []
+    offset = 0.0
+    siguiente_id = max((v for v in adj if isinstance(v, int)), default=-1) + 1
+    pendientes = set(adj)
+
+    def eliminar(v):
+        for u in adj[v]:
+            adj[u].discard(v)
+            pendientes.add(u)
+        del adj[v]
+        del pesos[v]
+        pendientes.discard(v)
+
+    def incluir(v):
+        # v entra a la solución y se eliminan él y sus vecinos
+        nonlocal offset
+        offset += pesos[v]
+        pila.append(("incluir", v))
+        for u in list(adj[v]):
+            eliminar(u)
+        eliminar(v)
+
+    while pendientes:
+        v = pendientes.pop()
+        if v not in adj:
+            continue
+        vecinos = adj[v]
+        grado = len(vecinos)
+
+        # Aislado o más pesado que todo su vecindario
+        if pesos[v] >= sum(pesos[u] for u in vecinos) - EPS:
+            incluir(v)
+            continue
+
+        # Colgante: v con un único vecino u más pesado
+        if grado == 1:
+            u = next(iter(vecinos))
+            offset += pesos[v]
+            pesos[u] -= pesos[v]
+            pila.append(("colgante", v, u))
+            eliminar(v)
+            pendientes.add(u)
+            continue
+
+        # Plegado de grado 2: N(v) = {a, b} no adyacentes
+        if grado == 2:
+            a, b = vecinos
+            if b not in adj[a] and pesos[v] >= max(pesos[a], pesos[b]) - EPS:
+                nuevo = siguiente_id
+                siguiente_id += 1
+                vecindario = (adj[a] | adj[b]) - {v, a, b}
+                peso_nuevo = pesos[a] + pesos[b] - pesos[v]
+                offset += pesos[v]
+                pila.append(("pliegue", v, a, b, nuevo))
+                eliminar(v)
+                eliminar(a)
+                eliminar(b)
+                adj[nuevo] = vecindario
+                pesos[nuevo] = peso_nuevo
+                for u in vecindario:
+                    adj[u].add(nuevo)
+                pendientes.add(nuevo)
+                continue
+
+        # Dominación: u adyacente a v con N[v] ⊆ N[u] y peso(u) <= peso(v)
+        cerrado_v = vecinos | {v}
+        dominado = None
+        for u in vecinos:
+            if len(adj[u]) >= grado and pesos[u] <= pesos[v] + EPS and cerrado_v <= (adj[u] | {u}):
+                dominado = u
+                break
+        if dominado is not None:
+            eliminar(dominado)
+            pendientes.add(v)
+            continue
+
+        # Gemelos: u no adyacente con N(u) = N(v), se fusiona u dentro de v
+        if grado > 0:
+            x = min(vecinos, key=lambda w: len(adj[w]))
+            gemelo = None
+            for u in adj[x]:
+                if u != v and len(adj[u]) == grado and adj[u] == vecinos:
+                    gemelo = u
+                    break
+            if gemelo is not None:
+                pesos[v] += pesos[gemelo]
+                pila.append(("gemelo", v, gemelo))
+                eliminar(gemelo)
+                pendientes.add(v)
+                continue
+
+    return adj, pesos, offset, pila
+
+def levantarSolucion(solucion, pila):
+    """
+    Convierte una solución del kernel en una solución del grafo original
+    deshaciendo las operaciones de la pila en orden inverso.
+    """
+    S = set(solucion)
+    for op in reversed(pila):
+        if op[0] == "incluir":
+            S.add(op[1])
+        elif op[0] == "colgante":
+            _, v, u = op
+            if u not in S:
+                S.add(v)
+        elif op[0] == "pliegue":
+            _, v, a, b, nuevo = op
+            if nuevo in S:
+                S.discard(nuevo)
+                S.add(a)
+                S.add(b)
+            else:
+                S.add(v)
+        elif op[0] == "gemelo":
+            _, v, gemelo = op
+            if v in S:
+                S.add(gemelo)
+    return S
@@ -0,0 +1,257 @@
+"""
+Verificación de coloreos y post-optimización.
+    verificarColoreo  revisa todas las aristas contra el vector de colores de
+                      una sola pasada (map/compress, sin un bucle Python por
+                      arista): conflictos, vértices sin color y k real
+    reducirColores    intenta eliminar clases de color: mueve cada vértice de
+                      la clase más chica a otra clase, directamente o
+                      intercambiando una cadena de Kempe, y alterna con
+                      greedy iterado (Culberson), que nunca aumenta k
+Uso: python verificacion.py grafo salida [--post SEGUNDOS] [--out archivo] [--base 0|1]
+donde salida tiene las líneas "s ..." y "v <vértice> <color>" que escriben
+coloreo.py, coloringCG.py, lote.py y principal.py (numeración 0 o 1; si no
+se puede deducir hay que indicarla con --base).
+"""
+import argparse
+import random
+import time
+from itertools import compress
+from operator import eq
+
+from coloreo_heuristico import coloreoGreedy
+
+# Conflictos que se listan como máximo en el reporte
+MAX_CONFLICTOS = 10
+
+def verificarColoreo(n, aristas, colores):
+    """
+    Verifica un coloreo de los vértices 0..n-1.
+    :param aristas: Lista de pares (u, v) o ListaAristas de dimacs
+    :param colores: Color de cada vértice (None o negativo = sin color)
+    Devuelve {"valido", "k", "conflictos", "sin_color", "ejemplos"}:
+    conflictos es la cantidad de aristas monocromáticas (sin contar lazos),
+    ejemplos las primeras de ellas y k la cantidad de colores distintos usados.
+    """
+    colores = list(colores)
+    sin_color = [v for v, c in enumerate(colores) if c is None or c < 0]
+    if len(colores) < n:
+        sin_color.extend(range(len(colores), n))
+        colores.extend([None] * (n - len(colores)))
+
+    if hasattr(aristas, "origen"):
+        origen, destino = aristas.origen, aristas.destino
+    elif len(aristas):
+        origen, destino = zip(*aristas)
+    else:
+        origen, destino = (), ()
+    color = colores.__getitem__
+    iguales = map(eq, map(color, origen), map(color, destino))
+    conflictos = [(u, v) for u, v in compress(zip(origen, destino), iguales)
+                  if u != v and colores[u] is not None and colores[u] >= 0]
+
+    k = len({c for c in colores if c is not None and c >= 0})
+    return {"valido": not conflictos and not sin_color, "k": k,
+            "conflictos": len(conflictos), "sin_color": len(sin_color),
+            "ejemplos": conflictos[:MAX_CONFLICTOS]}
+
+def reporteVerificacion(verificacion, k_informado=None):
+    """Línea de comentario "c ..." con el resultado de verificarColoreo."""
+    if verificacion["valido"]:
+        linea = f"c verificado: coloreo válido con {verificacion['k']} colores"
+    else:
+        linea = (f"c ERROR: coloreo inválido ({verificacion['conflictos']} aristas monocromáticas, "
+                 f"{verificacion['sin_color']} vértices sin color, ej. {verificacion['ejemplos'][:3]})")
+    if k_informado is not None and k_informado != verificacion["k"]:
+        linea += f" (k informado {k_informado})"
+    return linea
+
+def leerSalida(path, n=None, base=None):
+    """
+    Lee un archivo de salida con líneas "s <status> [k]" y "v <vértice> <color>".
+    :param n: Cantidad de vértices del grafo (por defecto, las líneas v)
+    :param base: Numeración de los vértices, 0 o 1. None = deducirla: 0 si
+        aparece el vértice 0 y 1 si aparece el vértice n. Si no aparece
+        ninguno de los dos (falta un vértice en un extremo) la numeración es
+        ambigua y se lanza ValueError en lugar de adivinar
+    Devuelve (status, k informado, lista de colores 0..n-1).
+    """
+    status, k = None, None
+    asignados = {}
+    with open(path) as f:
+        for linea in f:
+            partes = linea.split()
+            if not partes:
+                continue
+            if partes[0] == "s":
+                status = partes[1] if len(partes) > 1 else None
+                k = int(partes[2]) if len(partes) > 2 else None
+            elif partes[0] == "v":
+                asignados[int(partes[1])] = int(partes[2])
+    if n is None:
+        n = len(asignados)
+    if base is None and asignados:
+        con_cero, con_n = 0 in asignados, n in asignados
+        if con_cero == con_n:
+            raise ValueError(f"{path}: no se puede deducir si los vértices se numeran desde 0 o desde 1 "
+                             f"(vértices {min(asignados)}..{max(asignados)} con n={n})")
+        base = 0 if con_cero else 1
+    colores = [asignados.get(v + (base or 0)) for v in range(n)]
+    return status, k, colores
+
+def escribirSalida(path, status, colores):
+    """Escribe la línea s y las líneas v (vértices 0..n-1) de un coloreo."""
+    k = max(colores, default=-1) + 1
+    with open(path, "w") as f:
+        f.write(f"s {status} {k}\n")
+        for v, c in enumerate(colores):
+            f.write(f"v {v} {c}\n")
+
+def normalizar(colores):
+    """Renumera los colores a 0..k-1 respetando el orden de aparición."""
+    nuevos = {}
+    return [nuevos.setdefault(c, len(nuevos)) for c in colores]
+
+def cadenaKempe(adj, colores, inicio, a, b):
+    """Componente conexa del subgrafo de colores {a, b} que contiene a los vértices de inicio."""
+    cadena = set(inicio)
+    pila = list(inicio)
+    while pila:
+        v = pila.pop()
+        for u in adj[v]:
+            if u not in cadena and (colores[u] == a or colores[u] == b):
+                cadena.add(u)
+                pila.append(u)
+    return cadena
+
+def moverVertice(adj, colores, v, clases):
+    """
+    Mueve v a otra de las clases dadas. Primero directo a una clase sin
+    vecinos; si no hay, elige clases a, b tales que la cadena de Kempe a/b
+    que arranca en los vecinos de v de color a no toque vecinos de color b,
+    la intercambia y v toma el color a. True si pudo mover v.
+    """
+    vecinos = [colores[u] for u in adj[v]]
+    usados = set(vecinos)
+    for c in clases:
+        if c not in usados:
+            colores[v] = c
+            return True
+    for a in clases:
+        inicio = [u for u in adj[v] if colores[u] == a]
+        for b in clases:
+            if b == a:
+                continue
+            cadena = cadenaKempe(adj, colores, inicio, a, b)
+            if any(colores[u] == b and u in cadena for u in adj[v]):
+                continue
+            for u in cadena:
+                colores[u] = b if colores[u] == a else a
+            colores[v] = a
+            return True
+    return False
+
+def eliminarClase(adj, colores, clase):
+    """
+    Intenta vaciar la clase de color dada moviendo sus vértices con
+    moverVertice. Devuelve el coloreo nuevo o None si algún vértice no se
+    pudo mover (colores no se modifica).
+    """
+    nuevo = list(colores)
+    clases = sorted(set(colores) - {clase})
+    for v in [v for v, c in enumerate(colores) if c == clase]:
+        if not moverVertice(adj, nuevo, v, clases):
+            return None
+    return nuevo
+
+def greedyIterado(n, adj, colores, rng):
+    """
+    Un paso de greedy iterado: first-fit recorriendo los vértices agrupados
+    por clase, con las clases en orden inverso, por tamaño decreciente o al
+    azar. Con ese orden el greedy nunca usa más colores que el coloreo dado.
+    """
+    clases = {}
+    for v, c in enumerate(colores):
+        clases.setdefault(c, []).append(v)
+    orden_clases = list(clases)
+    criterio = rng.randrange(3)
+    if criterio == 0:
+        orden_clases.reverse()
+    elif criterio == 1:
+        orden_clases.sort(key=lambda c: len(clases[c]), reverse=True)
+    else:
+        rng.shuffle(orden_clases)
+    return coloreoGreedy(n, adj, [v for c in orden_clases for v in clases[c]])
+
+def reducirColores(n, adj, colores, tiempo_limite=1.0, semilla=0, cota_inferior=0):
+    """
+    Post-optimización de un coloreo válido.
+    :param adj: Lista de sets de vecinos (vértices 0..n-1)
+    :param colores: Coloreo válido (lista de colores por vértice)
+    :param tiempo_limite: Segundos de búsqueda
+    :param cota_inferior: Si se alcanza este k se corta (p.ej. una clique)
+    Devuelve el mejor coloreo encontrado, con colores 0..k-1.
+    """
+    rng = random.Random(semilla)
+    mejor = normalizar(colores)
+    k = max(mejor, default=-1) + 1
+    fin = time.perf_counter() + tiempo_limite
+    fallidas = set()
+    while k > cota_inferior and time.perf_counter() < fin:
+        tamanos = {}
+        for c in mejor:
+            tamanos[c] = tamanos.get(c, 0) + 1
+        candidatas = sorted((c for c in tamanos if c not in fallidas), key=tamanos.get)
+        nuevo = None
+        if candidatas:
+            clase = candidatas[0]
+            nuevo = eliminarClase(adj, mejor, clase)
+            if nuevo is None:
+                fallidas.add(clase)
+        if nuevo is None:
+            # Ninguna clase se pudo vaciar directamente: greedy iterado
+            nuevo = greedyIterado(n, adj, mejor, rng)
+            if not candidatas:
+                fallidas = set()
+        nuevo = normalizar(nuevo)
+        k_nuevo = max(nuevo, default=-1) + 1
+        if k_nuevo < k:
+            fallidas = set()
+        if k_nuevo <= k:
+            mejor, k = nuevo, k_nuevo
+    return mejor
+
+def main():
+    from dimacs import leerGrafo
+    from grafos import listaAdyacencia
+
+    parser = argparse.ArgumentParser(description="Verificar (y mejorar) un coloreo")
+    parser.add_argument("grafo", help="Grafo en formato DIMACS (.col o .col.b)")
+    parser.add_argument("salida", help="Archivo con las líneas s/v del coloreo")
+    parser.add_argument("--post", type=float, default=None, help="Segundos de post-optimización (Kempe y greedy iterado)")
+    parser.add_argument("--semilla", type=int, default=0)
+    parser.add_argument("--out", "-o", default=None, help="Archivo donde guardar el coloreo verificado (post-optimizado si hay --post)")
+    parser.add_argument("--base", type=int, choices=(0, 1), default=None,
+                        help="Numeración de los vértices del archivo (por defecto se deduce)")
+    args = parser.parse_args()
+
+    n, aristas = leerGrafo(args.grafo)
+    inicio = time.perf_counter()
+    try:
+        status, k, colores = leerSalida(args.salida, n, args.base)
+    except ValueError as e:
+        raise SystemExit(f"c ERROR: {e}; indicar --base 0 o --base 1")
+    verificacion = verificarColoreo(n, aristas, colores)
+    print(reporteVerificacion(verificacion, k))
+    print(f"c verificación: {time.perf_counter() - inicio:.3f}s ({len(aristas)} aristas)")
+    if not verificacion["valido"]:
+        raise SystemExit(1)
+
+    if args.post is not None:
+        colores = reducirColores(n, listaAdyacencia(n, aristas), colores, args.post, args.semilla)
+        k_post = max(colores, default=-1) + 1
+        print(f"c post-optimización: {verificacion['k']} -> {k_post} colores")
+    if args.out:
+        escribirSalida(args.out, "optimal" if status == "optimal" else "feasible", colores)
+
+if __name__ == "__main__":
+    main()